@@ -24,9 +24,21 @@ class NautobotSSOTPluginConfig(PluginConfig):
     min_version = "1.0.3"
     max_version = "1.9999"
     default_settings = {
+        "approximate_log_counts": False,
+        "diff_cache": "nautobot_ssot",
         "hide_example_jobs": False,
     }
     caching_config = {}
 
+    def ready(self):
+        """Discard the cached diff fragments of each Sync when it's deleted."""
+        super().ready()
+
+        from django.db.models.signals import post_delete  # pylint: disable=import-outside-toplevel
+        from .diff_cache import invalidate_deleted_sync  # pylint: disable=import-outside-toplevel
+        from .models import Sync  # pylint: disable=import-outside-toplevel
+
+        post_delete.connect(invalidate_deleted_sync, sender=Sync)
+
 
 config = NautobotSSOTPluginConfig  # pylint:disable=invalid-name
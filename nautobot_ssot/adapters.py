@@ -0,0 +1,210 @@
+"""Reusable helpers and DiffSync adapter base classes for loading data efficiently."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+
+from diffsync import DiffSync
+from diffsync.enum import DiffSyncFlags
+
+from nautobot_ssot.bulk_writer import NautobotBulkWriter
+
+
+def load_queryset(adapter, model_name, queryset, lookups=None, chunk_size=2000):
+    """Load records of the given model type into a DiffSync adapter from a Django queryset, in a single query.
+
+    The fields of each record are its DiffSyncModel's `_identifiers` and `_attributes`, plus any other fields named
+    in `lookups`. Rather than instantiating each Django model instance and following its foreign keys one query
+    at a time, only the required columns are selected, with `values()`, joining any related tables in the same query,
+    and the rows are streamed from the database in chunks with `iterator()`.
+
+    By default, each field is read from the column of the same name; `lookups` maps any other fields to either:
+
+    - an ORM lookup, such as `"parent__name"`, or
+    - a tuple of ORM lookups followed by a function to compute the field from their values, such as
+      `("tenant__slug", lambda slug: slug or "")`.
+
+    Args:
+        adapter (DiffSync): Adapter to add the records to.
+        model_name (str): DiffSyncModel type of the records, as an attribute of the adapter.
+        queryset (QuerySet): Django queryset of the objects to load.
+        lookups (dict): Mapping of field name to ORM lookup, or to a tuple of ORM lookups and a function.
+        chunk_size (int): Number of rows to fetch from the database at a time.
+
+    Returns:
+        int: Number of records loaded.
+    """
+    model_class = getattr(adapter, model_name)
+    lookups = lookups or {}
+    # pylint: disable=protected-access
+    fields = list(dict.fromkeys([*model_class._identifiers, *model_class._attributes, *lookups]))
+    getters = {}
+    for field in fields:
+        lookup = lookups.get(field, field)
+        if isinstance(lookup, str):
+            getters[field] = (lookup,), None
+        else:
+            getters[field] = tuple(lookup[:-1]), lookup[-1]
+    columns = list(dict.fromkeys(column for field_columns, _ in getters.values() for column in field_columns))
+
+    count = 0
+    for row in queryset.values(*columns).iterator(chunk_size=chunk_size):
+        values = {}
+        for field, (field_columns, function) in getters.items():
+            values[field] = function(*(row[column] for column in field_columns)) if function else row[field_columns[0]]
+        adapter.add(model_class(**values))
+        count += 1
+    return count
+
+
+class AsyncRestAdapter(DiffSync):
+    """DiffSync adapter base class that loads records from several REST API list endpoints concurrently.
+
+    Subclasses declare the endpoint from which records of each model type are loaded in `endpoints`, and implement
+    `load_record()` to build and add a DiffSyncModel from each record returned. All pages of all endpoints are then
+    fetched at the same time, up to `max_concurrency` requests at once, using an asyncio event loop, and each page's
+    records are loaded as soon as it arrives. `load()` itself is synchronous, so this can be called as usual from a
+    Job's `load_source_adapter()` or `load_target_adapter()`.
+
+    The event loop runs in a thread of its own, and only fetches pages, making HTTP requests through a
+    `nautobot_ssot.rest_client.RestClient`, whose blocking calls are run in a pool of worker threads. `load_record()`
+    is called in the thread that called `load()`, outside of any event loop, so it may use the Django ORM (such as
+    through the Job's logging methods), with the same database connection as the rest of the Job. At most
+    `max_concurrency` pages are held while waiting to be loaded, and if `load_record()` raises an exception, no
+    further pages are requested, and the event loop's thread has finished by the time `load()` re-raises it.
+    """
+
+    # Mapping of model type to the path of the REST API list endpoint that its records are loaded from
+    endpoints = {}
+
+    def __init__(self, *args, client=None, max_concurrency=8, **kwargs):
+        """Instantiate this class, but do not load data immediately from the remote system.
+
+        Args:
+            client (RestClient): Client for the REST API to load records from.
+            max_concurrency (int): Maximum number of API requests to have in progress at once.
+        """
+        super().__init__(*args, **kwargs)
+        self.client = client
+        self.max_concurrency = max_concurrency
+
+    def load_record(self, model_name, entry):
+        """Build a DiffSyncModel of the given type from a single record returned by the REST API, and add it."""
+        raise NotImplementedError
+
+    def load(self, params=None):
+        """Load records of all model types in `endpoints` from the REST API.
+
+        Args:
+            params (dict): Additional query parameters, such as filters, to include in every request.
+        """
+        # Bounded, so that the event loop is held back while load_record() catches up
+        pages = queue.Queue(maxsize=self.max_concurrency)
+        stopped = threading.Event()
+
+        def on_page(model_name, records):
+            pages.put((model_name, records))
+            if stopped.is_set():
+                raise RuntimeError("Loading was stopped")
+
+        def fetch_all_pages():
+            try:
+                asyncio.run(self.fetch_pages(params, on_page))
+            except Exception as exc:  # pylint: disable=broad-except
+                pages.put(exc)
+            else:
+                pages.put(None)
+
+        thread = threading.Thread(target=fetch_all_pages, name="ssot-async-load", daemon=True)
+        thread.start()
+        try:
+            while True:
+                page = pages.get()
+                if page is None:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                model_name, records = page
+                for entry in records:
+                    self.load_record(model_name, entry)
+        except BaseException:
+            # Stop the event loop from fetching any more pages, unblocking it until its thread has finished
+            stopped.set()
+            while thread.is_alive():
+                try:
+                    pages.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            thread.join()
+            raise
+
+    async def fetch_pages(self, params, on_page):
+        """Fetch all pages of all endpoints in `endpoints` from the REST API, as a coroutine.
+
+        Args:
+            params (dict): Additional query parameters, such as filters, to include in every request.
+            on_page (callable): Function `(model_name, records)` called with the records of each page as it arrives,
+                in the event loop's thread.
+        """
+        params = params or {}
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="ssot-async-load") as executor:
+
+            async def fetch(model_name, path, page_params):
+                async with semaphore:
+                    page = await loop.run_in_executor(executor, self.client.get, path, page_params)
+                return model_name, path, page_params, page
+
+            first_pages = [
+                fetch(model_name, path, {**params, "limit": self.client.page_size, "offset": 0})
+                for model_name, path in self.endpoints.items()
+            ]
+            pending = {asyncio.ensure_future(first_page) for first_page in first_pages}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    model_name, path, page_params, page = task.result()
+                    if page_params["offset"] == 0 and page.get("next") and page["results"]:
+                        # Now that the total count is known, request all remaining pages of this endpoint at once
+                        page_size = len(page["results"])
+                        pending.update(
+                            asyncio.ensure_future(
+                                fetch(model_name, path, {**page_params, "limit": page_size, "offset": offset})
+                            )
+                            for offset in range(page_size, page["count"], page_size)
+                        )
+                    on_page(model_name, page["results"])
+
+
+class NautobotBulkAdapter(DiffSync):
+    """DiffSync adapter base class for local Nautobot data, whose models queue their changes to be written in bulk.
+
+    The create/update/delete methods of this adapter's DiffSyncModels should queue changes to Nautobot objects with
+    `self.diffsync.bulk_writer` (a `nautobot_ssot.bulk_writer.NautobotBulkWriter`), rather than saving each object
+    themselves. Any changes still queued once the sync completes are then written out. Foreign keys are resolved
+    through the Job's `references` cache, if it has one.
+
+    With `bulk_write` set, changes are written with bulk queries, which record no change log entries; otherwise each
+    object is still saved individually, as per NautobotBulkWriter's `bulk` option.
+    """
+
+    def __init__(self, *args, job=None, bulk_batch_size=1000, bulk_write=True, **kwargs):
+        """Instantiate this class, but do not load data immediately from the local system.
+
+        Args:
+            job (DataSyncBaseJob): The running Job instance that owns this DiffSync adapter instance.
+            bulk_batch_size (int): Number of changes to queue before writing them to the database.
+            bulk_write (bool): Whether to write changes with bulk queries, bypassing change logging and signals.
+        """
+        super().__init__(*args, **kwargs)
+        self.job = job
+        self.bulk_writer = NautobotBulkWriter(
+            job=job, batch_size=bulk_batch_size, references=getattr(job, "references", None), bulk=bulk_write
+        )
+
+    def sync_complete(self, source, diff, flags=DiffSyncFlags.NONE, logger=None):
+        """Write out any changes still queued once synchronization to this adapter is complete."""
+        self.bulk_writer.complete()
+        super().sync_complete(source, diff, flags=flags, logger=logger)
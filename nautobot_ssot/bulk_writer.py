@@ -0,0 +1,440 @@
+"""Bulk writing of changes to Nautobot data made while synchronizing DiffSync models."""
+
+from collections import defaultdict
+import functools
+import operator
+import threading
+
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import DatabaseError, transaction
+from django.db.models import Q
+
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.references import ReferenceCache
+
+
+def _is_tree_model(model):
+    """Whether the given Django model is an MPTT tree model, whose tree fields must be rebuilt after bulk writes."""
+    return hasattr(model, "_mptt_meta")
+
+
+def _tree_parent_fields(model):
+    """Get the names (and attnames) of the parent field of the given MPTT tree model, whose changes alter the tree."""
+    parent_field = model._meta.get_field(model._mptt_meta.parent_attr)  # pylint: disable=protected-access
+    return {parent_field.name, parent_field.attname}
+
+
+def _dependency_order(models):
+    """Sort the given Django models such that each comes after any of the others that it has a foreign key to."""
+    models = list(models)
+    ordered = []
+    visiting = set()
+
+    def visit(model):
+        if model in ordered or model in visiting:
+            return
+        visiting.add(model)
+        for field in model._meta.concrete_fields:
+            if field.is_relation and field.related_model is not model and field.related_model in models:
+                visit(field.related_model)
+        ordered.append(model)
+
+    for model in models:
+        visit(model)
+    return ordered
+
+
+def _self_dependency_order(model, instances):
+    """Sort instances of the given model such that each comes after any of the others that it has a foreign key to."""
+    self_fields = [field for field in model._meta.concrete_fields if field.is_relation and field.related_model is model]
+    if not self_fields:
+        return list(instances)
+    by_pk = {instance.pk: instance for instance in instances}
+    depths = {}
+
+    def depth(instance):
+        if instance.pk not in depths:
+            depths[instance.pk] = 0  # guard against reference cycles
+            parents = (by_pk.get(getattr(instance, field.attname)) for field in self_fields)
+            depths[instance.pk] = 1 + max((depth(parent) for parent in parents if parent is not None), default=-1)
+        return depths[instance.pk]
+
+    return sorted(instances, key=depth)
+
+
+def _bulk_validation_errors(model, instances, pending=frozenset(), changed=None):
+    """Validate instances of a single model with a number of queries that doesn't depend on the number of instances.
+
+    Each instance's fields are cleaned with `clean_fields()`, but the existence of the objects its foreign keys refer
+    to, and the uniqueness of its unique fields, are checked for all the instances at once, with a query per foreign
+    key or unique field (or set of fields); instances are also checked to be unique among themselves. The model's
+    `clean()` method isn't run, as those of Nautobot's models query the database for each object (to get the custom
+    fields defined for its model, for instance).
+
+    Args:
+        model (Model): Django model of the instances.
+        instances (list): Instances to validate.
+        pending (set): Primary keys of objects of the model that are yet to be created, which foreign keys may refer to.
+        changed (set): For instances that already exist, the names of the fields changed, so that only their
+            uniqueness is checked.
+
+    Returns:
+        dict: Mapping of the primary key of each invalid instance to a list of its ValidationErrors.
+    """
+    # pylint: disable=protected-access,too-many-locals,too-many-branches
+    errors = defaultdict(list)
+    foreign_keys = [field for field in model._meta.concrete_fields if field.is_relation]
+
+    for instance in instances:
+        # Foreign keys that are set are checked below; clean_fields() would look up each of them individually
+        exclude = [field.name for field in foreign_keys if getattr(instance, field.attname) is not None]
+        try:
+            instance.clean_fields(exclude=exclude)
+        except ValidationError as exc:
+            errors[instance.pk].append(exc)
+
+    for field in foreign_keys:
+        values = {
+            field.to_python(getattr(instance, field.attname))
+            for instance in instances
+            if getattr(instance, field.attname) is not None and getattr(instance, field.attname) not in pending
+        }
+        if not values:
+            continue
+        target = field.remote_field.field_name
+        existing = set(
+            field.related_model._base_manager.filter(**{f"{target}__in": values})
+            .complex_filter(field.get_limit_choices_to())
+            .values_list(target, flat=True)
+        )
+        for instance in instances:
+            value = getattr(instance, field.attname)
+            if value is None or value in pending or field.to_python(value) in existing:
+                continue
+            params = {"model": field.related_model._meta.verbose_name, "pk": value, "field": target, "value": value}
+            errors[instance.pk].append(
+                ValidationError({field.name: ValidationError(field.error_messages["invalid"], "invalid", params)})
+            )
+
+    unique_checks, _ = instances[0]._get_unique_checks()
+    for model_class, check in unique_checks:
+        fields = [model._meta.get_field(name) for name in check]
+        if changed is not None and not changed & {name for field in fields for name in (field.name, field.attname)}:
+            continue
+        by_key = {}
+        for instance in instances:
+            key = tuple(field.to_python(getattr(instance, field.attname)) for field in fields)
+            if None in key:
+                continue
+            if key in by_key:
+                errors[instance.pk].append(instance.unique_error_message(model_class, check))
+            else:
+                by_key[key] = instance
+        if not by_key:
+            continue
+        if len(fields) == 1:
+            condition = Q(**{f"{fields[0].attname}__in": [key for key, in by_key]})
+        else:
+            condition = functools.reduce(
+                operator.or_, (Q(**{field.attname: value for field, value in zip(fields, key)}) for key in by_key)
+            )
+        attnames = [field.attname for field in fields]
+        for pk, *key in model_class._default_manager.filter(condition).values_list("pk", *attnames):
+            instance = by_key.get(tuple(key))
+            # An existing object is only a duplicate of another object, not of itself
+            if instance is not None and (instance._state.adding or instance.pk != pk):
+                errors[instance.pk].append(instance.unique_error_message(model_class, check))
+
+    return errors
+
+
+class NautobotBulkWriter:
+    """Queue creates, updates and deletes of Nautobot objects, and write them to the database in bulk.
+
+    Saving each object as soon as DiffSync creates, updates or deletes the corresponding model costs at least one
+    query per object. Changes queued with this writer are instead held in memory until `batch_size` of them have
+    accumulated (or until `flush()` is called explicitly), and are then written with `bulk_create()`, `bulk_update()`
+    and a single `delete()` per model:
+
+    - Objects are created and updated in dependency order, so that objects referenced by a foreign key are written
+      before the objects referencing them (for example, Regions before Sites, and parent Regions before their
+      children), and are deleted in the reverse order.
+    - Objects that are to be created or updated are validated before being written, unless `validate` is False.
+      So as not to cost a query or more per object, each object's fields are cleaned individually, but the objects
+      that their foreign keys refer to, and the uniqueness of their unique fields, are looked up for each batch at
+      once; models' own `clean()` methods aren't run, as those of Nautobot's models query the database for each
+      object. (Without `bulk`, each object is validated with `full_clean()` instead.) Foreign keys to objects that are
+      still queued for creation are not validated.
+    - If writing a batch fails, each of its objects is instead saved (or deleted) individually, so that the failure
+      can be attributed to the object(s) responsible.
+    - Any object that fails validation, or cannot be written, is reported to the given Job, which gives the
+      SyncLogEntry that DiffSync logged for the change as it was queued an error status instead.
+    - Objects queued for creation are registered with a ReferenceCache, so that `resolve()` can find them (as well
+      as existing objects, without a query per lookup) to set foreign keys to.
+
+    Note that as bulk creates and updates bypass each object's `save()` method and its signals, they record no change
+    log entries (`ObjectChange` records), don't apply custom field defaults, and don't run any other `post_save`
+    receivers. (Deletes of a queryset still send signals for each object.) If these are needed, set `bulk` to False,
+    to have changes still queued, validated and written in dependency order, but each object saved individually,
+    at the cost of the queries that bulk writing saves.
+
+    The tree fields of MPTT models (such as Region) cannot be maintained by bulk writes, so are rebuilt, once per model,
+    by `complete()`, which should be called once all changes have been queued, and only if any objects were created in
+    bulk or moved within their tree. Until then, the tree fields of such models are not up to date.
+
+    Changes may be queued from several threads at once, such as when a Job has `concurrent_sync` enabled; each flush
+    writes the changes queued up to that point, in the thread (and so the database connection) that flushes them.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, job=None, batch_size=1000, validate=True, references=None, bulk=True
+    ):
+        """Create a writer, optionally reporting failures through the given Job.
+
+        Args:
+            job (DataSyncBaseJob): Job to report failed changes to with `sync_log_failure()`.
+            batch_size (int): Number of changes to accumulate before automatically flushing them.
+            validate (bool): Whether to validate objects before writing them.
+            references (ReferenceCache): Cache for resolving foreign keys, such as the Job's `references`.
+            bulk (bool): Whether to write changes with bulk queries, bypassing `save()`, `delete()` and signals
+                (including change logging), rather than saving or deleting each object individually.
+        """
+        self.job = job
+        self.batch_size = batch_size
+        self.validate = validate
+        self.bulk = bulk
+        self.references = references if references is not None else ReferenceCache()
+        self.failures = []
+        self._creates = {}
+        self._updates = {}
+        self._deletes = {}
+        self._rebuild = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of changes currently queued and not yet written."""
+        return sum(
+            len(changes) for queue in (self._creates, self._updates, self._deletes) for changes in queue.values()
+        )
+
+    def create(self, instance, record=None):
+        """Queue the given new (unsaved) Django model instance to be created.
+
+        Args:
+            instance (Model): Django model instance to create.
+            record (DiffSyncModel): Corresponding DiffSync model, to identify the object in any log entry.
+        """
+        model = type(instance)
+        with self._lock:
+            self._creates.setdefault(model, {})[instance.pk] = (instance, record)
+            self.references.add(instance)
+        self._flush_if_full()
+
+    def update(self, model, pk, record=None, **values):
+        """Queue the Django object of the given model and primary key to be updated with the given field values."""
+        with self._lock:
+            if pk in self._creates.get(model, {}):
+                # Not yet created, so just update the instance that will be
+                instance, _ = self._creates[model][pk]
+                for field, value in values.items():
+                    setattr(instance, field, value)
+                return
+            pending_values, _ = self._updates.setdefault(model, {}).get(pk, ({}, None))
+            self._updates[model][pk] = ({**pending_values, **values}, record)
+        self._flush_if_full()
+
+    def delete(self, model, pk, record=None):
+        """Queue the Django object of the given model and primary key to be deleted."""
+        with self._lock:
+            if pk in self._creates.get(model, {}):
+                # Not yet created, so simply don't
+                instance, _ = self._creates[model].pop(pk)
+                self.references.remove(instance)
+                return
+            self._updates.get(model, {}).pop(pk, None)
+            self._deletes.setdefault(model, {})[pk] = record
+        self._flush_if_full()
+
+    def resolve(self, model, field, value):
+        """Get the primary key of the object of a model with the given field value, even if it is queued for creation.
+
+        Raises:
+            ObjectDoesNotExist: if no such object exists or is queued for creation.
+        """
+        return self.references.get(model, field, value)
+
+    def _flush_if_full(self):
+        """Flush all queued changes if there are at least `batch_size` of them."""
+        if len(self) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write all queued changes to the database."""
+        with self._lock:
+            creates, self._creates = self._creates, {}
+            updates, self._updates = self._updates, {}
+            deletes, self._deletes = self._deletes, {}
+        order = _dependency_order({*creates, *updates, *deletes})
+        for model in order:
+            if creates.get(model):
+                self._flush_creates(model, creates[model])
+            if updates.get(model):
+                self._flush_updates(model, updates[model])
+        for model in reversed(order):
+            if deletes.get(model):
+                self._flush_deletes(model, deletes[model])
+                self.references.invalidate(model)
+
+    def complete(self):
+        """Write all queued changes to the database, then rebuild the tree fields of any MPTT models that need it.
+
+        Call this once all changes have been queued, such as from the target adapter's `sync_complete()`.
+        """
+        self.flush()
+        with self._lock:
+            rebuild, self._rebuild = self._rebuild, set()
+        for model in rebuild:
+            model._tree_manager.rebuild()  # pylint: disable=protected-access
+
+    def _needs_rebuild(self, model):
+        """Mark the given MPTT tree model as needing its tree fields to be rebuilt by `complete()`."""
+        with self._lock:
+            self._rebuild.add(model)
+
+    def _report_failure(self, action, instance, record, exc):
+        """Record a change that could not be written, and report it to the Job if any."""
+        object_repr = repr(record) if record is not None else repr(instance)
+        self.failures.append((action, object_repr, exc))
+        if action == SyncLogEntryActionChoices.ACTION_CREATE:
+            self.references.remove(instance)
+        if self.job is not None:
+            self.job.sync_log_failure(
+                action=action,
+                status=SyncLogEntryStatusChoices.STATUS_ERROR,
+                message=f"Failed to {action} {object_repr}: {exc}",
+                record=record,
+                object_repr=object_repr,
+            )
+
+    def _validated(self, action, model, entries, pending=(), changed=None):  # pylint: disable=too-many-arguments
+        """Validate the given (instance, record) pairs of a model, and return those that are valid, reporting the others.
+
+        Args:
+            action (str): Action being performed, for reporting failures.
+            model (Model): Django model of the instances.
+            entries (Iterable): (instance, record) pairs to validate.
+            pending (Iterable): Primary keys of objects of the model that are yet to be created, which foreign keys
+                may refer to.
+            changed (set): For updates, the names of the fields changed, so that only their uniqueness is checked.
+        """
+        entries = list(entries)
+        if not self.validate or not entries:
+            return entries
+        if self.bulk:
+            errors = _bulk_validation_errors(model, [instance for instance, _ in entries], set(pending), changed)
+        else:
+            errors = {}
+            for instance, _ in entries:
+                # Foreign keys to objects that are yet to be created would fail validation, as they aren't saved yet
+                exclude = [
+                    field.name
+                    for field in model._meta.concrete_fields
+                    if field.is_relation and getattr(instance, field.attname) in pending
+                ]
+                try:
+                    instance.full_clean(exclude=exclude)
+                except ValidationError as exc:
+                    errors[instance.pk] = [exc]
+        valid = []
+        for instance, record in entries:
+            if instance.pk in errors:
+                self._report_failure(action, instance, record, ValidationError(errors[instance.pk]))
+            else:
+                valid.append((instance, record))
+        return valid
+
+    def _flush_creates(self, model, creates):
+        """Create the given objects of a single model in bulk, or individually if that fails."""
+        action = SyncLogEntryActionChoices.ACTION_CREATE
+        instances = _self_dependency_order(model, [instance for instance, _ in creates.values()])
+        entries = self._validated(
+            action, model, ((instance, creates[instance.pk][1]) for instance in instances), pending=creates
+        )
+        if not self.bulk:
+            self._save_each(action, entries)
+            return
+        if _is_tree_model(model) and entries:
+            # Placeholder values, until the tree is rebuilt
+            for instance, _ in entries:
+                for attr in ("left_attr", "right_attr", "tree_id_attr", "level_attr"):
+                    setattr(instance, getattr(model._mptt_meta, attr), 0)  # pylint: disable=protected-access
+            self._needs_rebuild(model)
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create([instance for instance, _ in entries], batch_size=self.batch_size)
+        except DatabaseError:
+            self._save_each(action, entries)
+
+    def _save_each(self, action, entries, update_fields=None):
+        """Save each of the given (instance, record) pairs individually, reporting any that fail.
+
+        Args:
+            action (str): Action being performed, for reporting failures.
+            entries (list): (instance, record) pairs to save.
+            update_fields (callable): If given, function of an instance returning the fields to update in it.
+        """
+        for instance, record in entries:
+            try:
+                with transaction.atomic():
+                    instance.save(update_fields=update_fields(instance) if update_fields else None)
+            except DatabaseError as exc:
+                self._report_failure(action, instance, record, exc)
+
+    def _flush_updates(self, model, updates):
+        """Update the given objects of a single model in bulk, or individually if that fails."""
+        action = SyncLogEntryActionChoices.ACTION_UPDATE
+        instances = model.objects.in_bulk(list(updates))
+        entries = []
+        fields = set()
+        for pk, (values, record) in updates.items():
+            if pk not in instances:
+                self._report_failure(action, None, record, ObjectDoesNotExist(f"{model.__name__} {pk} does not exist"))
+                continue
+            for field, value in values.items():
+                setattr(instances[pk], field, value)
+            fields.update(values)
+            entries.append((instances[pk], record))
+        entries = self._validated(action, model, entries, changed=fields)
+        if not entries:
+            return
+        if _is_tree_model(model) and fields & _tree_parent_fields(model):
+            self._needs_rebuild(model)
+
+        def update_fields(instance):
+            return [field for field in fields if field in updates[instance.pk][0]]
+
+        if not self.bulk:
+            self._save_each(action, entries, update_fields)
+            return
+        try:
+            with transaction.atomic():
+                model.objects.bulk_update([instance for instance, _ in entries], fields, batch_size=self.batch_size)
+        except DatabaseError:
+            self._save_each(action, entries, update_fields)
+
+    def _flush_deletes(self, model, deletes):
+        """Delete the given objects of a single model in bulk, or individually if that fails.
+
+        Unlike bulk creates and updates, a queryset's `delete()` still sends signals for each object deleted.
+        """
+        action = SyncLogEntryActionChoices.ACTION_DELETE
+        try:
+            with transaction.atomic():
+                model.objects.filter(pk__in=list(deletes)).delete()
+        except DatabaseError:
+            for instance in model.objects.filter(pk__in=list(deletes)):
+                try:
+                    with transaction.atomic():
+                        instance.delete()
+                except DatabaseError as exc:
+                    self._report_failure(action, instance, deletes[instance.pk], exc)
@@ -0,0 +1,65 @@
+"""Caching of rendered fragments of Sync diffs, which never change once a Sync has completed."""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+
+# Used if the cache named by the "diff_cache" setting isn't configured in CACHES
+_local_cache = LocMemCache(
+    "nautobot_ssot_diff", {"TIMEOUT": 24 * 60 * 60, "OPTIONS": {"MAX_ENTRIES": 500, "CULL_FREQUENCY": 4}}
+)
+
+
+def get_diff_cache():
+    """Get the cache that rendered diff fragments are stored in.
+
+    This is the cache named by the "diff_cache" plugin setting, if configured in `CACHES` (with a file-based backend,
+    for example), and otherwise a cache in the local memory of each process, which holds up to 500 fragments.
+    """
+    alias = settings.PLUGINS_CONFIG["nautobot_ssot"]["diff_cache"]
+    if alias in settings.CACHES:
+        return caches[alias]
+    return _local_cache
+
+
+def _get_key(sync_pk, subtree=None):
+    """Get the cache key of a fragment of the diff of a Sync, or of the list of all its fragments' keys."""
+    if subtree is None:
+        return f"nautobot_ssot.diff.{sync_pk}.keys"
+    return f"nautobot_ssot.diff.{sync_pk}.{hashlib.sha256(subtree.encode()).hexdigest()}"
+
+
+def get_or_render_diff(sync, subtree, render):
+    """Get a rendered fragment of a Sync's diff from the cache, or render it and cache it if the Sync has completed.
+
+    Args:
+        sync (Sync): Sync whose diff the fragment is part of.
+        subtree (str): Identifies the part of the diff that is rendered, such as a model type and page number.
+        render (callable): Function rendering the fragment (as a string or bytes), if it isn't in the cache.
+    """
+    if not sync.job_result or not sync.job_result.completed:
+        return render()
+
+    cache = get_diff_cache()
+    key = _get_key(sync.pk, subtree)
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = render()
+        keys = cache.get(_get_key(sync.pk), [])
+        if key not in keys:
+            cache.set(_get_key(sync.pk), [*keys, key])
+        cache.set(key, fragment)
+    return fragment
+
+
+def invalidate_diff_cache(sync_pk):
+    """Discard all cached fragments of the diff of a Sync."""
+    cache = get_diff_cache()
+    cache.delete_many([*cache.get(_get_key(sync_pk), []), _get_key(sync_pk)])
+
+
+def invalidate_deleted_sync(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Signal handler discarding the cached diff fragments of a Sync once it's deleted."""
+    invalidate_diff_cache(instance.pk)
@@ -1,7 +1,6 @@
 """Filtering logic for Sync and SyncLogEntry records."""
 
 import django_filters
-from django.db.models import Q
 
 from nautobot.utilities.filters import BaseFilterSet
 
@@ -30,7 +29,11 @@ class SyncLogEntryFilterSet(BaseFilterSet):
         fields = ["sync", "action", "status", "synced_object_type"]
 
     def search(self, queryset, _name, value):  # pylint: disable=no-self-use
-        """String search of SyncLogEntry records."""
+        """String search of SyncLogEntry records, by their object, message and diff.
+
+        The search is case-insensitive, but is made against the lower-cased `search_text` field with a case-sensitive
+        lookup, which (unlike `icontains`) the trigram index on that field can be used for.
+        """
         if not value.strip():
             return queryset
-        return queryset.filter(Q(diff__icontains=value) | Q(message__icontains=value))
+        return queryset.filter(search_text__contains=value.lower())
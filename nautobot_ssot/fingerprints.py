@@ -0,0 +1,173 @@
+"""Content hashing of DiffSync records, used to avoid diffing records that are identical on both sides of a sync."""
+
+from collections import Counter, defaultdict
+import hashlib
+import json
+
+from diffsync.enum import DiffSyncModelFlags
+
+
+def _json_default(value):
+    """Serialize a non-JSON-native value together with its type, so that e.g. UUID("...") and "..." differ."""
+    return [type(value).__name__, str(value)]
+
+
+def _combine(items):
+    """Combine an iterable of (key, hash) pairs into a single hash, independent of the order of the pairs."""
+    digest = hashlib.sha256()
+    for key, value in sorted(items):
+        digest.update(f"{key}\0{value}\0".encode())
+    return digest.hexdigest()
+
+
+class RecordHasher:
+    """Compute (and remember) a stable content hash for each record of a DiffSync adapter.
+
+    A record's hash covers its model type, its `_identifiers` and `_attributes`, and recursively the hashes of its
+    children, so two records with equal hashes will not produce any diff between them, nor will any of their children.
+    """
+
+    def __init__(self, adapter):
+        """Create a hasher for records belonging to the given DiffSync adapter."""
+        self.adapter = adapter
+        self.hashes = {}
+
+    def hash(self, model):
+        """Get the content hash of the given DiffSyncModel instance, as a hex string."""
+        key = (model.get_type(), model.get_unique_id())
+        if key not in self.hashes:
+            digest = hashlib.sha256()
+            content = [model.get_type(), model.get_identifiers(), model.get_attrs()]
+            digest.update(json.dumps(content, sort_keys=True, default=_json_default).encode())
+            for child_type, children in sorted(self.children(model).items()):
+                digest.update(f"\0{child_type}".encode())
+                for child_hash in sorted(self.hash(child) for child in children):
+                    digest.update(child_hash.encode())
+            self.hashes[key] = digest.hexdigest()
+        return self.hashes[key]
+
+    def children(self, model):
+        """Get the child records of the given DiffSyncModel instance, as a dict of {child_type: [records]}."""
+        return {
+            child_type: self.adapter.get_by_uids(getattr(model, child_field), child_type)
+            for child_type, child_field in model.get_children_mapping().items()
+        }
+
+
+class FingerprintTree:
+    """Tree of content hashes ("fingerprints") over all records of a DiffSync adapter.
+
+    The tree is structured as root -> top-level model type -> partition -> record, where records of each model type
+    are grouped into partitions by the value of an optional partition key attribute (all records of a model type
+    without a partition key share a single partition). Each node's fingerprint is a hash over the fingerprints of its
+    children, so if a node's fingerprint is the same in the trees for two adapters, the entire subtree under that node,
+    including all child records, is identical in both.
+
+    Trees are deliberately built from the freshly loaded adapters on every run rather than persisted between runs:
+    a fingerprint from an earlier run cannot reveal changes made to the target since then outside of the sync.
+    """
+
+    def __init__(self, adapter, partition_keys=None):
+        """Build the fingerprint tree for the given (loaded) DiffSync adapter.
+
+        Args:
+            adapter (DiffSync): Adapter whose records are to be fingerprinted.
+            partition_keys (dict): Mapping of top-level model type to the name of the attribute by which
+                to partition records of that model type.
+        """
+        partition_keys = partition_keys or {}
+        self.hasher = RecordHasher(adapter)
+        self.records = {}
+        self.partitions = {}
+        self.model_types = {}
+        for model_type in adapter.top_level:
+            records = defaultdict(dict)
+            for record in adapter.get_all(model_type):
+                partition = str(getattr(record, partition_keys[model_type])) if model_type in partition_keys else ""
+                records[partition][record.get_unique_id()] = record
+            self.records[model_type] = records
+            self.partitions[model_type] = {
+                partition: _combine(
+                    (unique_id, self.hasher.hash(record)) for unique_id, record in partition_records.items()
+                )
+                for partition, partition_records in records.items()
+            }
+            self.model_types[model_type] = _combine(self.partitions[model_type].items())
+        self.root = _combine(self.model_types.items())
+
+    def count_records(self):
+        """Count all records in the tree, including child records, per model type.
+
+        Returns:
+            Counter: Number of records of each model type.
+        """
+        counts = Counter()
+        for records in self.records.values():
+            for partition_records in records.values():
+                for record in partition_records.values():
+                    self._walk(record, lambda model: counts.update([model.get_type()]))
+        return counts
+
+    def ignore_identical(self, other):
+        """Flag every record that is identical in this tree and the other to be ignored by DiffSync.
+
+        Subtrees whose fingerprints match are flagged as a whole without comparing their individual records.
+        Ignored records (and their children) are skipped entirely when calculating the diff between the adapters,
+        and so are also left untouched when synchronizing. This relies on the adapters using DiffSync's default
+        in-memory store, in which flags set on a retrieved record are persisted.
+
+        Args:
+            other (FingerprintTree): Fingerprint tree of the adapter being compared against.
+
+        Returns:
+            Counter: Number of identical, and hence ignored, records of each model type, including child records.
+        """
+        identical = Counter()
+        for model_type, records in self.records.items():
+            model_type_matches = self.model_types[model_type] == other.model_types.get(model_type)
+            for partition, partition_records in records.items():
+                partition_matches = model_type_matches or (
+                    self.partitions[model_type][partition] == other.partitions.get(model_type, {}).get(partition)
+                )
+                other_records = other.records.get(model_type, {}).get(partition, {})
+                for unique_id, record in partition_records.items():
+                    other_record = other_records.get(unique_id)
+                    if other_record is None:
+                        continue
+                    if partition_matches:
+                        self._ignore_pair(record, other_record, other, identical)
+                    else:
+                        self._ignore_identical_pair(record, other_record, other, identical)
+        return identical
+
+    def _ignore_pair(self, record, other_record, other, identical):
+        """Ignore the given pair of records, and all of their child records."""
+        self._walk(record, lambda model: self._ignore(model, identical))
+        other._walk(other_record, self._ignore)  # pylint: disable=protected-access
+
+    def _ignore_identical_pair(self, record, other_record, other, identical):
+        """Ignore the given pair of records if identical, or otherwise recurse into their pairs of child records."""
+        if self.hasher.hash(record) == other.hasher.hash(other_record):
+            self._ignore_pair(record, other_record, other, identical)
+            return
+        other_children = other.hasher.children(other_record)
+        for child_type, children in self.hasher.children(record).items():
+            other_children_by_id = {child.get_unique_id(): child for child in other_children.get(child_type, [])}
+            for child in children:
+                other_child = other_children_by_id.get(child.get_unique_id())
+                if other_child is not None:
+                    self._ignore_identical_pair(child, other_child, other, identical)
+
+    @staticmethod
+    def _ignore(model, counter=None):
+        """Flag the given record to be ignored by DiffSync, counting it in the given Counter if any."""
+        model.model_flags |= DiffSyncModelFlags.IGNORE
+        if counter is not None:
+            counter[model.get_type()] += 1
+
+    def _walk(self, model, callback):
+        """Call the given callback for the given record and, recursively, all of its child records."""
+        callback(model)
+        for children in self.hasher.children(model).values():
+            for child in children:
+                self._walk(child, callback)
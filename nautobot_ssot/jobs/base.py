@@ -1,11 +1,14 @@
 """Base Job classes for sync workers."""
-from collections import namedtuple
-from datetime import datetime
+from collections import Counter, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+import threading
 import traceback
 import tracemalloc
 from typing import Iterable
 from packaging.version import Version
 
+from django.db import connections, transaction
 from django.forms import HiddenInput
 from django.templatetags.static import static
 from django.utils import timezone
@@ -14,14 +17,22 @@ from django.utils.functional import classproperty
 # pylint-django doesn't understand classproperty, and complains unnecessarily. We disable this specific warning:
 # pylint: disable=no-self-argument
 
+from diffsync import DiffSyncModel
+from diffsync.diff import Diff
 from diffsync.enum import DiffSyncFlags
 import structlog
 
 from nautobot import __version__ as nautobot_version
+from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.jobs import BaseJob, BooleanVar
 
-from nautobot_ssot.choices import SyncLogEntryActionChoices
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.fingerprints import FingerprintTree
+from nautobot_ssot.log_writer import SyncLogEntryWriter
+from nautobot_ssot.metrics import SyncMetricsRecorder
 from nautobot_ssot.models import Sync, SyncLogEntry
+from nautobot_ssot.references import ReferenceCache
+from nautobot_ssot.syncer import BatchedTransactionSyncer
 
 
 DataMapping = namedtuple("DataMapping", ["source_name", "source_url", "target_name", "target_url"])
@@ -48,6 +59,32 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
       - `dry_run_default` - defaults to True if unspecified
       - `data_source` and `data_target` as labels (by default, will use the `name` and/or "Nautobot" as appropriate)
       - `data_source_icon` and `data_target_icon`
+      - `concurrent_load` - if True, load the source and target adapters at the same time in separate threads
+      - `sync_log_batch_size` - number of SyncLogEntry records to buffer before writing them out (default 1000)
+      - `log_unchanged_records` - if False, records with no changes are only counted (per model type) on the Sync,
+        rather than each getting a SyncLogEntry of its own (default True)
+      - `unchanged_records_sample_size` - if `log_unchanged_records` is False, the number of unchanged records
+        per model type that should still get a SyncLogEntry of their own (default 0)
+      - `skip_identical_records` - if True, compare content hashes of the loaded source and target records before
+        calculating the diff, and skip diffing (and syncing) any records, and their children, that are identical
+        on both sides; if everything is identical, the diff and sync are skipped altogether (default False)
+      - `fingerprint_partition_keys` - dict of top-level model type to the name of an attribute by which to group
+        its records, so that each group can be skipped as a whole when `skip_identical_records` is True
+      - `incremental_load` - if True, the adapter loaders are given the high-water mark of the previous successful
+        sync as `self.changed_since`, so that they can load only the data changed since then (default False)
+      - `full_sync_interval` - if `incremental_load` is True, the maximum time between full syncs, or None to
+        never force a full sync once one has been performed (default one day)
+      - `concurrent_sync` - if True, synchronize the diff of each top-level model type in a separate thread, as soon
+        as the model types it depends on have been synchronized (default False)
+      - `sync_dependencies` - if `concurrent_sync` is True, dict of top-level model type to the model types that
+        must be synchronized before it, such as `{"site": ["region"]}`; other model types are independent
+      - `concurrent_sync_workers` - if `concurrent_sync` is True, the maximum number of model types to synchronize
+        at once (default 4)
+      - `sync_transaction_size` - if set, apply the changes of the diff in atomic transactions of this many changes
+        each, rather than committing each database write on its own, wherever the sync isn't already running within
+        a transaction, as the worker threads of `concurrent_sync` aren't (default None)
+      - `sync_change_savepoints` - if `sync_transaction_size` is set, make each change within a savepoint of its own,
+        so that a database error only rolls back that change, rather than the rest of its transaction (default False)
     """
 
     dry_run = BooleanVar()
@@ -58,8 +95,12 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
 
         Relevant available instance attributes include:
 
-        - self.kwargs     (corresponds to the Job's `data` input, including 'dry_run' option)
-        - self.job_result (as per Job API)
+        - self.kwargs        (corresponds to the Job's `data` input, including 'dry_run' option)
+        - self.job_result    (as per Job API)
+        - self.changed_since (if not None, only data changed since this datetime needs to be loaded)
+
+        If `incremental_load` is set, the loader should also set `self.high_water_mark` to the point in time, according
+        to the data source, up to which all changes have been loaded, such as the latest `last_updated` timestamp seen.
         """
         raise NotImplementedError
 
@@ -68,8 +109,9 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
 
         Relevant available instance attributes include:
 
-        - self.kwargs     (corresponds to the Job's `data` input, including 'dry_run' option)
-        - self.job_result (as per Job API)
+        - self.kwargs        (corresponds to the Job's `data` input, including 'dry_run' option)
+        - self.job_result    (as per Job API)
+        - self.changed_since (if not None, only data changed since this datetime needs to be loaded)
         """
         raise NotImplementedError
 
@@ -79,9 +121,26 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
         This is a generic implementation that you could overwrite completely in your custom logic.
         """
         if self.source_adapter is not None and self.target_adapter is not None:
+            if self.skip_identical_records:
+                source_tree = FingerprintTree(self.source_adapter, self.fingerprint_partition_keys)
+                target_tree = FingerprintTree(self.target_adapter, self.fingerprint_partition_keys)
+                if source_tree.root == target_tree.root:
+                    self.fingerprints_match = True
+                    self.identical_records = source_tree.count_records()
+                    self.diff = Diff()
+                    self.log_info(message="Source and target are identical; there are no changes to synchronize.")
+                    return
+                self.identical_records = source_tree.ignore_identical(target_tree)
+                self.log_info(
+                    message=f"Skipping {sum(self.identical_records.values())} record(s) identical in source and target."
+                )
             self.diff = self.source_adapter.diff_to(self.target_adapter, flags=self.diffsync_flags)
-            self.sync.diff = self.diff.dict()
-            self.sync.save()
+            # Store each top-level element separately, rather than the whole diff as a single blob on the Sync record
+            self.sync.store_diff(
+                (element.type, element.name, element.dict())
+                for element in self.diff.get_children()
+                if element.has_diffs(include_children=True)
+            )
             self.log_info(message=self.diff.summary())
         else:
             self.log_warning(message="Not both adapters were properly initialized prior to diff calculation.")
@@ -92,10 +151,66 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
         This is a generic implementation that you could overwrite completely in your custom logic.
         """
         if self.source_adapter is not None and self.target_adapter is not None:
-            self.source_adapter.sync_to(self.target_adapter, flags=self.diffsync_flags)
+            if self.concurrent_sync:
+                self._sync_model_types_concurrently()
+            elif self.sync_transaction_size and not transaction.get_connection().in_atomic_block:
+                # Within a transaction, such as the one Nautobot runs the Job in, batches would commit nothing
+                self._sync_in_transactions(on_commit=self.flush_sync_log)
+            else:
+                self.source_adapter.sync_to(self.target_adapter, flags=self.diffsync_flags)
+            self._count_identical_records()
         else:
             self.log_warning(message="Not both adapters were properly initialized prior to synchronization.")
 
+    def _sync_in_transactions(self, diff=None, on_commit=None):
+        """Apply the given diff (by default, `self.diff`) in atomic transactions of `sync_transaction_size` changes.
+
+        If `on_commit` is given, it is called after each transaction, and buffered log entries are only written out
+        then, rather than automatically as the buffer fills, so that none are rolled back along with a transaction.
+        If a transaction is rolled back, the entries logged for its changes are marked as failed. Changes queued by
+        the target adapter's `bulk_writer`, if it has one, are written out at the end of each transaction, and the
+        adapter's `sync_complete()` is called within the last one.
+        """
+        if diff is None:
+            diff = self.diff or self.target_adapter.diff_from(self.source_adapter, flags=self.diffsync_flags)
+        syncer = BatchedTransactionSyncer(
+            diff=diff,
+            src_diffsync=self.source_adapter,
+            dst_diffsync=self.target_adapter,
+            flags=self.diffsync_flags,
+            batch_size=self.sync_transaction_size,
+            before_commit=getattr(getattr(self.target_adapter, "bulk_writer", None), "flush", None),
+            on_commit=on_commit,
+            savepoints=self.sync_change_savepoints,
+        )
+        defer_log = on_commit is not None and self.sync_log_writer is not None
+        if defer_log:
+            self.sync_log_writer.auto_flush = False
+        try:
+            syncer.perform_sync()
+        except Exception:
+            if syncer.rolled_back:
+                self.log_failure(message=f"Rolled back the last {syncer.rolled_back} change(s) made by the sync.")
+            if self.sync_log_writer is not None:
+                # DiffSync has already logged these changes as successful
+                for model_name, unique_id, action in syncer.rolled_back_changes:
+                    self.sync_log_writer.mark_failed(
+                        (model_name, unique_id),
+                        action,
+                        SyncLogEntryStatusChoices.STATUS_FAILURE,
+                        "Rolled back, along with the rest of its transaction, as a later change failed",
+                    )
+            raise
+        finally:
+            if defer_log:
+                self.sync_log_writer.auto_flush = True
+
+    def _count_identical_records(self):
+        """Count records skipped as identical as unchanged; they never reach DiffSync's log to be counted there."""
+        if self.sync_log_writer is not None and self.diffsync_flags & DiffSyncFlags.LOG_UNCHANGED_RECORDS:
+            for model_name, count in self.identical_records.items():
+                self.sync_log_writer.count_unchanged(model_name, logged=False, count=count)
+
     def sync_data(self):
         """Method to load data from adapters, calculate diffs and sync (if not dry-run).
 
@@ -111,68 +226,262 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
         - self.kwargs     (corresponds to the Job's `data` input, including 'dry_run' option)
         - self.commit     (should generally be True)
         - self.sync       (Sync instance tracking this job execution)
+        - self.metrics    (SyncMetricsRecorder for recording per-phase timing and memory metrics on self.sync)
+        - self.references (ReferenceCache for resolving foreign keys by name/slug without a query per object)
         - self.job_result (as per Job API)
         """
 
-        def record_memory_trace(step: str):
+        def record_memory_trace(*steps: str):
             """Helper function to record memory usage and reset tracemalloc stats."""
-            memory_final, memory_peak = tracemalloc.get_traced_memory()
-            setattr(self.sync, f"{step}_memory_final", memory_final)
-            setattr(self.sync, f"{step}_memory_peak", memory_peak)
-            self.sync.save()
+            memory_final, memory_peak = self.metrics.record_memory(*steps)
             self.log_info(
-                message=(f"Traced memory for {step} (Final, Peak): {memory_final} bytes, {memory_peak} bytes")
+                message=(
+                    f"Traced memory for {' and '.join(steps)} (Final, Peak): {memory_final} bytes, {memory_peak} bytes"
+                )
             )
-            tracemalloc.clear_traces()
 
         if not self.sync:
             return
 
+        self.metrics = SyncMetricsRecorder(self.sync)
+
         if self.kwargs["memory_profiling"]:
             tracemalloc.start()
 
         start_time = datetime.now()
 
-        self.log_info(message="Loading current data from source adapter...")
-        self.load_source_adapter()
-        load_source_adapter_time = datetime.now()
-        self.sync.source_load_time = load_source_adapter_time - start_time
-        self.sync.save()
-        self.log_info(message=f"Source Load Time from {self.source_adapter}: {self.sync.source_load_time}")
-        if self.kwargs["memory_profiling"]:
-            record_memory_trace("source_load")
-
-        self.log_info(message="Loading current data from target adapter...")
-        self.load_target_adapter()
-        load_target_adapter_time = datetime.now()
-        self.sync.target_load_time = load_target_adapter_time - load_source_adapter_time
-        self.sync.save()
-        self.log_info(message=f"Target Load Time from {self.target_adapter}: {self.sync.target_load_time}")
-        if self.kwargs["memory_profiling"]:
-            record_memory_trace("target_load")
+        if self.incremental_load:
+            self._start_incremental_load()
+
+        if self.concurrent_load:
+            self.log_info(message="Loading current data from source and target adapters concurrently...")
+            source_load_time, target_load_time = self._load_adapters_concurrently()
+            load_target_adapter_time = datetime.now()
+            self.metrics.record_times(source_load=source_load_time, target_load=target_load_time)
+            self.log_info(message=f"Source Load Time from {self.source_adapter}: {self.sync.source_load_time}")
+            self.log_info(message=f"Target Load Time from {self.target_adapter}: {self.sync.target_load_time}")
+            if self.kwargs["memory_profiling"]:
+                # Both loads ran at the same time, so their combined memory usage is recorded for each of them.
+                record_memory_trace("source_load", "target_load")
+        else:
+            self.log_info(message="Loading current data from source adapter...")
+            self.load_source_adapter()
+            load_source_adapter_time = datetime.now()
+            self.metrics.record_time("source_load", load_source_adapter_time - start_time)
+            self.log_info(message=f"Source Load Time from {self.source_adapter}: {self.sync.source_load_time}")
+            if self.kwargs["memory_profiling"]:
+                record_memory_trace("source_load")
+
+            self.log_info(message="Loading current data from target adapter...")
+            self.load_target_adapter()
+            load_target_adapter_time = datetime.now()
+            self.metrics.record_time("target_load", load_target_adapter_time - load_source_adapter_time)
+            self.log_info(message=f"Target Load Time from {self.target_adapter}: {self.sync.target_load_time}")
+            if self.kwargs["memory_profiling"]:
+                record_memory_trace("target_load")
 
         self.log_info(message="Calculating diffs...")
         self.calculate_diff()
+        self.flush_sync_log()
         calculate_diff_time = datetime.now()
-        self.sync.diff_time = calculate_diff_time - load_target_adapter_time
-        self.sync.save()
+        self.metrics.record_time("diff", calculate_diff_time - load_target_adapter_time)
         self.log_info(message=f"Diff Calculation Time: {self.sync.diff_time}")
         if self.kwargs["memory_profiling"]:
             record_memory_trace("diff")
 
         if self.kwargs["dry_run"]:
             self.log_info("As `dry_run` is set, skipping the actual data sync.")
+        elif self.fingerprints_match:
+            self.log_info("As source and target are identical, skipping the actual data sync.")
+            self._count_identical_records()
         else:
             self.log_info(message=f"Syncing from {self.source_adapter} to {self.target_adapter}...")
             self.execute_sync()
+            self.flush_sync_log()
             execute_sync_time = datetime.now()
-            self.sync.sync_time = execute_sync_time - calculate_diff_time
-            self.sync.save()
+            self.metrics.record_time("sync", execute_sync_time - calculate_diff_time)
             self.log_info(message="Sync complete")
             self.log_info(message=f"Sync Time: {self.sync.sync_time}")
             if self.kwargs["memory_profiling"]:
                 record_memory_trace("sync")
 
+        if self.incremental_load:
+            self._finish_incremental_load()
+
+    def _start_incremental_load(self):
+        """Determine the data to be loaded by an incremental sync, and record it on the Sync.
+
+        Data changed from now on is only guaranteed to be loaded by the next sync, so the current time is this sync's
+        default high-water mark; loaders should instead set `self.high_water_mark` from the data source itself, such
+        as to the latest `last_updated` timestamp loaded, so that the mark doesn't depend on the two systems' clocks
+        being in agreement. As records missing from an incremental load have most likely not been deleted, but merely
+        not changed, no deletions are inferred from them.
+        """
+        self.changed_since = self._get_changed_since()
+        self.high_water_mark = timezone.now()
+        self.sync.changed_since = self.changed_since
+        self.sync.save(update_fields=["changed_since"])
+        if self.changed_since is not None:
+            self.log_info(message=f"Loading only data changed since {self.changed_since}.")
+            self.diffsync_flags |= DiffSyncFlags.SKIP_UNMATCHED_DST
+
+    def _finish_incremental_load(self):
+        """Record the high-water mark of this sync on the Sync, unless any record failed to be synchronized.
+
+        Records that failed to sync (with `CONTINUE_ON_FAILURE`) are unlikely to have changed since, and so wouldn't
+        be loaded again by an incremental sync starting from this sync's mark; the next sync instead starts from the
+        mark of the last sync without failures, or is a full sync.
+        """
+        failures = self.sync.logs.filter(
+            status__in=[SyncLogEntryStatusChoices.STATUS_FAILURE, SyncLogEntryStatusChoices.STATUS_ERROR]
+        ).count()
+        if failures:
+            self.log_warning(
+                message=f"Not recording a high-water mark, as {failures} record(s) failed to sync; "
+                "the next sync will load them again."
+            )
+            return
+        self.sync.high_water_mark = self.high_water_mark
+        self.sync.save(update_fields=["high_water_mark"])
+
+    def _get_changed_since(self):
+        """Get the high-water mark of the last successful sync by this Job, or None if a full sync is due."""
+        previous_syncs = (
+            Sync.objects.filter(
+                job_result__name=self.job_result.name,
+                job_result__status=JobResultStatusChoices.STATUS_COMPLETED,
+                dry_run=False,
+                high_water_mark__isnull=False,
+            )
+            .exclude(pk=self.sync.pk)
+            .order_by("-high_water_mark")
+        )
+        last_full_sync = previous_syncs.filter(changed_since__isnull=True).first()
+        if last_full_sync is None:
+            self.log_info(message="No previous full sync found; loading all data.")
+            return None
+        if self.full_sync_interval is not None and (
+            timezone.now() - last_full_sync.high_water_mark >= self.full_sync_interval
+        ):
+            self.log_info(message=f"Last full sync was more than {self.full_sync_interval} ago; loading all data.")
+            return None
+        return previous_syncs.values_list("high_water_mark", flat=True).first()
+
+    @staticmethod
+    def _timed_load(load_method, *args, **kwargs):
+        """Call the given adapter-loading (or syncing) method in a worker thread and return its wall-clock duration.
+
+        Django database connections are per-thread, so any connection opened by the method is closed
+        once it completes, rather than being leaked by the thread pool.
+        """
+        start_time = datetime.now()
+        try:
+            load_method(*args, **kwargs)
+        finally:
+            connections.close_all()
+        return datetime.now() - start_time
+
+    def _load_adapters_concurrently(self):
+        """Run `load_source_adapter()` and `load_target_adapter()` at the same time in separate threads.
+
+        Note that the worker threads use their own database connections, and so do not share the transaction
+        (if any) that the Job itself is running within; loaders should therefore only *read* from the database.
+
+        Returns:
+            tuple: (source_load_time, target_load_time) as timedelta objects
+
+        Raises:
+            Exception: the exception raised by the source loader, or else by the target loader, if either failed.
+        """
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ssot-load") as executor:
+            source_future = executor.submit(self._timed_load, self.load_source_adapter)
+            target_future = executor.submit(self._timed_load, self.load_target_adapter)
+
+        failures = [
+            (label, future.exception())
+            for label, future in (("source", source_future), ("target", target_future))
+            if future.exception() is not None
+        ]
+        if failures:
+            for label, exc in failures[1:]:
+                self.log_failure(message=f"Loading the {label} adapter also failed: `{type(exc).__name__}: {exc}`")
+            raise failures[0][1]
+
+        return source_future.result(), target_future.result()
+
+    def _sync_model_types_concurrently(self):
+        """Synchronize the diff of each top-level model type in a separate thread, following `sync_dependencies`.
+
+        Each model type's part of the diff (including the diffs of its children) is synchronized with a `sync_to()`
+        of its own, so that the target adapter's `sync_complete()` is called once per model type. Model types are
+        synchronized as soon as those they depend on have been, up to `concurrent_sync_workers` at once, and the time
+        taken by each is recorded on the Sync.
+
+        As with `concurrent_load`, the worker threads use their own database connections, and so do not share the
+        transaction (if any) that the Job itself is running within; changes they make are committed independently.
+        Log entries are still written to the database by the Job's own thread, as the worker threads' connections
+        cannot see the Sync record that they belong to until the Job completes.
+
+        Raises:
+            ValueError: if `sync_dependencies` are circular.
+            Exception: the first exception raised while synchronizing any model type.
+        """
+        diffs = {}
+        for element in self.diff.get_children():
+            # Preserve any custom ordering of elements that a subclass of Diff may implement
+            diffs.setdefault(element.type, type(self.diff)()).add(element)
+        dependencies = {model_type: set(self.sync_dependencies.get(model_type, ())) for model_type in diffs}
+        unordered = set(dependencies)
+        while unordered:
+            ordered = {model_type for model_type in unordered if not dependencies[model_type] & unordered}
+            if not ordered:
+                raise ValueError(f"Circular sync_dependencies between model types {', '.join(sorted(unordered))}")
+            unordered -= ordered
+
+        durations = {}
+        failures = []
+        with ThreadPoolExecutor(max_workers=self.concurrent_sync_workers, thread_name_prefix="ssot-sync") as executor:
+            running = {}
+            while diffs or running:
+                unfinished = set(diffs) | set(running.values())
+                for model_type in [model_type for model_type in diffs if not dependencies[model_type] & unfinished]:
+                    self.log_info(message=f"Synchronizing {model_type} records...")
+                    if self.sync_transaction_size:
+                        future = executor.submit(self._timed_load, self._sync_in_transactions, diffs.pop(model_type))
+                    else:
+                        future = executor.submit(
+                            self._timed_load,
+                            self.source_adapter.sync_to,
+                            self.target_adapter,
+                            flags=self.diffsync_flags,
+                            diff=diffs.pop(model_type),
+                        )
+                    running[future] = model_type
+
+                done, _ = wait(running, timeout=1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    model_type = running.pop(future)
+                    if future.exception() is None:
+                        durations[model_type] = future.result()
+                        self.log_info(message=f"Synchronized {model_type} records in {durations[model_type]}")
+                        continue
+                    failures.append((model_type, future.exception()))
+                    # Skip all model types that depend on it, directly or indirectly
+                    skipped = {model_type}
+                    while any(dependencies[other] & skipped for other in diffs if other not in skipped):
+                        skipped.update(other for other in diffs if dependencies[other] & skipped)
+                    for other in skipped - {model_type}:
+                        del diffs[other]
+                        self.log_warning(message=f"Skipping {other} records, as synchronizing {model_type} failed.")
+                # Write out log entries buffered by the worker threads, which cannot write them themselves
+                self.flush_sync_log()
+
+        self.metrics.record_model_times(durations)
+        if failures:
+            for model_type, exc in failures[1:]:
+                self.log_failure(message=f"Synchronizing {model_type} also failed: `{type(exc).__name__}: {exc}`")
+            raise failures[0][1]
+
     def lookup_object(self, model_name, unique_id):  # pylint: disable=no-self-use,unused-argument
         """Look up the Nautobot record, if any, identified by the args.
 
@@ -187,6 +496,35 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
         """
         return None
 
+    def lookup_objects(self, model_name, unique_ids):
+        """Look up the Nautobot records, if any, identified by each of the given unique_ids.
+
+        Optional helper method, used in preference to `lookup_object()` when building SyncLogEntry records
+        from DiffSync logs. Overriding this allows many records of the same type to be looked up with a single query;
+        the default implementation simply calls `lookup_object()` once for each unique_id.
+
+        Args:
+            model_name (str): DiffSyncModel class name or similar class/model label.
+            unique_ids (Iterable[str]): DiffSyncModel unique_ids or similar unique identifiers.
+
+        Returns:
+            dict: {unique_id: Nautobot model instance} for each of the unique_ids that could be resolved
+        """
+        results = {}
+        for unique_id in unique_ids:
+            synced_object = self.lookup_object(model_name, unique_id)  # pylint: disable=assignment-from-none
+            if synced_object is not None:
+                results[unique_id] = synced_object
+        return results
+
+    def _resolve_objects(self, model_name, unique_ids):
+        """Look up Nautobot records via `lookup_objects()`, remembering them for the remainder of this Job."""
+        cache = self._lookup_cache.setdefault(model_name, {})
+        missing = [unique_id for unique_id in unique_ids if unique_id not in cache]
+        if missing:
+            cache.update(self.lookup_objects(model_name, missing))
+        return {unique_id: cache[unique_id] for unique_id in unique_ids if unique_id in cache}
+
     @classmethod
     def data_mappings(cls) -> Iterable[DataMapping]:
         """List the data mappings involved in this sync job."""
@@ -210,11 +548,26 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
         synced_object=None,
         object_repr="",
     ):
-        """Log a action message as a SyncLogEntry."""
+        """Log a action message as a SyncLogEntry.
+
+        While the sync is running, entries are buffered by `self.sync_log_writer` and written out in batches;
+        otherwise the entry is written to the database immediately.
+        """
+        if self.sync_log_writer is not None:
+            self.sync_log_writer.add(
+                action=action,
+                status=status,
+                message=message,
+                diff=diff,
+                synced_object=synced_object,
+                object_repr=object_repr,
+            )
+            return
+
         if synced_object and not object_repr:
             object_repr = repr(synced_object)
 
-        SyncLogEntry.objects.create(
+        entry = SyncLogEntry.objects.create(
             sync=self.sync,
             action=action,
             status=status,
@@ -223,16 +576,64 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
             synced_object=synced_object,
             object_repr=object_repr,
         )
+        self.sync.update_statistics([entry])
+
+    def sync_log_failure(self, action, status, message, record=None, object_repr=""):
+        """Log that a change to the given DiffSyncModel failed, after DiffSync itself had logged it as successful.
+
+        This is the case for changes that are only queued when DiffSync makes them, to be written out later, such as
+        by a bulk writer. The SyncLogEntry that DiffSync logged for the change is updated with the given status and
+        message, rather than a second, contradictory entry being logged; only if there is no such entry (or `record`
+        is not a DiffSyncModel) is a new entry logged instead.
+        """
+        if self.sync_log_writer is not None and isinstance(record, DiffSyncModel):
+            unresolved_object = (record.get_type(), record.get_unique_id())
+            if self.sync_log_writer.mark_failed(unresolved_object, action, status, message):
+                return
+        self.sync_log(action=action, status=status, message=message, object_repr=object_repr)
+
+    def flush_sync_log(self):
+        """Write out any SyncLogEntry records that are currently buffered.
+
+        Called by the built-in `sync_data()` at the end of each phase; custom implementations of `sync_data()`
+        may wish to do likewise, although any remaining entries are always written once the sync finishes.
+        """
+        if self.sync_log_writer is not None:
+            self.sync_log_writer.flush()
 
     def _structlog_to_sync_log_entry(self, _logger, _log_method, event_dict):
         """Capture certain structlog messages from DiffSync into the Nautobot database."""
         if all(key in event_dict for key in ("src", "dst", "action", "model", "unique_id", "diffs", "status")):
             # The DiffSync log gives us a model name (string) and unique_id (string).
             # Try to look up the actual Nautobot object that this describes.
-            synced_object = self.lookup_object(  # pylint: disable=assignment-from-none
-                event_dict["model"], event_dict["unique_id"]
-            )
-            object_repr = repr(synced_object) if synced_object else f"{event_dict['model']} {event_dict['unique_id']}"
+            model_name, unique_id = event_dict["model"], event_dict["unique_id"]
+            if self.sync_log_writer is not None:
+                if not event_dict["action"]:
+                    # DiffSync logs from the worker threads of concurrent_sync too
+                    with self._unchanged_records_lock:
+                        logged = (
+                            self.log_unchanged_records
+                            or self._unchanged_records_logged[model_name] < self.unchanged_records_sample_size
+                        )
+                        if logged:
+                            self._unchanged_records_logged[model_name] += 1
+                    self.sync_log_writer.count_unchanged(model_name, logged=logged)
+                    if not logged:
+                        return event_dict
+
+                # Defer the lookup so that all objects in a batch of log entries can be resolved together.
+                self.sync_log_writer.add(
+                    action=event_dict["action"] or SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                    diff=event_dict["diffs"] if event_dict["action"] else None,
+                    status=event_dict["status"],
+                    message=event_dict["event"],
+                    object_repr=f"{model_name} {unique_id}",
+                    unresolved_object=(model_name, unique_id),
+                )
+                return event_dict
+
+            synced_object = self._resolve_objects(model_name, [unique_id]).get(unique_id)
+            object_repr = repr(synced_object) if synced_object else f"{model_name} {unique_id}"
             self.sync_log(
                 action=event_dict["action"] or SyncLogEntryActionChoices.ACTION_NO_CHANGE,
                 diff=event_dict["diffs"] if event_dict["action"] else None,
@@ -262,9 +663,19 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
         """Initialize a Job."""
         super().__init__()
         self.sync = None
+        self.metrics = None
         self.kwargs = {}
         self.commit = False
         self.diff = None
+        self.sync_log_writer = None
+        self._lookup_cache = {}
+        self.references = ReferenceCache()
+        self._unchanged_records_logged = Counter()
+        self._unchanged_records_lock = threading.Lock()
+        self.identical_records = Counter()
+        self.fingerprints_match = False
+        self.changed_since = None
+        self.high_water_mark = None
         self.source_adapter = None
         self.target_adapter = None
         # Default diffsync flags. You can overwrite them at any time.
@@ -292,6 +703,71 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
         """The system or data source being modified by this sync."""
         return getattr(cls.Meta, "data_target", cls.name)
 
+    @classproperty
+    def concurrent_load(cls):
+        """Whether to load the source and target adapters concurrently rather than one after the other."""
+        return getattr(cls.Meta, "concurrent_load", False)
+
+    @classproperty
+    def log_unchanged_records(cls):
+        """Whether each record with no changes should get a SyncLogEntry, rather than only being counted."""
+        return getattr(cls.Meta, "log_unchanged_records", True)
+
+    @classproperty
+    def unchanged_records_sample_size(cls):
+        """Number of unchanged records per model type to log individually when `log_unchanged_records` is False."""
+        return getattr(cls.Meta, "unchanged_records_sample_size", 0)
+
+    @classproperty
+    def skip_identical_records(cls):
+        """Whether to skip diffing records whose content hashes are identical in the source and target adapters."""
+        return getattr(cls.Meta, "skip_identical_records", False)
+
+    @classproperty
+    def fingerprint_partition_keys(cls):
+        """Mapping of top-level model type to the attribute by which its records are grouped for fingerprinting."""
+        return getattr(cls.Meta, "fingerprint_partition_keys", {})
+
+    @classproperty
+    def incremental_load(cls):
+        """Whether to load only data changed since the previous successful sync, apart from periodic full syncs."""
+        return getattr(cls.Meta, "incremental_load", False)
+
+    @classproperty
+    def full_sync_interval(cls):
+        """Maximum time between full syncs when `incremental_load` is enabled."""
+        return getattr(cls.Meta, "full_sync_interval", timedelta(days=1))
+
+    @classproperty
+    def concurrent_sync(cls):
+        """Whether to synchronize the diffs of independent top-level model types concurrently."""
+        return getattr(cls.Meta, "concurrent_sync", False)
+
+    @classproperty
+    def sync_dependencies(cls):
+        """Mapping of top-level model type to the model types that must be synchronized before it."""
+        return getattr(cls.Meta, "sync_dependencies", {})
+
+    @classproperty
+    def concurrent_sync_workers(cls):
+        """Maximum number of model types to synchronize at once when `concurrent_sync` is enabled."""
+        return getattr(cls.Meta, "concurrent_sync_workers", 4)
+
+    @classproperty
+    def sync_transaction_size(cls):
+        """Number of changes to apply per atomic transaction, or None to not batch changes into transactions."""
+        return getattr(cls.Meta, "sync_transaction_size", None)
+
+    @classproperty
+    def sync_change_savepoints(cls):
+        """Whether to make each change within a savepoint when applying the changes of a diff in transactions."""
+        return getattr(cls.Meta, "sync_change_savepoints", False)
+
+    @classproperty
+    def sync_log_batch_size(cls):
+        """Number of SyncLogEntry records to buffer in memory before writing them to the database."""
+        return getattr(cls.Meta, "sync_log_batch_size", 1000)
+
     @classproperty
     def data_source_icon(cls):
         """Icon corresponding to the data_source."""
@@ -312,6 +788,9 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
             start_time=timezone.now(),
             diff={},
         )
+        self.sync_log_writer = SyncLogEntryWriter(
+            self.sync, batch_size=self.sync_log_batch_size, resolver=self._resolve_objects
+        )
 
         # Add _structlog_to_sync_log_entry as a processor for structlog calls from DiffSync
         structlog.configure(
@@ -329,10 +808,16 @@ class DataSyncBaseJob(BaseJob):  # pylint: disable=too-many-instance-attributes
         # they'll be caught by the Nautobot core run_job() function, which will trigger a database
         # rollback, which will delete our above created Sync record!
         try:
-            self.sync_data()
+            try:
+                self.sync_data()
+            finally:
+                # Write out any buffered log entries, whether or not the sync completed successfully.
+                self.flush_sync_log()
         except Exception as exc:  # pylint: disable=broad-except
             stacktrace = traceback.format_exc()
             self.log_failure(message=f"An exception occurred: `{type(exc).__name__}: {exc}`\n```\n{stacktrace}\n```")
+        finally:
+            self.sync_log_writer = None
 
 
 # pylint: disable=abstract-method
@@ -2,24 +2,25 @@
 # Skip colon check for multiple statements on one line.
 # flake8: noqa: E701
 
-from typing import Optional, Mapping
+from typing import Optional
 from uuid import UUID
 from django.contrib.contenttypes.models import ContentType
 from django.templatetags.static import static
 from django.urls import reverse
+from django.utils.dateparse import parse_datetime
 
 from nautobot.dcim.models import Region, Site
 from nautobot.ipam.models import Prefix
 from nautobot.tenancy.models import Tenant
-from nautobot.extras.jobs import Job, StringVar
+from nautobot.extras.jobs import BooleanVar, Job, StringVar
 from nautobot.extras.models import Status
 
-from diffsync import DiffSync, DiffSyncModel
+from diffsync import DiffSyncModel
 from diffsync.enum import DiffSyncFlags
 
-import requests
-
+from nautobot_ssot.adapters import AsyncRestAdapter, NautobotBulkAdapter, load_queryset
 from nautobot_ssot.jobs.base import DataMapping, DataSource, DataTarget
+from nautobot_ssot.rest_client import RestBulkWriter, RestClient
 
 
 # In a more complex Job, you would probably want to move the DiffSyncModel subclasses into a separate Python module(s).
@@ -96,16 +97,18 @@ class RegionRemoteModel(RegionModel):
             ids (dict): Initial values for this model's _identifiers
             attrs (dict): Initial values for this model's _attributes
         """
-        diffsync.post(
-            "/api/dcim/regions/",
+        model = super().create(diffsync, ids=ids, attrs=attrs)
+        diffsync.bulk_writer.create(
+            "api/dcim/regions/",
             {
                 "name": ids["name"],
                 "slug": attrs["slug"],
                 "description": attrs["description"],
                 "parent": {"name": attrs["parent_name"]} if attrs["parent_name"] else None,
             },
+            model,
         )
-        return super().create(diffsync, ids=ids, attrs=attrs)
+        return model
 
     def update(self, attrs):
         """Update an existing Region record in remote Nautobot.
@@ -123,12 +126,12 @@ class RegionRemoteModel(RegionModel):
                 data["parent"] = {"name": attrs["parent_name"]}
             else:
                 data["parent"] = None
-        self.diffsync.patch(f"/api/dcim/regions/{self.pk}/", data)
+        self.diffsync.bulk_writer.update("api/dcim/regions/", self.pk, data, self)
         return super().update(attrs)
 
     def delete(self):
         """Delete an existing Region record from remote Nautobot."""
-        self.diffsync.delete(f"/api/dcim/regions/{self.pk}/")
+        self.diffsync.bulk_writer.delete("api/dcim/regions/", self.pk, self)
         return super().delete()
 
 
@@ -144,8 +147,9 @@ class SiteRemoteModel(SiteModel):
             ids (dict): Initial values for this model's _identifiers
             attrs (dict): Initial values for this model's _attributes
         """
-        diffsync.post(
-            "/api/dcim/sites/",
+        model = super().create(diffsync, ids=ids, attrs=attrs)
+        diffsync.bulk_writer.create(
+            "api/dcim/sites/",
             {
                 "name": ids["name"],
                 "slug": attrs["slug"],
@@ -153,8 +157,9 @@ class SiteRemoteModel(SiteModel):
                 "status": attrs["status_slug"],
                 "region": {"name": attrs["region_name"]} if attrs["region_name"] else None,
             },
+            model,
         )
-        return super().create(diffsync, ids=ids, attrs=attrs)
+        return model
 
     def update(self, attrs):
         """Update an existing Site record in remote Nautobot.
@@ -174,12 +179,12 @@ class SiteRemoteModel(SiteModel):
                 data["region"] = {"name": attrs["region_name"]}
             else:
                 data["region"] = None
-        self.diffsync.patch(f"/api/dcim/sites/{self.pk}/", data)
+        self.diffsync.bulk_writer.update("api/dcim/sites/", self.pk, data, self)
         return super().update(attrs)
 
     def delete(self):
         """Delete an existing Site record from remote Nautobot."""
-        self.diffsync.delete(f"/api/dcim/sites/{self.pk}/")
+        self.diffsync.bulk_writer.delete("api/dcim/sites/", self.pk, self)
         return super().delete()
 
 
@@ -195,19 +200,21 @@ class PrefixRemoteModel(PrefixModel):
             ids (dict): Initial values for this model's _identifiers
             attrs (dict): Initial values for this model's _attributes
         """
-        diffsync.post(
-            "/api/ipam/prefixes/",
+        model = super().create(diffsync, ids=ids, attrs=attrs)
+        diffsync.bulk_writer.create(
+            "api/ipam/prefixes/",
             {
                 "prefix": ids["prefix"],
                 "tenant": {"slug": ids["tenant_slug"]} if ids["tenant_slug"] else None,
                 "description": attrs["description"],
                 "status": attrs["status_slug"],
             },
+            model,
         )
-        return super().create(diffsync, ids=ids, attrs=attrs)
+        return model
 
     def update(self, attrs):
-        """Update an existing Site record in remote Nautobot.
+        """Update an existing Prefix record in remote Nautobot.
 
         Args:
             attrs (dict): Updated values for this record's _attributes
@@ -217,17 +224,20 @@ class PrefixRemoteModel(PrefixModel):
             data["description"] = attrs["description"]
         if "status_slug" in attrs:
             data["status"] = attrs["status_slug"]
-        self.diffsync.patch(f"/api/dcim/sites/{self.pk}/", data)
+        self.diffsync.bulk_writer.update("api/ipam/prefixes/", self.pk, data, self)
         return super().update(attrs)
 
     def delete(self):
-        """Delete an existing Site record from remote Nautobot."""
-        self.diffsync.delete(f"/api/dcim/sites/{self.pk}/")
+        """Delete an existing Prefix record from remote Nautobot."""
+        self.diffsync.bulk_writer.delete("api/ipam/prefixes/", self.pk, self)
         return super().delete()
 
 
 class RegionLocalModel(RegionModel):
-    """Implementation of Region create/update/delete methods for updating local Nautobot data."""
+    """Implementation of Region create/update/delete methods for updating local Nautobot data.
+
+    Changes are queued with the adapter's NautobotBulkWriter, to be written to the database in bulk.
+    """
 
     @classmethod
     def create(cls, diffsync, ids, attrs):
@@ -244,9 +254,10 @@ class RegionLocalModel(RegionModel):
             description=attrs["description"],
         )
         if attrs["parent_name"]:
-            region.parent = Region.objects.get(name=attrs["parent_name"])
-        region.validated_save()
-        return super().create(diffsync, ids=ids, attrs=attrs)
+            region.parent_id = diffsync.bulk_writer.resolve(Region, "name", attrs["parent_name"])
+        model = super().create(diffsync, ids=ids, attrs={**attrs, "pk": region.pk})
+        diffsync.bulk_writer.create(region, model)
+        return model
 
     def update(self, attrs):
         """Update an existing Region record in local Nautobot.
@@ -254,27 +265,27 @@ class RegionLocalModel(RegionModel):
         Args:
             attrs (dict): Updated values for any of this model's _attributes
         """
-        region = Region.objects.get(name=self.name)
-
-        for attr_name in ("slug", "description"):
-            if attr_name in attrs:
-                setattr(region, attr_name, attrs[attr_name])
-
+        values = {attr_name: attrs[attr_name] for attr_name in ("slug", "description") if attr_name in attrs}
         if "parent_name" in attrs:
-            region.parent = Region.objects.get(name=attrs["parent_name"])
-
-        region.validated_save()
+            values["parent_id"] = (
+                self.diffsync.bulk_writer.resolve(Region, "name", attrs["parent_name"])
+                if attrs["parent_name"]
+                else None
+            )
+        self.diffsync.bulk_writer.update(Region, self.pk, self, **values)
         return super().update(attrs)
 
     def delete(self):
         """Delete an existing Region record from local Nautobot."""
-        region = Region.objects.get(name=self.name)
-        region.delete()
+        self.diffsync.bulk_writer.delete(Region, self.pk, self)
         return super().delete()
 
 
 class SiteLocalModel(SiteModel):
-    """Implementation of Site create/update/delete methods for updating local Nautobot data."""
+    """Implementation of Site create/update/delete methods for updating local Nautobot data.
+
+    Changes are queued with the adapter's NautobotBulkWriter, to be written to the database in bulk.
+    """
 
     @classmethod
     def create(cls, diffsync, ids, attrs):
@@ -286,11 +297,12 @@ class SiteLocalModel(SiteModel):
             attrs (dict): Initial values for this model's _attributes
         """
         site = Site(name=ids["name"], slug=attrs["slug"], description=attrs["description"])
-        site.status = Status.objects.get(slug=attrs["status_slug"])
+        site.status_id = diffsync.bulk_writer.resolve(Status, "slug", attrs["status_slug"])
         if attrs["region_name"]:
-            site.region = Region.objects.get(name=attrs["region_name"])
-        site.validated_save()
-        return super().create(diffsync, ids=ids, attrs=attrs)
+            site.region_id = diffsync.bulk_writer.resolve(Region, "name", attrs["region_name"])
+        model = super().create(diffsync, ids=ids, attrs={**attrs, "pk": site.pk})
+        diffsync.bulk_writer.create(site, model)
+        return model
 
     def update(self, attrs):
         """Update an existing Site record in local Nautobot.
@@ -298,30 +310,40 @@ class SiteLocalModel(SiteModel):
         Args:
             attrs (dict): Updated values for any of this model's _attributes
         """
-        site = Site.objects.get(name=self.name)
-
-        for attr_name in ("slug", "description"):
-            if attr_name in attrs:
-                setattr(site, attr_name, attrs[attr_name])
-
+        values = {attr_name: attrs[attr_name] for attr_name in ("slug", "description") if attr_name in attrs}
         if "status_slug" in attrs:
-            site.status = Status.objects.get(slug=attrs["status_slug"])
-
+            values["status_id"] = self.diffsync.bulk_writer.resolve(Status, "slug", attrs["status_slug"])
         if "region_name" in attrs:
-            site.region = Region.objects.get(name=attrs["region_name"])
-
-        site.validated_save()
+            values["region_id"] = (
+                self.diffsync.bulk_writer.resolve(Region, "name", attrs["region_name"])
+                if attrs["region_name"]
+                else None
+            )
+        self.diffsync.bulk_writer.update(Site, self.pk, self, **values)
         return super().update(attrs)
 
     def delete(self):
         """Delete an existing Site record from local Nautobot."""
-        site = Site.objects.get(name=self.name)
-        site.delete()
+        self.diffsync.bulk_writer.delete(Site, self.pk, self)
         return super().delete()
 
 
 class PrefixLocalModel(PrefixModel):
-    """Implementation of Prefix create/update/delete methods for updating local Nautobot data."""
+    """Implementation of Prefix create/update/delete methods for updating local Nautobot data.
+
+    Changes are queued with the adapter's NautobotBulkWriter, to be written to the database in bulk.
+    """
+
+    @staticmethod
+    def get_status_pk(diffsync, status_slug):
+        """Get or create the Status with the given slug, making sure that it is applicable to Prefixes."""
+        if status_slug not in diffsync.prefix_status_pks:
+            status_pk = diffsync.bulk_writer.references.get_or_create(
+                Status, "slug", status_slug, defaults={"name": status_slug}
+            )
+            Status.objects.get(pk=status_pk).content_types.add(ContentType.objects.get_for_model(Prefix))
+            diffsync.prefix_status_pks[status_slug] = status_pk
+        return diffsync.prefix_status_pks[status_slug]
 
     @classmethod
     def create(cls, diffsync, ids, attrs):
@@ -334,20 +356,13 @@ class PrefixLocalModel(PrefixModel):
         """
         prefix = Prefix(prefix=ids["prefix"], description=attrs["description"])
         if ids["tenant_slug"]:
-            tenant_obj, _ = Tenant.objects.get_or_create(
-                slug=ids["tenant_slug"],
-                defaults={"name": ids["tenant_slug"]},
+            prefix.tenant_id = diffsync.bulk_writer.references.get_or_create(
+                Tenant, "slug", ids["tenant_slug"], defaults={"name": ids["tenant_slug"]}
             )
-            prefix.tenant = tenant_obj
-
-        status_obj, _ = Status.objects.get_or_create(
-            slug=attrs["status_slug"],
-            defaults={"name": attrs["status_slug"]},
-        )
-        status_obj.content_types.add(ContentType.objects.get_for_model(Prefix))
-        prefix.status = status_obj
-        prefix.validated_save()
-        return super().create(diffsync, ids=ids, attrs=attrs)
+        prefix.status_id = cls.get_status_pk(diffsync, attrs["status_slug"])
+        model = super().create(diffsync, ids=ids, attrs={**attrs, "pk": prefix.pk})
+        diffsync.bulk_writer.create(prefix, model)
+        return model
 
     def update(self, attrs):
         """Update an existing Prefix record in local Nautobot.
@@ -355,35 +370,29 @@ class PrefixLocalModel(PrefixModel):
         Args:
             attrs (dict): Updated values for any of this model's _attributes
         """
-        prefix = Prefix.objects.get(prefix=self.prefix, tenant__slug=self.tenant_slug)
-        for attr_name in ("description",):
-            if attr_name in attrs:
-                setattr(prefix, attr_name, attrs[attr_name])
-
+        values = {attr_name: attrs[attr_name] for attr_name in ("description",) if attr_name in attrs}
         if "status_slug" in attrs:
-            status_obj, _ = Status.objects.get_or_create(
-                defaults={"name": attrs["status_slug"]},
-            )
-            status_obj.content_types.add(ContentType.objects.get_for_model(Prefix))
-            prefix.status = status_obj
-        prefix.validated_save()
+            values["status_id"] = self.get_status_pk(self.diffsync, attrs["status_slug"])
+        self.diffsync.bulk_writer.update(Prefix, self.pk, self, **values)
         return super().update(attrs)
 
     def delete(self):
         """Delete an existing Prefix record from local Nautobot."""
-        prefix = Prefix.objects.get(prefix=self.prefix, tenant__slug=self.tenant_slug)
-        prefix.delete()
+        self.diffsync.bulk_writer.delete(Prefix, self.pk, self)
         return super().delete()
 
 
 # In a more complex Job, you would probably want to move each DiffSync subclass into a separate Python module.
 
 
-class NautobotRemote(DiffSync):
+class NautobotRemote(AsyncRestAdapter):
     """DiffSync adapter class for loading data from a remote Nautobot instance using Python requests.
 
     In a more realistic example, you'd probably use PyNautobot here instead of raw requests,
     but we didn't want to add PyNautobot as a dependency of this plugin just to make an example more realistic.
+    Requests are made through a RestClient, which pools connections, and all pages of Regions, Sites and Prefixes
+    are fetched concurrently, as the base AsyncRestAdapter class provides. Changes to remote data are queued with a
+    RestBulkWriter and sent to Nautobot's bulk create, update and delete endpoints, many objects per request.
     """
 
     # Model classes used by this adapter class
@@ -394,6 +403,13 @@ class NautobotRemote(DiffSync):
     # Top-level class labels, i.e. those classes that are handled directly rather than as children of other models
     top_level = ("region", "site", "prefix")
 
+    # REST API endpoints from which each of the above classes are loaded
+    endpoints = {
+        "region": "api/dcim/regions/",
+        "site": "api/dcim/sites/",
+        "prefix": "api/ipam/prefixes/",
+    }
+
     def __init__(self, *args, url=None, token=None, job=None, **kwargs):
         """Instantiate this class, but do not load data immediately from the remote system.
 
@@ -412,73 +428,65 @@ class NautobotRemote(DiffSync):
             "Accept": "application/json",
             "Authorization": f"Token {self.token}",
         }
+        self.client = RestClient(self.url, headers=self.headers)
+        self.bulk_writer = RestBulkWriter(self.client, job=job)
+        # Latest `last_updated` timestamp of any record loaded, according to the remote Nautobot instance's clock
+        self.last_updated = None
 
-    def _get_api_data(self, url_path: str) -> Mapping:
-        """Returns data from a url_path using pagination."""
-        data = requests.get(f"{self.url}/{url_path}", headers=self.headers, params={"limit": 0}).json()
-        result_data = data["results"]
-        while data["next"]:
-            data = requests.get(data["next"], headers=self.headers, params={"limit": 0}).json()
-            result_data.extend(data["results"])
-        return result_data
+    def load(self, changed_since=None):  # pylint: disable=arguments-renamed
+        """Load Region, Site and Prefix data from the remote Nautobot instance.
 
-    def load(self):
-        """Load Region and Site data from the remote Nautobot instance."""
-        for region_entry in self._get_api_data("api/dcim/regions/"):
-            region = self.region(
-                name=region_entry["name"],
-                slug=region_entry["slug"],
-                description=region_entry["description"],
-                parent_name=region_entry["parent"]["name"] if region_entry["parent"] else None,
-                pk=region_entry["id"],
+        Args:
+            changed_since (datetime): If set, only load records last updated at or after this point in time,
+                according to the remote Nautobot instance's clock.
+        """
+        super().load({"last_updated__gte": changed_since.isoformat()} if changed_since else None)
+
+    def load_record(self, model_name, entry):
+        """Build and add a Region, Site or Prefix model from a record returned by the remote Nautobot REST API."""
+        if model_name == "region":
+            model = self.region(
+                name=entry["name"],
+                slug=entry["slug"],
+                description=entry["description"],
+                parent_name=entry["parent"]["name"] if entry["parent"] else None,
+                pk=entry["id"],
             )
-            self.add(region)
-            self.job.log_debug(message=f"Loaded {region} from remote Nautobot instance")
-
-        for site_entry in self._get_api_data("api/dcim/sites/"):
-            site = self.site(
-                name=site_entry["name"],
-                slug=site_entry["slug"],
-                status_slug=site_entry["status"]["value"],
-                region_name=site_entry["region"]["name"] if site_entry["region"] else None,
-                description=site_entry["description"],
-                pk=site_entry["id"],
+        elif model_name == "site":
+            model = self.site(
+                name=entry["name"],
+                slug=entry["slug"],
+                status_slug=entry["status"]["value"],
+                region_name=entry["region"]["name"] if entry["region"] else None,
+                description=entry["description"],
+                pk=entry["id"],
             )
-            self.add(site)
-            self.job.log_debug(message=f"Loaded {site} from remote Nautobot instance")
-
-        for prefix_entry in self._get_api_data("api/ipam/prefixes/"):
-            prefix = self.prefix(
-                prefix=prefix_entry["prefix"],
-                description=prefix_entry["description"],
-                status_slug=prefix_entry["status"]["value"],
-                tenant_slug=prefix_entry["tenant"]["slug"] if prefix_entry["tenant"] else "",
-                pk=prefix_entry["id"],
+        else:
+            model = self.prefix(
+                prefix=entry["prefix"],
+                description=entry["description"],
+                status_slug=entry["status"]["value"],
+                tenant_slug=entry["tenant"]["slug"] if entry["tenant"] else "",
+                pk=entry["id"],
             )
-            self.add(prefix)
-            self.job.log_debug(message=f"Loaded {prefix} from remote Nautobot instance")
-
-    def post(self, path, data):
-        """Send an appropriately constructed HTTP POST request."""
-        response = requests.post(f"{self.url}{path}", headers=self.headers, json=data)
-        response.raise_for_status()
-        return response
+        self.add(model)
+        last_updated = parse_datetime(entry["last_updated"]) if entry.get("last_updated") else None
+        if last_updated and (self.last_updated is None or last_updated > self.last_updated):
+            self.last_updated = last_updated
+        self.job.log_debug(message=f"Loaded {model} from remote Nautobot instance")
 
-    def patch(self, path, data):
-        """Send an appropriately constructed HTTP PATCH request."""
-        response = requests.patch(f"{self.url}{path}", headers=self.headers, json=data)
-        response.raise_for_status()
-        return response
+    def sync_complete(self, source, diff, flags=DiffSyncFlags.NONE, logger=None):
+        """Send any changes still queued once synchronization to the remote Nautobot instance is complete."""
+        self.bulk_writer.flush()
+        super().sync_complete(source, diff, flags=flags, logger=logger)
 
-    def delete(self, path):
-        """Send an appropriately constructed HTTP DELETE request."""
-        response = requests.delete(f"{self.url}{path}", headers=self.headers)
-        response.raise_for_status()
-        return response
 
+class NautobotLocal(NautobotBulkAdapter):
+    """DiffSync adapter class for loading data from the local Nautobot instance.
 
-class NautobotLocal(DiffSync):
-    """DiffSync adapter class for loading data from the local Nautobot instance."""
+    Changes to the local data are queued, and written in batches, as per NautobotBulkAdapter. They are only written
+    with bulk queries, which record no change log entries, if the Job's `bulk_write` option is selected.
+    """
 
     # Model classes used by this adapter class
     region = RegionLocalModel
@@ -488,52 +496,66 @@ class NautobotLocal(DiffSync):
     # Top-level class labels, i.e. those classes that are handled directly rather than as children of other models
     top_level = ("region", "site", "prefix")
 
-    def __init__(self, *args, job=None, **kwargs):
+    def __init__(self, *args, **kwargs):
         """Instantiate this class, but do not load data immediately from the local system."""
         super().__init__(*args, **kwargs)
-        self.job = job
+        # Statuses already made applicable to Prefixes, by slug
+        self.prefix_status_pks = {}
 
     def load(self):
-        """Load Region and Site data from the local Nautobot instance."""
-        for region in Region.objects.all():
-            region_model = self.region(
-                name=region.name,
-                slug=region.slug,
-                description=region.description,
-                parent_name=region.parent.name if region.parent else None,
-                pk=region.pk,
-            )
-            self.add(region_model)
-            self.job.log_debug(message=f"Loaded {region_model} from local Nautobot instance")
-
-        for site in Site.objects.all():
-            site_model = self.site(
-                name=site.name,
-                slug=site.slug,
-                status_slug=site.status.slug,
-                region_name=site.region.name if site.region else None,
-                description=site.description,
-                pk=site.pk,
-            )
-            self.add(site_model)
-            self.job.log_debug(message=f"Loaded {site_model} from local Nautobot instance")
-
-        for prefix in Prefix.objects.all():
-            prefix_model = self.prefix(
-                prefix=str(prefix.prefix),
-                description=prefix.description,
-                status_slug=prefix.status.slug,
-                tenant_slug=prefix.tenant.slug if prefix.tenant else "",
-                pk=prefix.pk,
-            )
-            self.add(prefix_model)
-            self.job.log_debug(message=f"Loaded {prefix_model} from local Nautobot instance")
+        """Load Region, Site and Prefix data from the local Nautobot instance, with one database query for each."""
+        count = load_queryset(self, "region", Region.objects.all(), lookups={"parent_name": "parent__name", "pk": "pk"})
+        self.job.log_debug(message=f"Loaded {count} regions from local Nautobot instance")
+
+        count = load_queryset(
+            self,
+            "site",
+            Site.objects.all(),
+            lookups={"status_slug": "status__slug", "region_name": "region__name", "pk": "pk"},
+        )
+        self.job.log_debug(message=f"Loaded {count} sites from local Nautobot instance")
+
+        count = load_queryset(
+            self,
+            "prefix",
+            Prefix.objects.all(),
+            lookups={
+                # Prefix.prefix is a property, computed from the underlying network and prefix_length columns
+                "prefix": ("network", "prefix_length", lambda network, prefix_length: f"{network}/{prefix_length}"),
+                "tenant_slug": ("tenant__slug", lambda slug: slug or ""),
+                "status_slug": "status__slug",
+                "pk": "pk",
+            },
+        )
+        self.job.log_debug(message=f"Loaded {count} prefixes from local Nautobot instance")
 
 
 # The actual Data Source and Data Target Jobs are relatively simple to implement
 # once you have the above DiffSync scaffolding in place.
 
 
+def lookup_example_objects(model_name, unique_ids):
+    """Look up the local Nautobot objects corresponding to the given DiffSync model name and unique IDs.
+
+    Shared by both example Jobs to implement the `lookup_objects()` API; each call runs a single database query.
+    """
+    if model_name == "region":
+        return {region.name: region for region in Region.objects.filter(name__in=unique_ids)}
+    if model_name == "site":
+        return {site.name: site for site in Site.objects.filter(name__in=unique_ids)}
+    if model_name == "prefix":
+        # Prefix unique_ids are of the form "<prefix>__<tenant_slug>", with an empty tenant_slug if no tenant
+        unique_ids = set(unique_ids)
+        networks = {unique_id.split("__")[0].split("/")[0] for unique_id in unique_ids}
+        results = {}
+        for prefix in Prefix.objects.filter(network__in=networks).select_related("tenant"):
+            unique_id = f"{prefix.prefix}__{prefix.tenant.slug if prefix.tenant else ''}"
+            if unique_id in unique_ids:
+                results[unique_id] = prefix
+        return results
+    return {}
+
+
 class ExampleDataSource(DataSource, Job):
     """Sync Region and Site data from a remote Nautobot instance into the local Nautobot instance."""
 
@@ -541,6 +563,10 @@ class ExampleDataSource(DataSource, Job):
         description="Remote Nautobot instance to load Sites and Regions from", default="https://demo.nautobot.com"
     )
     source_token = StringVar(description="REST API authentication token for remote Nautobot instance", default="a" * 40)
+    bulk_write = BooleanVar(
+        description="Write changes to local Nautobot data in bulk; faster, but records no change log entries",
+        default=False,
+    )
 
     def __init__(self):
         """Initialize ExampleDataSource."""
@@ -554,6 +580,9 @@ class ExampleDataSource(DataSource, Job):
         description = 'Example "data source" Job for loading data into Nautobot from another system.'
         data_source = "Nautobot (remote)"
         data_source_icon = static("img/nautobot_logo.png")
+        # To only load the Regions, Sites and Prefixes changed since the last sync, apart from a full sync twice a day:
+        # incremental_load = True
+        # full_sync_interval = timedelta(hours=12)
 
     @classmethod
     def data_mappings(cls):
@@ -567,33 +596,19 @@ class ExampleDataSource(DataSource, Job):
     def load_source_adapter(self):
         """Method to instantiate and load the SOURCE adapter into `self.source_adapter`."""
         self.source_adapter = NautobotRemote(url=self.kwargs["source_url"], token=self.kwargs["source_token"], job=self)
-        self.source_adapter.load()
+        self.source_adapter.load(changed_since=self.changed_since)
+        if self.incremental_load:
+            # Only changes up to the latest one loaded are known to have been loaded, per the remote system's clock
+            self.high_water_mark = self.source_adapter.last_updated or self.changed_since
 
     def load_target_adapter(self):
         """Method to instantiate and load the TARGET adapter into `self.target_adapter`."""
-        self.target_adapter = NautobotLocal(job=self)
+        self.target_adapter = NautobotLocal(job=self, bulk_write=self.kwargs.get("bulk_write", False))
         self.target_adapter.load()
 
-    def lookup_object(self, model_name, unique_id):
-        """Look up a Nautobot object based on the DiffSync model name and unique ID."""
-        if model_name == "region":
-            try:
-                return Region.objects.get(name=unique_id)
-            except Region.DoesNotExist:
-                pass
-        elif model_name == "site":
-            try:
-                return Site.objects.get(name=unique_id)
-            except Site.DoesNotExist:
-                pass
-        elif model_name == "prefix":
-            try:
-                return Prefix.objects.get(
-                    prefix=unique_id.split("__")[0], tenant__slug=unique_id.split("__")[1] or None
-                )
-            except Prefix.DoesNotExist:
-                pass
-        return None
+    def lookup_objects(self, model_name, unique_ids):
+        """Look up Nautobot objects based on the DiffSync model name and unique IDs, one query per call."""
+        return lookup_example_objects(model_name, unique_ids)
 
 
 class ExampleDataTarget(DataTarget, Job):
@@ -614,6 +629,8 @@ class ExampleDataTarget(DataTarget, Job):
         description = 'Example "data target" Job for syncing data from Nautobot to another system'
         data_target = "Nautobot (remote)"
         data_target_icon = static("img/nautobot_logo.png")
+        concurrent_sync = True
+        sync_dependencies = {"site": ["region"]}
 
     @classmethod
     def data_mappings(cls):
@@ -634,23 +651,6 @@ class ExampleDataTarget(DataTarget, Job):
         self.target_adapter = NautobotRemote(url=self.kwargs["target_url"], token=self.kwargs["target_token"], job=self)
         self.target_adapter.load()
 
-    def lookup_object(self, model_name, unique_id):
-        """Look up a Nautobot object based on the DiffSync model name and unique ID."""
-        if model_name == "region":
-            try:
-                return Region.objects.get(name=unique_id)
-            except Region.DoesNotExist:
-                pass
-        elif model_name == "site":
-            try:
-                return Site.objects.get(name=unique_id)
-            except Site.DoesNotExist:
-                pass
-        elif model_name == "prefix":
-            try:
-                return Prefix.objects.get(
-                    prefix=unique_id.split("__")[0], tenant__slug=unique_id.split("__")[1] or None
-                )
-            except Prefix.DoesNotExist:
-                pass
-        return None
+    def lookup_objects(self, model_name, unique_ids):
+        """Look up Nautobot objects based on the DiffSync model name and unique IDs, one query per call."""
+        return lookup_example_objects(model_name, unique_ids)
@@ -0,0 +1,188 @@
+"""Buffered writing of SyncLogEntry records produced during a data sync."""
+
+from collections import Counter, defaultdict
+import threading
+
+from django.utils.timezone import now
+
+from .choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from .models import SyncLogEntry
+
+
+class SyncLogEntryWriter:
+    """Collect SyncLogEntry records in memory and write them to the database in batches.
+
+    Creating each SyncLogEntry as soon as it is logged costs one INSERT round-trip per synced object,
+    which for large syncs comes to dominate the time spent logging. Entries added to this writer are instead
+    held in memory until `batch_size` of them have accumulated (or until `flush()` is called explicitly)
+    and are then written out with a single `bulk_create()`.
+
+    Entries may also be added with an unresolved `(model_name, unique_id)` reference to their synced object, in which
+    case all such references in a batch are resolved together, one query per model type, just before writing.
+
+    The entry logged for a change can later be marked as failed with `mark_failed()`, for example if the change was
+    only queued when it was logged, and writing it out failed; entries that have already been written are updated
+    on the next flush.
+
+    Records with no changes can additionally be counted per model type with `count_unchanged()`, whether or not
+    they also get a log entry of their own; these counts are applied to the Sync's statistics on each flush.
+
+    Entries may be added from any thread, but are only flushed automatically in the thread that created the writer,
+    as other threads have database connections of their own, which cannot see the (uncommitted) Sync record.
+    Automatic flushing can also be turned off altogether by setting `auto_flush` to False, for example while
+    changes are being made in a transaction that may be rolled back.
+    """
+
+    def __init__(self, sync, batch_size=1000, resolver=None):
+        """Create a writer for log entries belonging to the given Sync.
+
+        Args:
+            sync (Sync): Sync record that all log entries written by this instance belong to.
+            batch_size (int): Number of entries to accumulate before automatically flushing them.
+            resolver (callable): Function `(model_name, unique_ids) -> {unique_id: object}` used to look up
+                the synced objects referenced by entries added with `unresolved_object`.
+        """
+        self.sync = sync
+        self.batch_size = batch_size
+        self.resolver = resolver
+        self._pending = []
+        # Entry (if pending) or primary key (if written) of the entry logged for each change to a synced object
+        self._changes = {}
+        self._failed = []
+        self._unchanged_by_model = Counter()
+        self._unlogged_unchanged = 0
+        self._lock = threading.Lock()
+        self._thread_id = threading.get_ident()
+        self.auto_flush = True
+
+    def __len__(self):
+        """Number of log entries currently buffered and not yet written."""
+        return len(self._pending)
+
+    def add(  # pylint: disable=too-many-arguments
+        self,
+        action,
+        status,
+        message="",
+        diff=None,
+        synced_object=None,
+        object_repr="",
+        unresolved_object=None,
+    ):
+        """Buffer a new log entry, flushing the buffer to the database if it is full.
+
+        Arguments are as per `DataSyncBaseJob.sync_log()`, plus `unresolved_object`, an optional
+        `(model_name, unique_id)` pair identifying the synced object, to be looked up by `self.resolver`
+        when the entry is written, in place of `synced_object`.
+        """
+        if synced_object and not object_repr:
+            object_repr = repr(synced_object)
+
+        entry = SyncLogEntry(
+            sync=self.sync,
+            # Stamped with the time of the event, not the (possibly much later) time it's written out
+            timestamp=now(),
+            action=action,
+            status=status,
+            message=message,
+            diff=diff,
+            synced_object=synced_object,
+            object_repr=object_repr,
+        )
+        with self._lock:
+            self._pending.append((entry, unresolved_object))
+            if unresolved_object is not None and action != SyncLogEntryActionChoices.ACTION_NO_CHANGE:
+                self._changes[(*unresolved_object, action)] = entry
+            full = len(self._pending) >= self.batch_size
+        if full and self.auto_flush and threading.get_ident() == self._thread_id:
+            self.flush()
+
+    def mark_failed(self, unresolved_object, action, status, message):
+        """Mark the successful entry logged for a change to the given object as having failed after all.
+
+        Args:
+            unresolved_object (tuple): `(model_name, unique_id)` pair identifying the synced object, as given to `add()`.
+            action (str): Action of the change, as given to `add()`.
+            status (str): New status of the entry.
+            message (str): New message of the entry.
+
+        Returns:
+            bool: Whether an entry was logged for the change; if not, nothing is marked.
+        """
+        with self._lock:
+            logged = self._changes.get((*unresolved_object, action))
+            if logged is None:
+                return False
+            if isinstance(logged, SyncLogEntry):
+                if logged.status == SyncLogEntryStatusChoices.STATUS_SUCCESS:
+                    logged.status = status
+                    logged.message = message
+            else:
+                # Already written, so update it on the next flush, in the thread that can see it
+                self._failed.append((logged, status, message))
+        return True
+
+    def count_unchanged(self, model_name, logged=True, count=1):
+        """Count record(s) of the given model type that had no changes.
+
+        Args:
+            model_name (str): DiffSyncModel type of the unchanged record(s).
+            logged (bool): Whether these records also have their own log entries, which are counted separately.
+            count (int): Number of unchanged records to count.
+        """
+        with self._lock:
+            self._unchanged_by_model[model_name] += count
+            if not logged:
+                self._unlogged_unchanged += count
+
+    def flush(self):
+        """Write all buffered log entries to the database, and update the Sync's statistics accordingly."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            unchanged_by_model, self._unchanged_by_model = self._unchanged_by_model, Counter()
+            unlogged_unchanged, self._unlogged_unchanged = self._unlogged_unchanged, 0
+            failed, self._failed = self._failed, []
+            for entry, unresolved_object in pending:
+                key = (*unresolved_object, entry.action) if unresolved_object is not None else None
+                if self._changes.get(key) is entry:
+                    self._changes[key] = entry.pk
+        entries = [entry for entry, _ in pending]
+        if pending:
+            self._resolve_synced_objects(pending)
+            for entry in entries:
+                # bulk_create() doesn't call save(), which would otherwise do this
+                entry.search_text = entry.get_search_text()
+            SyncLogEntry.objects.bulk_create(entries, batch_size=self.batch_size)
+        for pk, status, message in failed:
+            entry = SyncLogEntry.objects.filter(pk=pk, status=SyncLogEntryStatusChoices.STATUS_SUCCESS).first()
+            if entry is not None:
+                entry.status = status
+                entry.message = message
+                entry.save()
+                self.sync.update_status_statistics(SyncLogEntryStatusChoices.STATUS_SUCCESS, status)
+        if entries or unchanged_by_model:
+            self.sync.update_statistics(
+                entries, unlogged_unchanged=unlogged_unchanged, unchanged_by_model=unchanged_by_model
+            )
+
+    def _resolve_synced_objects(self, pending):
+        """Look up the synced objects for any pending entries that reference one by model name and unique_id."""
+        if self.resolver is None:
+            return
+
+        unique_ids_by_model = defaultdict(set)
+        for _, unresolved_object in pending:
+            if unresolved_object is not None:
+                model_name, unique_id = unresolved_object
+                unique_ids_by_model[model_name].add(unique_id)
+
+        resolved = {
+            model_name: self.resolver(model_name, unique_ids) for model_name, unique_ids in unique_ids_by_model.items()
+        }
+        for entry, unresolved_object in pending:
+            if unresolved_object is not None:
+                model_name, unique_id = unresolved_object
+                synced_object = resolved[model_name].get(unique_id)
+                if synced_object is not None:
+                    entry.synced_object = synced_object
+                    entry.object_repr = repr(synced_object)
@@ -0,0 +1,59 @@
+"""Recording of per-phase performance metrics on a Sync."""
+
+import tracemalloc
+
+
+class SyncMetricsRecorder:
+    """Record the duration and memory usage of each phase of a data sync on its Sync record.
+
+    Each metric is saved with `update_fields`, so that only the affected columns are written to the database,
+    rather than the entire Sync record being rewritten after every phase.
+
+    Phases are identified by name ("source_load", "target_load", "diff", "sync"), corresponding to
+    the `<phase>_time`, `<phase>_memory_final` and `<phase>_memory_peak` fields of the Sync model.
+    """
+
+    def __init__(self, sync):
+        """Create a recorder for metrics of the given Sync."""
+        self.sync = sync
+
+    def _save(self, **values):
+        """Set the given field values on the Sync and write just those fields to the database."""
+        for field, value in values.items():
+            setattr(self.sync, field, value)
+        self.sync.save(update_fields=list(values))
+
+    def record_time(self, phase, duration):
+        """Record the duration of the given phase.
+
+        Args:
+            phase (str): Name of the phase.
+            duration (timedelta): Wall-clock time taken by the phase.
+        """
+        self._save(**{f"{phase}_time": duration})
+
+    def record_times(self, **durations):
+        """Record the durations of several phases at once, given as keyword arguments keyed by phase name."""
+        self._save(**{f"{phase}_time": duration for phase, duration in durations.items()})
+
+    def record_model_times(self, durations):
+        """Record the duration of synchronizing each model type, given as a dict of model type to timedelta."""
+        self._save(sync_times_by_model={model: duration.total_seconds() for model, duration in durations.items()})
+
+    def record_memory(self, *phases):
+        """Record the current traced memory usage against the given phase(s), then reset the memory traces.
+
+        If more than one phase is given, for example because the phases ran concurrently, their combined
+        memory usage is recorded for each of them.
+
+        Returns:
+            tuple: (memory_final, memory_peak) in bytes
+        """
+        memory_final, memory_peak = tracemalloc.get_traced_memory()
+        values = {}
+        for phase in phases:
+            values[f"{phase}_memory_final"] = memory_final
+            values[f"{phase}_memory_peak"] = memory_peak
+        self._save(**values)
+        tracemalloc.clear_traces()
+        return memory_final, memory_peak
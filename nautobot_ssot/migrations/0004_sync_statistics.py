@@ -0,0 +1,80 @@
+# Generated by Django 3.2.16 on 2026-10-18 09:12
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+ACTION_STATISTICS = {
+    "no-change": "num_unchanged",
+    "create": "num_created",
+    "update": "num_updated",
+    "delete": "num_deleted",
+}
+STATUS_STATISTICS = {
+    "success": "num_succeeded",
+    "failure": "num_failed",
+    "error": "num_errored",
+}
+
+
+def backfill_statistics(apps, schema_editor):
+    """Populate the new Sync statistics fields from the existing SyncLogEntry records."""
+    Sync = apps.get_model("nautobot_ssot", "Sync")
+    SyncLogEntry = apps.get_model("nautobot_ssot", "SyncLogEntry")
+
+    statistics = defaultdict(dict)
+    for field_name, mapping in (("action", ACTION_STATISTICS), ("status", STATUS_STATISTICS)):
+        rows = SyncLogEntry.objects.order_by().values("sync", field_name).annotate(count=models.Count("id"))
+        for row in rows:
+            if row[field_name] in mapping:
+                statistics[row["sync"]][mapping[row[field_name]]] = row["count"]
+
+    for sync_pk, values in statistics.items():
+        Sync.objects.filter(pk=sync_pk).update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_ssot", "0003_alter_synclogentry_textfields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="num_created",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_deleted",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_errored",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_failed",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_succeeded",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_unchanged",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_updated",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_statistics, migrations.RunPython.noop),
+    ]
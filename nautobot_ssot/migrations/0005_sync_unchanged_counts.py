@@ -0,0 +1,20 @@
+# Generated by Django 3.2.16 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_ssot", "0004_sync_statistics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="unchanged_counts",
+            field=models.JSONField(
+                blank=True, default=dict, editable=False, help_text="Number of unchanged records of each model type"
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 3.2.16 on 2026-10-18 14:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_ssot", "0005_sync_unchanged_counts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncDiffElement",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("index", models.PositiveIntegerField(help_text="Position of this element within the diff")),
+                ("model_type", models.CharField(max_length=255)),
+                ("name", models.TextField()),
+                ("action", models.CharField(blank=True, max_length=32)),
+                ("diff", models.JSONField()),
+                (
+                    "sync",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="diff_elements",
+                        related_query_name="diff_element",
+                        to="nautobot_ssot.sync",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["sync", "index"],
+                "unique_together": {("sync", "index")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="syncdiffelement",
+            index=models.Index(fields=["sync", "model_type", "index"], name="nautobot_ss_sync_id_f8a2e7_idx"),
+        ),
+    ]
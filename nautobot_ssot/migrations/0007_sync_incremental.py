@@ -0,0 +1,27 @@
+# Generated by Django 3.2.16 on 2026-10-18 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_ssot", "0006_syncdiffelement"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="changed_since",
+            field=models.DateTimeField(
+                blank=True, null=True, help_text="If set, only data changed since this point in time was loaded"
+            ),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="high_water_mark",
+            field=models.DateTimeField(
+                blank=True, null=True, help_text="Point in time up to which all changes to the data were loaded"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.16 on 2026-10-18 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_ssot", "0007_sync_incremental"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="sync_times_by_model",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Seconds taken to synchronize each model type, if model types were synchronized concurrently",
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 3.2.16 on 2026-10-18 18:40
+
+from django.db import DatabaseError, migrations, models, transaction
+
+
+def backfill_search_text(apps, schema_editor):
+    """Populate the new search_text field of the existing SyncLogEntry records, in a single query."""
+    if schema_editor.connection.vendor == "postgresql":
+        diff_text = "diff::text"
+    elif schema_editor.connection.vendor == "mysql":
+        diff_text = "CAST(diff AS CHAR)"
+    else:
+        return
+    schema_editor.execute(
+        "UPDATE nautobot_ssot_synclogentry "
+        f"SET search_text = LOWER(CONCAT_WS(' ', object_repr, message, COALESCE({diff_text}, '')))"
+    )
+
+
+def create_search_index(apps, schema_editor):
+    """On PostgreSQL, index the search_text field with a GIN trigram index, so that substring searches can use it.
+
+    This requires the pg_trgm extension; if it isn't installed and the database user may not install it, searches
+    still work, but without an index.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError:
+        return
+    schema_editor.execute(
+        "CREATE INDEX nautobot_ssot_synclogentry_search_text_trgm "
+        "ON nautobot_ssot_synclogentry USING gin (search_text gin_trgm_ops)"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    """Drop the index created by create_search_index(), if any."""
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS nautobot_ssot_synclogentry_search_text_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_ssot", "0008_sync_times_by_model"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="synclogentry",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 3.2.16 on 2026-10-18 19:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_ssot", "0009_synclogentry_search_text"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="sync",
+            index=models.Index(fields=["source", "target", "start_time"], name="nautobot_ssot_sync_src_tgt_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="sync",
+            index=models.Index(fields=["target", "start_time"], name="nautobot_ssot_sync_tgt_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["sync", "timestamp", "id"], name="nautobot_ssot_sle_sync_ts_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["timestamp", "id"], name="nautobot_ssot_sle_ts_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["sync", "action"], name="nautobot_ssot_sle_action_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["sync", "status"], name="nautobot_ssot_sle_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["synced_object_type", "synced_object_id"], name="nautobot_ssot_sle_object_idx"),
+        ),
+    ]
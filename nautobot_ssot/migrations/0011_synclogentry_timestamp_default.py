@@ -0,0 +1,19 @@
+# Generated by Django 3.2.16 on 2026-10-19 09:10
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_ssot", "0010_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="synclogentry",
+            name="timestamp",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -15,8 +15,13 @@ The interaction between these models and Nautobot's native JobResult model deser
     which have a different set of content requirements, but is used for high-level status reporting.
 
 JobResult 1<->1 Sync 1-->n SyncLogEntry
+                 Sync 1-->n SyncDiffElement
 """
+from collections import Counter
 from datetime import timedelta
+import functools
+import json
+import operator
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -33,6 +38,20 @@ from nautobot.extras.utils import extras_features
 from .choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
 
 
+# Mapping of SyncLogEntry.action and SyncLogEntry.status values to the corresponding Sync statistics fields
+ACTION_STATISTICS = {
+    SyncLogEntryActionChoices.ACTION_NO_CHANGE: "num_unchanged",
+    SyncLogEntryActionChoices.ACTION_CREATE: "num_created",
+    SyncLogEntryActionChoices.ACTION_UPDATE: "num_updated",
+    SyncLogEntryActionChoices.ACTION_DELETE: "num_deleted",
+}
+STATUS_STATISTICS = {
+    SyncLogEntryStatusChoices.STATUS_SUCCESS: "num_succeeded",
+    SyncLogEntryStatusChoices.STATUS_FAILURE: "num_failed",
+    SyncLogEntryStatusChoices.STATUS_ERROR: "num_errored",
+}
+
+
 @extras_features(
     "custom_links",
 )
@@ -59,10 +78,35 @@ class Sync(BaseModel):
     diff_memory_peak = models.PositiveBigIntegerField(blank=True, null=True)
     sync_memory_final = models.PositiveBigIntegerField(blank=True, null=True)
     sync_memory_peak = models.PositiveBigIntegerField(blank=True, null=True)
+    sync_times_by_model = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Seconds taken to synchronize each model type, if model types were synchronized concurrently",
+    )
+
+    # Statistics about the SyncLogEntry records of this Sync, maintained as they are written
+    num_unchanged = models.PositiveIntegerField(default=0, editable=False)
+    num_created = models.PositiveIntegerField(default=0, editable=False)
+    num_updated = models.PositiveIntegerField(default=0, editable=False)
+    num_deleted = models.PositiveIntegerField(default=0, editable=False)
+    num_succeeded = models.PositiveIntegerField(default=0, editable=False)
+    num_failed = models.PositiveIntegerField(default=0, editable=False)
+    num_errored = models.PositiveIntegerField(default=0, editable=False)
+    unchanged_counts = models.JSONField(
+        default=dict, blank=True, editable=False, help_text="Number of unchanged records of each model type"
+    )
 
     dry_run = models.BooleanField(
         default=False, help_text="Report what data would be synced but do not make any changes"
     )
+    changed_since = models.DateTimeField(
+        blank=True, null=True, help_text="If set, only data changed since this point in time was loaded"
+    )
+    high_water_mark = models.DateTimeField(
+        blank=True, null=True, help_text="Point in time up to which all changes to the data were loaded"
+    )
+    # Diffs are now stored as SyncDiffElement records; this field is only populated by Syncs that predate those.
     diff = models.JSONField(blank=True)
 
     job_result = models.ForeignKey(to=JobResult, on_delete=models.PROTECT, blank=True, null=True)
@@ -71,6 +115,10 @@ class Sync(BaseModel):
         """Metaclass attributes of Sync model."""
 
         ordering = ["start_time"]
+        indexes = [
+            models.Index(fields=["source", "target", "start_time"], name="nautobot_ssot_sync_src_tgt_idx"),
+            models.Index(fields=["target", "start_time"], name="nautobot_ssot_sync_tgt_idx"),
+        ]
 
     def __str__(self):
         """String representation of a Sync instance."""
@@ -82,25 +130,179 @@ class Sync(BaseModel):
 
     @classmethod
     def annotated_queryset(cls):
-        """Construct an efficient queryset for this model and related data."""
-        return (
-            cls.objects.defer("diff")
-            .select_related("job_result")
-            .prefetch_related("logs")
-            .annotate(
-                num_unchanged=models.Count(
-                    "log", filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_NO_CHANGE)
-                ),
-                num_created=models.Count("log", filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_CREATE)),
-                num_updated=models.Count("log", filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_UPDATE)),
-                num_deleted=models.Count("log", filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_DELETE)),
-                num_succeeded=models.Count(
-                    "log", filter=models.Q(log__status=SyncLogEntryStatusChoices.STATUS_SUCCESS)
-                ),
-                num_failed=models.Count("log", filter=models.Q(log__status=SyncLogEntryStatusChoices.STATUS_FAILURE)),
-                num_errored=models.Count("log", filter=models.Q(log__status=SyncLogEntryStatusChoices.STATUS_ERROR)),
-            )
+        """Construct an efficient queryset for this model and related data.
+
+        The per-Sync statistics (`num_created`, etc.) are stored on the Sync itself, so no aggregation
+        over its log entries is needed here.
+        """
+        return cls.objects.defer("diff").select_related("job_result")
+
+    @classmethod
+    def get_recent_history(cls, jobs=(), limit=10):
+        """Get the most recent Syncs run by each of the given data source and data target Jobs.
+
+        This takes three queries, however many Jobs there are: the primary keys of the most recent Syncs of every Job
+        are fetched together, as a UNION of one indexed query each, then those Syncs themselves, and then the total
+        number of Syncs of all the Jobs, grouped in one query. A Job's Syncs are those recorded by its JobResults,
+        so Jobs with the same data source and data target names don't show each other's Syncs.
+
+        Args:
+            jobs (Iterable[type]): DataSource and DataTarget Job classes.
+            limit (int): Maximum number of Syncs to get for each Job.
+
+        Returns:
+            dict: Mapping of the `class_path` of each Job to a tuple of the list of its most recent Syncs,
+                newest first, and the total number of its Syncs.
+        """
+        filters = {
+            job.class_path: models.Q(source=job.data_source, target=job.data_target, job_result__name=job.class_path)
+            for job in jobs
+        }
+        if not filters:
+            return {}
+
+        recent = [
+            cls.objects.filter(job_filter).order_by("-start_time").values_list("pk")[:limit]
+            for job_filter in filters.values()
+        ]
+        pks = [pk for pk, in recent[0].union(*recent[1:], all=True)]
+        syncs = sorted(
+            cls.annotated_queryset().filter(pk__in=pks),
+            # As in order_by("-start_time") on PostgreSQL, Syncs that haven't started yet come first
+            key=lambda sync: (sync.start_time is None, sync.start_time or 0),
+            reverse=True,
+        )
+        counts = dict(
+            cls.objects.filter(functools.reduce(operator.or_, filters.values()))
+            .order_by()
+            .values_list("job_result__name")
+            .annotate(count=models.Count("id"))
+        )
+
+        history = {class_path: ([], counts.get(class_path, 0)) for class_path in filters}
+        for sync in syncs:
+            history[sync.job_result.name][0].append(sync)
+        return history
+
+    def update_statistics(self, entries, unlogged_unchanged=0, unchanged_by_model=None):
+        """Increment this Sync's statistics to account for the given newly created SyncLogEntry records.
+
+        The database is updated atomically with F() expressions, and the in-memory values likewise,
+        so that a later `save()` of this instance doesn't overwrite them with stale values.
+
+        Args:
+            entries (Iterable[SyncLogEntry]): Newly created log entries.
+            unlogged_unchanged (int): Number of additional unchanged (and successful) records that have no log entry.
+            unchanged_by_model (dict): Number of unchanged records of each model type, logged or not.
+        """
+        counts = Counter()
+        for entry in entries:
+            counts[ACTION_STATISTICS.get(entry.action)] += 1
+            counts[STATUS_STATISTICS.get(entry.status)] += 1
+        counts.pop(None, None)
+        if unlogged_unchanged:
+            counts["num_unchanged"] += unlogged_unchanged
+            counts["num_succeeded"] += unlogged_unchanged
+
+        updates = {field: models.F(field) + count for field, count in counts.items()}
+        if unchanged_by_model:
+            unchanged_counts = Counter(self.unchanged_counts)
+            unchanged_counts.update(unchanged_by_model)
+            self.unchanged_counts = updates["unchanged_counts"] = dict(unchanged_counts)
+        if not updates:
+            return
+
+        Sync.objects.filter(pk=self.pk).update(**updates)
+        for field, count in counts.items():
+            setattr(self, field, getattr(self, field) + count)
+
+    def update_status_statistics(self, old_status, new_status, count=1):
+        """Move the given number of already-counted SyncLogEntry records from one status to another in the statistics.
+
+        As with `update_statistics()`, the database and in-memory values are both updated.
+        """
+        old_field, new_field = STATUS_STATISTICS[old_status], STATUS_STATISTICS[new_status]
+        if old_field == new_field:
+            return
+        Sync.objects.filter(pk=self.pk).update(
+            **{old_field: models.F(old_field) - count, new_field: models.F(new_field) + count}
         )
+        setattr(self, old_field, getattr(self, old_field) - count)
+        setattr(self, new_field, getattr(self, new_field) + count)
+
+    def store_diff(self, elements, batch_size=1000):
+        """Store the given diff as SyncDiffElement records belonging to this Sync.
+
+        Args:
+            elements (Iterable[tuple]): `(model_type, name, diff)` for each top-level element of the diff,
+                where `diff` is the dictionary representation of that element and its children.
+            batch_size (int): Number of records to create per query.
+        """
+        batch = []
+        for index, (model_type, name, diff) in enumerate(elements):
+            batch.append(
+                SyncDiffElement(
+                    sync=self,
+                    index=index,
+                    model_type=model_type,
+                    name=name,
+                    action=SyncDiffElement.action_from_diff(diff),
+                    diff=diff,
+                )
+            )
+            if len(batch) >= batch_size:
+                SyncDiffElement.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            SyncDiffElement.objects.bulk_create(batch)
+
+    def get_diff(self, model_type=None):
+        """Get the dictionary representation of this Sync's diff, optionally limited to a single model type."""
+        if self.diff:
+            if model_type is None:
+                return self.diff
+            return {model_type: self.diff[model_type]} if model_type in self.diff else {}
+
+        elements = self.diff_elements.all()
+        if model_type is not None:
+            elements = elements.filter(model_type=model_type)
+        result = {}
+        for element in elements.iterator():
+            result.setdefault(element.model_type, {})[element.name] = element.diff
+        return result
+
+    def get_diff_elements(self, model_type, changed_only=False):
+        """Get the `(name, diff)` of each top-level diff element of the given model type, in order.
+
+        The result can be sliced and counted, so that it can be paginated without retrieving every element.
+
+        Args:
+            model_type (str): Model type of the elements to get.
+            changed_only (bool): Only get the elements that have changes of their own, not just changes to children.
+        """
+        if self.diff:
+            elements = list(self.diff.get(model_type, {}).items())
+            if changed_only:
+                elements = [(name, diff) for name, diff in elements if SyncDiffElement.action_from_diff(diff)]
+            return elements
+
+        elements = self.diff_elements.filter(model_type=model_type)
+        if changed_only:
+            elements = elements.exclude(action="")
+        return elements.values_list("name", "diff")
+
+    def get_diff_element(self, model_type, name):
+        """Get the dictionary representation of a single top-level diff element and its children, or None."""
+        if self.diff:
+            return self.diff.get(model_type, {}).get(name)
+        return self.diff_elements.filter(model_type=model_type, name=name).values_list("diff", flat=True).first()
+
+    def get_diff_summary(self):
+        """Get the number of top-level diff elements of each model type, without retrieving the diffs themselves."""
+        if self.diff:
+            return {model_type: len(children) for model_type, children in self.diff.items()}
+        rows = self.diff_elements.order_by().values("model_type").annotate(count=models.Count("id"))
+        return {row["model_type"]: row["count"] for row in rows}
 
     @property
     def duration(self):
@@ -146,7 +348,7 @@ class SyncLogEntry(BaseModel):
     """
 
     sync = models.ForeignKey(to=Sync, on_delete=models.CASCADE, related_name="logs", related_query_name="log")
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=now)
 
     action = models.CharField(max_length=32, choices=SyncLogEntryActionChoices)
     status = models.CharField(max_length=32, choices=SyncLogEntryStatusChoices)
@@ -165,11 +367,32 @@ class SyncLogEntry(BaseModel):
 
     message = models.TextField(blank=True)
 
+    # Lower-cased object_repr, message and diff, maintained by save() and by SyncLogEntryWriter, for searching.
+    # On PostgreSQL this has a GIN trigram index (created by migration 0009), so that substring searches use it.
+    search_text = models.TextField(blank=True, default="", editable=False)
+
     class Meta:
         """Metaclass attributes of SyncLogEntry."""
 
         verbose_name_plural = "sync log entries"
         ordering = ["sync", "timestamp"]
+        indexes = [
+            models.Index(fields=["sync", "timestamp", "id"], name="nautobot_ssot_sle_sync_ts_idx"),
+            models.Index(fields=["timestamp", "id"], name="nautobot_ssot_sle_ts_idx"),
+            models.Index(fields=["sync", "action"], name="nautobot_ssot_sle_action_idx"),
+            models.Index(fields=["sync", "status"], name="nautobot_ssot_sle_status_idx"),
+            models.Index(fields=["synced_object_type", "synced_object_id"], name="nautobot_ssot_sle_object_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        """Save this SyncLogEntry, updating its search text."""
+        self.search_text = self.get_search_text()
+        super().save(*args, **kwargs)
+
+    def get_search_text(self):
+        """Get the text that this SyncLogEntry is found by when searching, from its object, message and diff."""
+        diff = json.dumps(self.diff, ensure_ascii=False) if self.diff is not None else ""
+        return " ".join((self.object_repr, self.message, diff)).lower()
 
     def get_action_class(self):
         """Map self.action to a Bootstrap label class."""
@@ -187,3 +410,45 @@ class SyncLogEntry(BaseModel):
             SyncLogEntryStatusChoices.STATUS_FAILURE: "warning",
             SyncLogEntryStatusChoices.STATUS_ERROR: "danger",
         }.get(self.status)
+
+
+class SyncDiffElement(BaseModel):
+    """A single top-level element (and its children) of the diff calculated by a Sync.
+
+    Storing each element of the diff as its own record, rather than the whole diff as a single JSON blob on the Sync,
+    keeps Sync records small and allows parts of a large diff to be retrieved and displayed independently.
+    """
+
+    sync = models.ForeignKey(
+        to=Sync, on_delete=models.CASCADE, related_name="diff_elements", related_query_name="diff_element"
+    )
+    index = models.PositiveIntegerField(help_text="Position of this element within the diff")
+    model_type = models.CharField(max_length=255)
+    name = models.TextField()
+    action = models.CharField(max_length=32, choices=SyncLogEntryActionChoices, blank=True)
+    diff = models.JSONField()
+
+    class Meta:
+        """Metaclass attributes of SyncDiffElement."""
+
+        ordering = ["sync", "index"]
+        unique_together = [["sync", "index"]]
+        indexes = [models.Index(fields=["sync", "model_type", "index"])]
+
+    def __str__(self):
+        """String representation of a SyncDiffElement."""
+        return f"{self.model_type} {self.name}"
+
+    @staticmethod
+    def action_from_diff(diff):
+        """Determine the action that a diff element's dictionary representation describes, if any.
+
+        An element with no attribute changes of its own (only changes to its children) has an empty action.
+        """
+        if "+" in diff and "-" in diff:
+            return SyncLogEntryActionChoices.ACTION_UPDATE
+        if "+" in diff:
+            return SyncLogEntryActionChoices.ACTION_CREATE
+        if "-" in diff:
+            return SyncLogEntryActionChoices.ACTION_DELETE
+        return ""
@@ -0,0 +1,127 @@
+"""Keyset ("cursor") pagination of sync log entries, which stays fast however deep the page."""
+
+import base64
+import binascii
+import re
+from types import SimpleNamespace
+import uuid
+
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+def encode_cursor(timestamp, pk):
+    """Encode the position of a record in `(timestamp, pk)` order as an opaque, URL-safe string."""
+    return base64.urlsafe_b64encode(f"{timestamp.isoformat()}|{pk}".encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Decode a cursor created by `encode_cursor()` into a `(timestamp, pk)` tuple, or None if it isn't valid."""
+    try:
+        timestamp, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        timestamp = parse_datetime(timestamp)
+        pk = uuid.UUID(pk)
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+    if timestamp is None:
+        return None
+    return timestamp, pk
+
+
+class KeysetPage:
+    """A page of a queryset, newest first by `(timestamp, pk)`, found from the position of its neighbouring page.
+
+    Numbered pages are fetched with `OFFSET n`, which makes the database read and discard every record before the
+    page, and require a `COUNT(*)` of all matching records; both take longer the more records there are. A keyset
+    page is instead fetched with a condition on `(timestamp, pk)` relative to the last record of the page before it
+    (`after`) or the first record of the page after it (`before`), which an index on `timestamp` satisfies directly.
+    Pages can therefore only be stepped through in turn, not jumped to by number.
+    """
+
+    def __init__(self, queryset, per_page, after=None, before=None):
+        """Fetch the primary keys of the records of a page.
+
+        Args:
+            queryset (QuerySet): Records to paginate, which must have a `timestamp` field.
+            per_page (int): Maximum number of records per page.
+            after (str): Cursor of the last record of the previous (newer) page.
+            before (str): Cursor of the first record of the next (older) page.
+        """
+        self.per_page = per_page
+        after = decode_cursor(after) if after else None
+        before = decode_cursor(before) if before else None
+
+        if before:
+            timestamp, pk = before
+            # Fetch the records just newer than the cursor, oldest first, then put them back in newest-first order
+            rows = self._fetch(
+                queryset.filter(Q(timestamp__gt=timestamp) | Q(timestamp=timestamp, pk__gt=pk)), ("timestamp", "pk")
+            )
+            rows.reverse()
+            if len(rows) > per_page:
+                rows = rows[1:]
+                self.has_previous, self.has_next = True, True
+            else:
+                # This is the first page, so show it in full
+                rows = self._fetch(queryset, ("-timestamp", "-pk"))
+                self.has_previous, self.has_next = False, len(rows) > per_page
+                rows = rows[:per_page]
+        else:
+            if after:
+                timestamp, pk = after
+                queryset = queryset.filter(Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, pk__lt=pk))
+            rows = self._fetch(queryset, ("-timestamp", "-pk"))
+            self.has_previous, self.has_next = bool(after), len(rows) > per_page
+            rows = rows[:per_page]
+
+        self.pks = [pk for pk, _ in rows]
+        self.previous_cursor = encode_cursor(rows[0][1], rows[0][0]) if rows and self.has_previous else None
+        self.next_cursor = encode_cursor(rows[-1][1], rows[-1][0]) if rows and self.has_next else None
+
+    def _fetch(self, queryset, ordering):
+        """Fetch the `(pk, timestamp)` of one more record than fits on a page, to tell whether there are more."""
+        return list(queryset.order_by(*ordering).values_list("pk", "timestamp")[: self.per_page + 1])
+
+    def __len__(self):
+        """Get the number of records on this page."""
+        return len(self.pks)
+
+
+class KeysetTablePage:
+    """Stand-in for the page of a table showing the records of a `KeysetPage`, as given to the generic paginator.
+
+    Nautobot's generic list template always renders `inc/paginator.html` below the table, which shows numbered pages
+    and the range of records on the page, neither of which a keyset page has. This page is therefore empty as far as
+    that template is concerned, so that it only shows its form for the number of records per page, while the table
+    still gets all of its rows from `object_list`.
+    """
+
+    def __init__(self, rows, per_page):
+        """Initialize the page with the rows of the table and the number of records per page."""
+        self.object_list = rows
+        self.paginator = SimpleNamespace(per_page=per_page)
+
+    def __bool__(self):
+        """Be treated as empty by templates, to hide the range of records shown."""
+        return False
+
+
+def approximate_count(queryset, limit=10000):
+    """Count the records of a queryset cheaply, at the expense of accuracy when there are many of them.
+
+    On PostgreSQL, the number of rows estimated by the query planner is used, if it exceeds `limit`; elsewhere,
+    counting stops at `limit`.
+
+    Returns:
+        tuple: The count, and either "" if the count is exact, "about" if it is an estimate or "more than" if it
+            is a lower bound.
+    """
+    if connections[queryset.db].vendor == "postgresql":
+        match = re.search(r"rows=(\d+)", queryset.explain())
+        if match and int(match.group(1)) > limit:
+            return int(match.group(1)), "about"
+    count = queryset[: limit + 1].count()
+    if count > limit:
+        return limit, "more than"
+    return count, ""
@@ -0,0 +1,98 @@
+"""Caching of the primary keys of reference data, such as Statuses and Tenants, for resolving foreign keys."""
+
+from collections import defaultdict
+import threading
+
+
+class ReferenceCache:
+    """Cache mapping the values of a model's identifying field (such as `name` or `slug`) to primary keys.
+
+    Setting a foreign key from a name or slug, such as `site.status = Status.objects.get(slug=status_slug)`, costs
+    a query for every object synchronized, even though most of them reference the same few objects. This cache
+    instead looks up each distinct value only once (or, if `preload()` is used, all values with a single query),
+    so that foreign keys can be set from it with `site.status_id = cache.get(Status, "slug", status_slug)`.
+
+    Objects created while the cache is in use must be registered with `add()`, or the cache invalidated with
+    `invalidate()`, so that later lookups can find them. Objects can be registered before they are saved to the
+    database, so that they can be referenced by objects that are created along with them in bulk.
+
+    A cache can be shared by threads, such as those of a Job's `concurrent_sync`: its methods hold a lock, so that
+    each distinct value is still looked up (or created) only once.
+    """
+
+    def __init__(self):
+        """Create an empty cache."""
+        self._maps = {}
+        self._preloaded = set()
+        self._added = defaultdict(dict)
+        self._lock = threading.RLock()
+
+    def preload(self, model, field, queryset=None):
+        """Load the primary keys of all objects of a model into the cache, keyed by the given field, in one query.
+
+        Args:
+            model (Model): Django model class.
+            field (str): Name of the identifying field to key objects by, such as "name" or "slug".
+            queryset (QuerySet): Objects to load, if not all objects of the model.
+        """
+        queryset = model.objects.all() if queryset is None else queryset
+        with self._lock:
+            values = dict(queryset.values_list(field, "pk"))
+            values.update((getattr(obj, field), obj.pk) for obj in self._added[model].values())
+            self._maps[(model, field)] = values
+            self._preloaded.add((model, field))
+
+    def get(self, model, field, value):
+        """Get the primary key of the object of a model with the given field value.
+
+        Raises:
+            ObjectDoesNotExist: if there is no such object.
+        """
+        with self._lock:
+            if (model, field) not in self._maps:
+                self._maps[(model, field)] = {getattr(obj, field): obj.pk for obj in self._added[model].values()}
+            values = self._maps[(model, field)]
+            if value not in values:
+                if (model, field) in self._preloaded:
+                    raise model.DoesNotExist(f"{model.__name__} with {field} {value!r} does not exist")
+                values[value] = model.objects.values_list("pk", flat=True).get(**{field: value})
+            return values[value]
+
+    def get_or_create(self, model, field, value, defaults=None):
+        """Get the primary key of the object of a model with the given field value, creating it if it doesn't exist."""
+        with self._lock:
+            try:
+                return self.get(model, field, value)
+            except model.DoesNotExist:
+                instance, _ = model.objects.get_or_create(**{field: value}, defaults=defaults)
+                self.add(instance)
+                return instance.pk
+
+    def add(self, instance):
+        """Register a newly created (or about to be created) object with the cache."""
+        model = type(instance)
+        with self._lock:
+            self._added[model][instance.pk] = instance
+            for (map_model, field), values in self._maps.items():
+                if map_model is model:
+                    values[getattr(instance, field)] = instance.pk
+
+    def remove(self, instance):
+        """Unregister an object that has been (or is no longer to be) deleted (or created) from the cache."""
+        model = type(instance)
+        with self._lock:
+            self._added[model].pop(instance.pk, None)
+            for (map_model, field), values in self._maps.items():
+                if map_model is model and values.get(getattr(instance, field)) == instance.pk:
+                    del values[getattr(instance, field)]
+
+    def invalidate(self, model=None):
+        """Discard everything cached for the given model, or for all models."""
+        with self._lock:
+            for key in list(self._maps):
+                if model is None or key[0] is model:
+                    del self._maps[key]
+                    self._preloaded.discard(key)
+            for key in list(self._added):
+                if model is None or key is model:
+                    del self._added[key]
@@ -0,0 +1,438 @@
+"""Reusable clients for fetching and modifying data through a paginated REST API, such as Nautobot's own."""
+
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+
+
+class RestClient:
+    """HTTP client for a REST API that paginates its list endpoints with `limit` and `offset` query parameters.
+
+    All requests are made through a single `requests.Session`, so that connections to the API are pooled and kept
+    alive between requests, and responses are transparently decompressed. Requests failing with a connection error
+    or with a transient HTTP status (429 or 5xx) are retried a bounded number of times, with exponential backoff;
+    by default only idempotent requests (GET, PUT, DELETE, etc.) are retried, as a retried POST or PATCH could be
+    applied twice.
+
+    `get_all()` first fetches a single page of a list endpoint to learn the total `count` of records, then fetches
+    all remaining pages concurrently, rather than following each page's `next` link one after another.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self, url, headers=None, timeout=30, retries=3, backoff_factor=0.5, page_size=1000, max_workers=4
+    ):  # pylint: disable=too-many-arguments
+        """Create a client for the REST API at the given base URL.
+
+        Args:
+            url (str): Base URL of the API, to which the path of each request is appended.
+            headers (dict): HTTP headers to include in every request, such as for authentication.
+            timeout (float): Timeout in seconds for connecting to the API and for each read from it.
+            retries (int): Maximum number of times to retry a failed request.
+            backoff_factor (float): Base delay in seconds between retries, doubled after each retry.
+            page_size (int): Number of records to request per page of a list endpoint.
+            max_workers (int): Maximum number of pages to fetch, and of connections to keep open, concurrently.
+        """
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_workers,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=self.RETRY_STATUSES,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method, path, **kwargs):
+        """Send an HTTP request to the given path under the API's base URL, raising an exception on failure.
+
+        Keyword arguments are passed through to `requests.Session.request()`.
+
+        Returns:
+            requests.Response: Response to the request.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        response = self.session.request(method, f"{self.url}/{path.lstrip('/')}", **kwargs)
+        response.raise_for_status()
+        return response
+
+    def get(self, path, params=None):
+        """Send an HTTP GET request and return the decoded JSON response."""
+        return self.request("GET", path, params=params).json()
+
+    def post(self, path, data):
+        """Send an HTTP POST request with the given data as JSON."""
+        return self.request("POST", path, json=data)
+
+    def patch(self, path, data):
+        """Send an HTTP PATCH request with the given data as JSON."""
+        return self.request("PATCH", path, json=data)
+
+    def delete(self, path):
+        """Send an HTTP DELETE request."""
+        return self.request("DELETE", path)
+
+    def get_all(self, path, params=None):
+        """Fetch all records from a paginated list endpoint, fetching pages after the first concurrently.
+
+        Args:
+            path (str): Path of the list endpoint under the API's base URL.
+            params (dict): Additional query parameters, such as filters, to include in the request for each page.
+
+        Returns:
+            list: All records from the `results` of every page, in order.
+        """
+        params = {**(params or {}), "limit": self.page_size, "offset": 0}
+        data = self.get(path, params)
+        results = data["results"]
+        if not data.get("next") or not results:
+            return results
+
+        # The API may cap the page size below what was requested, so page through it at whatever size it returned
+        page_size = len(results)
+        offsets = range(page_size, data["count"], page_size)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ssot-fetch") as executor:
+            pages = executor.map(
+                lambda offset: self.get(path, {**params, "limit": page_size, "offset": offset}), offsets
+            )
+            for page in pages:
+                results.extend(page["results"])
+        return results
+
+    def close(self):
+        """Close all pooled connections to the API."""
+        self.session.close()
+
+
+class RestWriter:
+    """Base class for queueing changes to objects through a REST API, to be sent once `flush()` is called.
+
+    Changes are held in memory until `batch_size` of them have been queued, or until `flush()` is called explicitly.
+    Any object that could not be written is reported to the given Job, which gives the SyncLogEntry that DiffSync
+    logged for the change as it was queued an error status instead. Changes may be queued
+    from several threads at once, such as when a Job has `concurrent_sync` enabled.
+    """
+
+    METHODS = {
+        SyncLogEntryActionChoices.ACTION_CREATE: "POST",
+        SyncLogEntryActionChoices.ACTION_UPDATE: "PATCH",
+        SyncLogEntryActionChoices.ACTION_DELETE: "DELETE",
+    }
+
+    def __init__(self, client, job=None, batch_size=100):
+        """Create a writer sending requests through the given RestClient, optionally reporting failures to a Job.
+
+        Args:
+            client (RestClient): Client for the REST API to write to.
+            job (DataSyncBaseJob): Job to report failed changes to with `sync_log_failure()`.
+            batch_size (int): Number of changes to accumulate before automatically flushing them.
+        """
+        self.client = client
+        self.job = job
+        self.batch_size = batch_size
+        self.failures = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of changes currently queued and not yet sent."""
+        raise NotImplementedError
+
+    def flush(self):
+        """Send all queued changes to the API."""
+        raise NotImplementedError
+
+    def _flush_if_full(self):
+        """Flush all queued changes if there are at least `batch_size` of them."""
+        if len(self) >= self.batch_size:
+            self.flush()
+
+    def _report_failure(self, action, item, record, error):
+        """Record a change that could not be written, and report it to the Job if any."""
+        object_repr = repr(record) if record is not None else repr(item)
+        self.failures.append((action, object_repr, error))
+        if self.job is not None:
+            self.job.sync_log_failure(
+                action=action,
+                status=SyncLogEntryStatusChoices.STATUS_ERROR,
+                message=f"Failed to {action} {object_repr}: {error}",
+                record=record,
+                object_repr=object_repr,
+            )
+
+
+class RestBulkWriter(RestWriter):
+    """Queue creates, updates and deletes of objects through a REST API, and send them in batches.
+
+    Nautobot's REST API (like many others) accepts a list of objects in a single POST, PATCH or DELETE request to a
+    list endpoint, to create, update or delete all of them at once. Changes queued with this writer are held in
+    memory until `batch_size` of them have accumulated (or until `flush()` is called explicitly), and are then sent
+    with one request per endpoint and action for every `batch_size` objects:
+
+    - Creates and updates are sent for each endpoint in the order in which the endpoints were first queued to, and
+      deletes in the reverse order, so that objects are created before objects that reference them.
+    - If a batch is rejected with a list of per-object errors, as Nautobot does, the objects without errors are
+      re-sent; otherwise each object in the batch is re-sent individually, to identify those at fault.
+    - Objects that still failed are retried for as long as other objects are being successfully written, as they
+      may reference an object created later in the same batch (for example, a child Region and its parent).
+    - Any object that could not be written is reported as a SyncLogEntry with an error status by the given Job.
+      (Successful changes have already been logged by DiffSync itself as they were queued.)
+    - Once an object has been created, the `pk` of its DiffSync model, if it has one, is set to its new `id`.
+    """
+
+    def __init__(self, client, job=None, batch_size=100):
+        """Create a writer sending up to `batch_size` objects per request through the given RestClient."""
+        super().__init__(client, job=job, batch_size=batch_size)
+        self._queues = {}
+
+    def __len__(self):
+        """Number of changes currently queued and not yet sent."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def create(self, path, data, record=None):
+        """Queue an object to be created through the given list endpoint.
+
+        Args:
+            path (str): Path of the list endpoint, such as "api/dcim/sites/".
+            data (dict): Data of the object to create.
+            record (DiffSyncModel): Corresponding DiffSync model, to identify the object in any log entry.
+        """
+        self._queue(SyncLogEntryActionChoices.ACTION_CREATE, path, data, record)
+
+    def update(self, path, pk, data, record=None):
+        """Queue the object with the given id to be updated with the given data through the given list endpoint."""
+        self._queue(SyncLogEntryActionChoices.ACTION_UPDATE, path, {"id": str(pk), **data}, record)
+
+    def delete(self, path, pk, record=None):
+        """Queue the object with the given id to be deleted through the given list endpoint."""
+        self._queue(SyncLogEntryActionChoices.ACTION_DELETE, path, {"id": str(pk)}, record)
+
+    def _queue(self, action, path, item, record):
+        """Queue a change, flushing all queued changes if there are now `batch_size` of them."""
+        with self._lock:
+            self._queues.setdefault((action, path), []).append((item, record))
+        self._flush_if_full()
+
+    def flush(self):
+        """Send all queued changes to the API."""
+        with self._lock:
+            queues, self._queues = self._queues, {}
+        paths = list(dict.fromkeys(path for _, path in queues))
+        for action in (SyncLogEntryActionChoices.ACTION_CREATE, SyncLogEntryActionChoices.ACTION_UPDATE):
+            for path in paths:
+                if (action, path) in queues:
+                    self._send(action, path, queues[(action, path)])
+        for path in reversed(paths):
+            key = (SyncLogEntryActionChoices.ACTION_DELETE, path)
+            if key in queues:
+                self._send(SyncLogEntryActionChoices.ACTION_DELETE, path, queues[key])
+
+    def _send(self, action, path, entries):
+        """Send all the given (item, record) changes to a single endpoint, retrying failures while others succeed."""
+        failures = []
+        while entries:
+            failures = []
+            for start in range(0, len(entries), self.batch_size):
+                end = start + self.batch_size
+                failures.extend(self._send_batch(action, path, entries[start:end]))
+            if len(failures) == len(entries):
+                break
+            entries = [(item, record) for item, record, _ in failures]
+        for item, record, error in failures:
+            self._report_failure(action, item, record, error)
+
+    def _send_batch(self, action, path, batch):
+        """Send a single batch of (item, record) changes, returning the (item, record, error) of any that failed."""
+        try:
+            response = self.client.request(self.METHODS[action], path, json=[item for item, _ in batch])
+        except requests.HTTPError as exc:
+            try:
+                errors = exc.response.json()
+            except ValueError:
+                errors = None
+            if not isinstance(errors, list) or len(errors) != len(batch):
+                if len(batch) == 1:
+                    return [(*batch[0], exc)]
+                # Send each change individually, to find out which of them failed
+                return [failure for entry in batch for failure in self._send_batch(action, path, [entry])]
+            failures = [(item, record, error) for (item, record), error in zip(batch, errors) if error]
+            valid = [entry for entry, error in zip(batch, errors) if not error]
+            if valid:
+                failures.extend(self._send_batch(action, path, valid))
+            return failures
+        except requests.RequestException as exc:
+            return [(item, record, exc) for item, record in batch]
+
+        if action == SyncLogEntryActionChoices.ACTION_CREATE:
+            for (_, record), result in zip(batch, response.json()):
+                if hasattr(record, "pk"):
+                    record.pk = result["id"]
+        return []
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing out calls to `wait()` to at most `rate` per second, across all threads."""
+
+    def __init__(self, rate):
+        """Create a limiter allowing `rate` calls per second."""
+        self.interval = 1 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        """Block until the next call is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _Operation:  # pylint: disable=too-few-public-methods
+    """A single queued request of a RestConcurrentWriter."""
+
+    def __init__(self, action, path, data, record, key, depends_on):  # pylint: disable=too-many-arguments
+        self.action = action
+        self.path = path
+        self.data = data
+        self.record = record
+        self.key = key
+        self.depends_on = set(depends_on) - {key}
+
+
+class RestConcurrentWriter(RestWriter):
+    """Queue creates, updates and deletes of objects through a REST API, and send them concurrently, one at a time.
+
+    For APIs without bulk endpoints, each change has to be sent with a request of its own; rather than waiting for
+    each request to complete before sending the next, as DiffSync applies changes, changes queued with this writer
+    are sent by a pool of up to `max_workers` threads at once, optionally at no more than `rate_limit` requests per
+    second in total, once `batch_size` of them have accumulated (or once `flush()` is called explicitly).
+
+    Changes that depend on others, such as the creation of a Site in a new Region, or the deletion of a Region
+    after that of its Sites, are declared by giving each change a `key` (such as the DiffSync unique ID of the
+    object) and listing the keys of the changes it depends on in `depends_on`. A change is only sent once all
+    changes it depends on, among those queued in the same flush, have completed; all other changes are independent.
+
+    Any change that could not be sent is reported as a SyncLogEntry with an error status by the given Job, from the
+    calling thread. Once an object has been created, the `pk` of its DiffSync model, if it has one, is set to its
+    new `id`.
+    """
+
+    def __init__(
+        self, client, job=None, batch_size=1000, max_workers=None, rate_limit=None
+    ):  # pylint: disable=too-many-arguments
+        """Create a writer sending requests concurrently through the given RestClient.
+
+        Args:
+            client (RestClient): Client for the REST API to write to.
+            job (DataSyncBaseJob): Job to report failed changes to with `sync_log_failure()`.
+            batch_size (int): Number of changes to accumulate before automatically flushing them.
+            max_workers (int): Maximum number of requests in progress at once; by default, the client's `max_workers`,
+                so that each request can have a pooled connection of its own.
+            rate_limit (float): Maximum number of requests to send per second, if any.
+        """
+        super().__init__(client, job=job, batch_size=batch_size)
+        self.max_workers = max_workers or client.max_workers
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self._operations = []
+
+    def __len__(self):
+        """Number of changes currently queued and not yet sent."""
+        return len(self._operations)
+
+    def create(self, path, data, record=None, key=None, depends_on=()):  # pylint: disable=too-many-arguments
+        """Queue an object to be created through the given list endpoint.
+
+        Args:
+            path (str): Path of the list endpoint, such as "api/dcim/sites/".
+            data (dict): Data of the object to create.
+            record (DiffSyncModel): Corresponding DiffSync model, to identify the object in any log entry.
+            key (Hashable): Key identifying this change, for other changes to depend on.
+            depends_on (Iterable): Keys of any other changes that must complete before this one is sent.
+        """
+        self._queue(SyncLogEntryActionChoices.ACTION_CREATE, path, data, record, key, depends_on)
+
+    def update(self, path, pk, data, record=None, key=None, depends_on=()):  # pylint: disable=too-many-arguments
+        """Queue the object with the given id under the given list endpoint to be updated with the given data."""
+        self._queue(SyncLogEntryActionChoices.ACTION_UPDATE, f"{path.rstrip('/')}/{pk}/", data, record, key, depends_on)
+
+    def delete(self, path, pk, record=None, key=None, depends_on=()):  # pylint: disable=too-many-arguments
+        """Queue the object with the given id under the given list endpoint to be deleted."""
+        self._queue(SyncLogEntryActionChoices.ACTION_DELETE, f"{path.rstrip('/')}/{pk}/", None, record, key, depends_on)
+
+    def _queue(self, action, path, data, record, key, depends_on):  # pylint: disable=too-many-arguments
+        """Queue a change, flushing all queued changes if there are now `batch_size` of them."""
+        with self._lock:
+            self._operations.append(_Operation(action, path, data, record, key, depends_on))
+        self._flush_if_full()
+
+    def flush(self):
+        """Send all queued changes to the API, as concurrently as their dependencies allow."""
+        with self._lock:
+            operations, self._operations = self._operations, []
+        pending_keys = Counter(operation.key for operation in operations if operation.key is not None)
+        ready = []
+        blocked = []
+        for operation in operations:
+            operation.depends_on &= set(pending_keys)
+            (blocked if operation.depends_on else ready).append(operation)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ssot-write") as executor:
+            running = {}
+            while ready or blocked or running:
+                if not ready and not running:
+                    # Only changes with circular dependencies remain, so send them regardless
+                    ready, blocked = blocked, []
+                running.update((executor.submit(self._send, operation), operation) for operation in ready)
+                ready = []
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    operation = running.pop(future)
+                    self._complete(operation, *future.result())
+                    if operation.key is None:
+                        continue
+                    pending_keys[operation.key] -= 1
+                    if pending_keys[operation.key]:
+                        continue
+                    del pending_keys[operation.key]
+                    for waiting in list(blocked):
+                        waiting.depends_on.discard(operation.key)
+                        if not waiting.depends_on:
+                            blocked.remove(waiting)
+                            ready.append(waiting)
+
+    def _send(self, operation):
+        """Send a single change, in a worker thread, returning its decoded response (if any) or the error raised."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+        try:
+            response = self.client.request(self.METHODS[operation.action], operation.path, json=operation.data)
+        except requests.RequestException as exc:
+            return None, exc
+        if operation.action == SyncLogEntryActionChoices.ACTION_CREATE:
+            return response.json(), None
+        return None, None
+
+    def _complete(self, operation, result, error):
+        """Handle the outcome of a single change, in the calling thread."""
+        if error is not None:
+            self._report_failure(operation.action, operation.data or operation.path, operation.record, error)
+        elif result is not None and hasattr(operation.record, "pk"):
+            operation.record.pk = result["id"]
@@ -0,0 +1,119 @@
+"""Application of DiffSync diffs to Nautobot data in batched transactions."""
+
+import contextlib
+import sys
+
+from diffsync.enum import DiffSyncFlags, DiffSyncStatus
+from diffsync.helpers import DiffSyncSyncer
+from django.db import DatabaseError, transaction
+
+
+class BatchedTransactionSyncer(DiffSyncSyncer):
+    """DiffSyncSyncer that applies the changes of a diff in atomic chunks, committing each chunk as a whole.
+
+    Outside of a transaction, each database write made by a DiffSyncModel's create/update/delete method is committed
+    on its own, so that on PostgreSQL, for example, the time taken by a large sync is dominated by per-row commits.
+    This syncer instead wraps every `batch_size` changes in a `transaction.atomic()` block of their own:
+
+    - `before_commit` is called at the end of each chunk, within its transaction, for example to write out changes
+      that the destination's models have queued (as with a NautobotBulkWriter), so that they are committed, or rolled
+      back, along with the changes that queued them. For the same reason, unlike DiffSyncSyncer, this syncer calls the
+      destination's `sync_complete()` itself, within the last transaction, if any changes were made.
+    - `on_commit` is called after each chunk completes, for example to write out buffered log entries between
+      transactions, so that they cannot be rolled back along with a later chunk.
+    - If an exception escapes a chunk, all of its changes are rolled back, and their number is kept in `rolled_back`,
+      and the `(model_type, unique_id, action)` of each successful one in `rolled_back_changes`, so that the entries
+      logged for them can be corrected. As a database error leaves a transaction unusable, any database error ends
+      (and rolls back) its chunk this way, unless `savepoints` is set: each change is then made within a savepoint of
+      its own, so that only that change is rolled back, and logged as an error (or the error re-raised, unless
+      `CONTINUE_ON_FAILURE` is set), at the cost of an extra round trip to the database for each change.
+
+    Batching only saves commits if the sync isn't already running within a transaction; if it is, as a Nautobot Job's
+    own thread is, each chunk is merely a savepoint within it.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, *args, batch_size=500, before_commit=None, on_commit=None, savepoints=False, **kwargs
+    ):
+        """Create a syncer, with arguments as per DiffSyncSyncer.
+
+        Args:
+            batch_size (int): Number of changes to make per transaction.
+            before_commit (callable): Function to call at the end of each transaction, before it is committed.
+            on_commit (callable): Function to call after each transaction has been committed.
+            savepoints (bool): Whether to make each change within a savepoint, so that a database error only rolls
+                back the change that caused it.
+        """
+        super().__init__(*args, **kwargs)
+        self.batch_size = batch_size
+        self.before_commit = before_commit
+        self.on_commit = on_commit
+        self.savepoints = savepoints
+        self.rolled_back = 0
+        self.rolled_back_changes = []
+        self._atomic = None
+        self._changes = 0
+        self._succeeded = []
+
+    def perform_sync(self) -> bool:
+        """Perform data synchronization based on the provided diff, committing every `batch_size` changes.
+
+        If any changes were made, the destination's `sync_complete()` is then called, as part of the last transaction.
+        """
+        try:
+            changed = super().perform_sync()
+            if changed:
+                self._begin_transaction()
+                self.dst_diffsync.sync_complete(self.src_diffsync, self.diff, self.flags, self.base_logger)
+            self._end_transaction()
+        except BaseException:
+            self.rolled_back = self._changes
+            self.rolled_back_changes = self._succeeded
+            self._end_transaction(*sys.exc_info())
+            raise
+        return changed
+
+    def sync_model(self, src_model, dst_model, ids, attrs):
+        """Create/update/delete the current DiffSyncModel as part of the current transaction."""
+        if self.action is None:
+            # Nothing to write
+            return super().sync_model(src_model=src_model, dst_model=dst_model, ids=ids, attrs=attrs)
+
+        self._begin_transaction()
+        try:
+            with transaction.atomic() if self.savepoints else contextlib.nullcontext():
+                result = super().sync_model(src_model=src_model, dst_model=dst_model, ids=ids, attrs=attrs)
+        except DatabaseError as exc:
+            if not self.savepoints:
+                # The transaction can't be used any further, so the rest of its changes are rolled back too
+                raise
+            self.log_sync_status(self.action, DiffSyncStatus.ERROR, str(exc))
+            if not self.flags & DiffSyncFlags.CONTINUE_ON_FAILURE:
+                raise
+            result = (True, None)
+        else:
+            self._succeeded.append((self.model_class.get_type(), self.model_class.create_unique_id(**ids), self.action))
+
+        self._changes += 1
+        if self._changes >= self.batch_size:
+            self._end_transaction()
+        return result
+
+    def _begin_transaction(self):
+        """Start a transaction, unless one has already been started."""
+        if self._atomic is None:
+            self._atomic = transaction.atomic()
+            self._atomic.__enter__()  # pylint: disable=unnecessary-dunder-call
+
+    def _end_transaction(self, exc_type=None, exc_value=None, traceback=None):
+        """Commit (or, given an exception, roll back) the current transaction, if any, then call `on_commit`."""
+        if self._atomic is not None:
+            if exc_type is None and self.before_commit is not None:
+                # If this raises, perform_sync() rolls the transaction back
+                self.before_commit()
+            atomic, self._atomic = self._atomic, None
+            self._changes = 0
+            self._succeeded = []
+            atomic.__exit__(exc_type, exc_value, traceback)
+        if exc_type is None and self.on_commit is not None:
+            self.on_commit()
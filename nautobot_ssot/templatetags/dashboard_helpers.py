@@ -12,10 +12,12 @@ register = template.Library()
 
 
 @register.inclusion_tag("nautobot_ssot/templatetags/dashboard_data.html")
-def dashboard_data(sync_worker_class, queryset, kind="source"):
-    """Render data about the sync history of a specific data-source or data-target."""
-    if kind == "source":
-        records = queryset.filter(source=sync_worker_class.data_source).order_by("-start_time")
-    else:
-        records = queryset.filter(target=sync_worker_class.data_target).order_by("-start_time")
-    return {"syncs": records[:10], "count": records.count()}
+def dashboard_data(sync_worker_class, history):
+    """Render data about the sync history of a specific data-source or data-target.
+
+    Args:
+        sync_worker_class (DataSource or DataTarget): Job class whose sync history is rendered.
+        history (dict): Recent sync history of all data sources and targets, from `Sync.get_recent_history()`.
+    """
+    syncs, count = history.get(sync_worker_class.class_path, ([], 0))
+    return {"syncs": syncs, "count": count}
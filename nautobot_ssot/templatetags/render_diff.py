@@ -31,32 +31,50 @@ def render_diff_recursive(diff):
             * device
               + ams01
     """
-    result = ""
+    parts = []
     for record_type, children in diff.items():
-        child_result = ""
-        for child, child_diffs in children.items():
-            if "+" in child_diffs and "-" not in child_diffs:
-                child_class = "diff-added"
-            elif "-" in child_diffs and "+" not in child_diffs:
-                child_class = "diff-subtracted"
-            elif not child_diffs.get("+") and not child_diffs.get("-"):
-                child_class = "diff-unchanged"
-            else:
-                child_class = "diff-changed"
-            child_result += format_html('<li class="{}">{}<ul>', child_class, child)
-
-            for attr, value in child_diffs.pop("+", {}).items():
-                child_result += format_html('<li class="diff-added">{}: {}</li>', attr, value)
-
-            for attr, value in child_diffs.pop("-", {}).items():
-                child_result += format_html('<li class="diff-subtracted">{}: {}</li>', attr, value)
-
-            if child_diffs:
-                child_result += render_diff_recursive(child_diffs)
-
-            child_result += "</ul></li>"
-        result += format_html("<li>{}<ul>{}</ul></li>", record_type, mark_safe(child_result))  # nosec
-    return result
+        child_result = "".join(render_diff_element(child, child_diffs) for child, child_diffs in children.items())
+        parts.append(format_html("<li>{}<ul>{}</ul></li>", record_type, mark_safe(child_result)))  # nosec
+    return "".join(parts)
+
+
+def get_diff_class(diff):
+    """Get the CSS class of a single diff element, from whether it was added, removed, changed or unchanged."""
+    if "+" in diff and "-" not in diff:
+        return "diff-added"
+    if "-" in diff and "+" not in diff:
+        return "diff-subtracted"
+    if not diff.get("+") and not diff.get("-"):
+        return "diff-unchanged"
+    return "diff-changed"
+
+
+@register.simple_tag
+def render_diff_element(name, diff, children_url=None):
+    """Render a single element of a DiffSync diff, and its children, to a list element, without modifying it.
+
+    If `children_url` is given, the children are not rendered, but replaced by a link to load them from that URL.
+    """
+    parts = [format_html('<li class="{}">{}<ul>', get_diff_class(diff), name)]
+    for attr, value in diff.get("+", {}).items():
+        parts.append(format_html('<li class="diff-added">{}: {}</li>', attr, value))
+    for attr, value in diff.get("-", {}).items():
+        parts.append(format_html('<li class="diff-subtracted">{}: {}</li>', attr, value))
+
+    children = {record_type: child_diffs for record_type, child_diffs in diff.items() if record_type not in ("+", "-")}
+    if children and children_url:
+        parts.append(
+            format_html(
+                '<li class="diff-fragment"><a class="diff-load" href="{}">{}</a></li>',
+                children_url,
+                ", ".join(f"{len(child_diffs)} {record_type}" for record_type, child_diffs in children.items()),
+            )
+        )
+    elif children:
+        parts.append(render_diff_recursive(children))
+
+    parts.append("</ul></li>")
+    return mark_safe("".join(parts))  # nosec
 
 
 @register.simple_tag
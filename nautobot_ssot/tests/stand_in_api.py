@@ -0,0 +1,66 @@
+"""Local stand-in for a paginated REST API, shared by the tests of REST clients and adapters."""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from urllib.parse import parse_qs, urlparse
+
+from nautobot_ssot.rest_client import RestClient
+
+
+class StandInAPIHandler(BaseHTTPRequestHandler):
+    """Serve `self.server.records` as a list endpoint paginated by `limit` and `offset`, like Nautobot's REST API."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle a GET request for a page of records."""
+        self.server.requests.append(self.path)
+        if self.server.failures:
+            self.server.failures -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        query = parse_qs(urlparse(self.path).query)
+        limit = min(int(query.get("limit", ["50"])[0]), self.server.max_page_size)
+        offset = int(query.get("offset", ["0"])[0])
+        records, end = self.server.records, offset + limit
+        body = {
+            "count": len(records),
+            "next": "next-page" if end < len(records) else None,
+            "previous": None,
+            "results": records[offset:end],
+        }
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Don't log requests to stderr."""
+
+
+class StandInAPIMixin:
+    """Test case mixin serving 95 records from a stand-in API in a background thread, with `self.client` for it.
+
+    The server's `records`, `max_page_size` (maximum number of records per page), `failures` (number of requests
+    to fail with a 503 status) and `requests` (paths requested) can be changed and inspected through `self.server`.
+    """
+
+    def setUp(self):
+        """Start a stand-in API server in a background thread."""
+        super().setUp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInAPIHandler)
+        self.server.records = [{"id": i} for i in range(95)]
+        self.server.max_page_size = 1000
+        self.server.failures = 0
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = RestClient(f"http://127.0.0.1:{self.server.server_port}/", backoff_factor=0, page_size=10)
+        self.addCleanup(self.stop_stand_in_api)
+
+    def stop_stand_in_api(self):
+        """Stop the stand-in API server."""
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,115 @@
+"""Test the reusable DiffSync adapter helpers and base classes."""
+import threading
+import unittest
+from unittest.mock import Mock
+
+from django.test import TestCase
+
+from diffsync import DiffSyncModel
+from nautobot.dcim.models import Region
+
+from nautobot_ssot.adapters import AsyncRestAdapter, load_queryset
+from nautobot_ssot.jobs.examples import NautobotLocal
+from nautobot_ssot.tests.stand_in_api import StandInAPIMixin
+
+
+class Thing(DiffSyncModel):
+    """Test model."""
+
+    _modelname = "thing"
+    _identifiers = ("id",)
+
+    id: int
+
+
+class OtherThing(Thing):
+    """Test model of another type."""
+
+    _modelname = "other_thing"
+
+
+class ThingAdapter(AsyncRestAdapter):
+    """Test adapter loading both model types from the same stand-in endpoint."""
+
+    thing = Thing
+    other_thing = OtherThing
+    top_level = ["thing", "other_thing"]
+
+    endpoints = {"thing": "api/things/", "other_thing": "api/other-things/"}
+
+    def load_record(self, model_name, entry):
+        """Build and add a model from a record."""
+        self.add(getattr(self, model_name)(id=entry["id"]))
+
+
+class LoadQuerysetTestCase(TestCase):
+    """Test the load_queryset function."""
+
+    def test_load_queryset(self):
+        """Records, including fields from related objects, are loaded with a single query."""
+        parent = Region.objects.create(name="Parent", slug="parent")
+        Region.objects.create(name="Child", slug="child", parent=parent, description="Child region")
+        adapter = NautobotLocal(job=Mock())
+
+        with self.assertNumQueries(1):
+            count = load_queryset(
+                adapter, "region", Region.objects.all(), lookups={"parent_name": "parent__name", "pk": "pk"}
+            )
+
+        self.assertEqual(count, 2)
+        child = adapter.get("region", "Child")
+        self.assertEqual(child.get_attrs(), {"slug": "child", "description": "Child region", "parent_name": "Parent"})
+        self.assertEqual(child.pk, Region.objects.get(name="Child").pk)
+        self.assertIsNone(adapter.get("region", "Parent").parent_name)
+
+
+class AsyncRestAdapterTestCase(StandInAPIMixin, unittest.TestCase):
+    """Test the AsyncRestAdapter class."""
+
+    def test_load(self):
+        """All pages of all endpoints are fetched and loaded, with the given query parameters."""
+        adapter = ThingAdapter(client=self.client, max_concurrency=3)
+        adapter.load({"q": "x"})
+        self.assertEqual(len(adapter.get_all("thing")), 95)
+        self.assertEqual(len(adapter.get_all("other_thing")), 95)
+        self.assertEqual(len(self.server.requests), 20)
+        self.assertTrue(all("q=x" in path for path in self.server.requests))
+
+    def test_load_record_error(self):
+        """An exception raised by load_record() stops the event loop's thread from fetching any more pages."""
+
+        class FailingAdapter(ThingAdapter):
+            """Test adapter failing to load any record."""
+
+            def load_record(self, model_name, entry):
+                """Fail to load the record."""
+                raise ValueError("Invalid record")
+
+        self.server.records = [{"id": i} for i in range(1000)]
+        adapter = FailingAdapter(client=self.client, max_concurrency=1)
+        with self.assertRaises(ValueError):
+            adapter.load()
+        self.assertFalse(any(thread.name.startswith("ssot-async-load") for thread in threading.enumerate()))
+        # Far fewer than the 200 pages of both endpoints were requested
+        self.assertLess(len(self.server.requests), 10)
+
+
+class AsyncRestAdapterDatabaseTestCase(StandInAPIMixin, TestCase):
+    """Test that the AsyncRestAdapter class's load_record() can use the database."""
+
+    def test_load_record_uses_database(self):
+        """Records created by load_record() are visible within the test's transaction, as it uses the same connection."""
+
+        class RegionAdapter(ThingAdapter):
+            """Test adapter creating a Region for each record loaded."""
+
+            def load_record(self, model_name, entry):
+                """Create a Region for the record, and add a model for it."""
+                Region.objects.create(name=f"{model_name} {entry['id']}", slug=f"{model_name}-{entry['id']}")
+                super().load_record(model_name, entry)
+
+        self.server.records = self.server.records[:25]
+        adapter = RegionAdapter(client=self.client)
+        adapter.load()
+        self.assertEqual(Region.objects.count(), 50)
+        self.assertEqual(len(adapter.get_all("thing")), 25)
@@ -0,0 +1,151 @@
+"""Test the NautobotBulkWriter class."""
+from unittest.mock import Mock, patch
+import uuid
+
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from nautobot.dcim.models import Region, Site
+from nautobot.extras.models import Status
+
+from nautobot_ssot.bulk_writer import NautobotBulkWriter
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.jobs.examples import NautobotLocal, SiteModel
+
+
+class NautobotBulkWriterTestCase(TestCase):
+    """Test the NautobotBulkWriter class."""
+
+    def setUp(self):
+        """Per-test setup."""
+        self.job = Mock()
+        self.writer = NautobotBulkWriter(job=self.job)
+
+    def test_create_in_dependency_order(self):
+        """Queued objects are created parents-first, whatever order they were queued in."""
+        parent = Region(name="Parent", slug="parent")
+        child = Region(name="Child", slug="child", parent=parent)
+        site = Site(name="Site", slug="site", status=Status.objects.get(slug="active"), region=child)
+        self.writer.create(site)
+        self.writer.create(child)
+        self.writer.create(parent)
+        self.assertEqual(len(self.writer), 3)
+        self.assertEqual(self.writer.resolve(Region, "name", "Child"), child.pk)
+
+        self.writer.complete()
+
+        self.assertEqual(len(self.writer), 0)
+        self.assertEqual(Site.objects.get(name="Site").region.parent.name, "Parent")
+        self.assertEqual(list(Region.objects.get(name="Parent").get_descendants()), [child])
+        self.job.sync_log_failure.assert_not_called()
+
+    def test_update_and_delete(self):
+        """Queued updates and deletes are applied, and updates to objects queued for creation are merged into them."""
+        region = Region.objects.create(name="Region", slug="region")
+        deleted = Region.objects.create(name="Deleted", slug="deleted")
+        created = Region(name="Created", slug="created")
+        self.writer.create(created)
+        self.writer.update(Region, created.pk, description="Created region")
+        self.writer.update(Region, region.pk, description="Updated region", parent=created)
+        self.writer.delete(Region, deleted.pk)
+
+        self.writer.flush()
+
+        region.refresh_from_db()
+        self.assertEqual(region.description, "Updated region")
+        self.assertEqual(region.parent.description, "Created region")
+        self.assertFalse(Region.objects.filter(pk=deleted.pk).exists())
+
+    def test_failure_reported(self):
+        """Objects that fail validation are reported to the Job, without preventing other objects being created."""
+        Region.objects.create(name="Existing", slug="existing")
+        self.writer.create(Region(name="Duplicate", slug="existing"), record="Duplicate region")
+        self.writer.create(Region(name="New", slug="new"))
+
+        self.writer.flush()
+
+        self.assertTrue(Region.objects.filter(name="New").exists())
+        self.assertFalse(Region.objects.filter(name="Duplicate").exists())
+        self.assertEqual(len(self.writer.failures), 1)
+        self.job.sync_log_failure.assert_called_once()
+        self.assertEqual(self.job.sync_log_failure.call_args[1]["action"], SyncLogEntryActionChoices.ACTION_CREATE)
+        self.assertEqual(self.job.sync_log_failure.call_args[1]["status"], SyncLogEntryStatusChoices.STATUS_ERROR)
+        self.assertEqual(self.job.sync_log_failure.call_args[1]["object_repr"], "'Duplicate region'")
+        self.assertEqual(self.job.sync_log_failure.call_args[1]["record"], "Duplicate region")
+
+    def test_foreign_key_validated(self):
+        """Objects whose foreign keys refer to objects that don't exist are reported, as are duplicates in a batch."""
+        status = Status.objects.get(slug="active")
+        self.writer.create(Site(name="Missing status", slug="missing-status", status_id=uuid.uuid4()), record="Missing")
+        self.writer.create(Site(name="Site", slug="site", status=status))
+        self.writer.create(Site(name="Same slug", slug="site", status=status), record="Duplicate")
+
+        self.writer.flush()
+
+        self.assertEqual(list(Site.objects.values_list("name", flat=True)), ["Site"])
+        self.assertEqual(
+            sorted(call[1]["record"] for call in self.job.sync_log_failure.call_args_list), ["Duplicate", "Missing"]
+        )
+
+    def test_bulk_queries(self):
+        """The example Job's local adapter, writing in bulk, syncs any number of objects in the same number of queries."""
+        query_counts = []
+        for count in (2, 20):
+            source = NautobotLocal()
+            for i in range(count):
+                source.add(
+                    SiteModel(
+                        name=f"Site {count}-{i}",
+                        slug=f"site-{count}-{i}",
+                        status_slug="active",
+                        region_name=None,
+                        description="",
+                    )
+                )
+            target = NautobotLocal(bulk_write=True)
+            with CaptureQueriesContext(connection) as queries:
+                target.sync_from(source)
+            query_counts.append(len(queries))
+            self.assertEqual(target.bulk_writer.failures, [])
+            self.assertEqual(Site.objects.filter(name__startswith=f"Site {count}-").count(), count)
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_tree_rebuilt_once(self):
+        """MPTT trees are only rebuilt on completion, and only if objects were created in bulk or moved."""
+        region = Region.objects.create(name="Region", slug="region")
+        with patch.object(Region._tree_manager, "rebuild") as rebuild:  # pylint: disable=protected-access
+            self.writer.update(Region, region.pk, description="Updated region")
+            self.writer.complete()
+            rebuild.assert_not_called()
+
+            parent = Region(name="Parent", slug="parent")
+            self.writer.create(parent)
+            self.writer.flush()
+            self.writer.update(Region, region.pk, parent_id=parent.pk)
+            self.writer.flush()
+            rebuild.assert_not_called()
+            self.writer.complete()
+            rebuild.assert_called_once()
+
+    def test_without_bulk(self):
+        """With bulk writes disabled, each object is saved individually, sending the signals used by change logging."""
+        writer = NautobotBulkWriter(job=self.job, bulk=False)
+        saved = []
+
+        def receiver(sender, instance, **kwargs):
+            saved.append(instance.name)
+
+        post_save.connect(receiver, sender=Region)
+        try:
+            region = Region.objects.create(name="Region", slug="region")
+            parent = Region(name="Parent", slug="parent")
+            writer.create(parent)
+            writer.update(Region, region.pk, parent_id=parent.pk)
+            writer.complete()
+        finally:
+            post_save.disconnect(receiver, sender=Region)
+
+        self.assertEqual(saved, ["Region", "Parent", "Region"])
+        self.assertEqual(list(Region.objects.get(name="Parent").get_descendants()), [Region.objects.get(name="Region")])
@@ -0,0 +1,53 @@
+"""Test caching of rendered diff fragments."""
+from unittest.mock import Mock
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from django.utils.timezone import now
+
+from nautobot.extras.models import Job, JobResult
+
+from nautobot_ssot.diff_cache import get_diff_cache, get_or_render_diff
+from nautobot_ssot.models import Sync
+
+
+class DiffCacheTestCase(TestCase):
+    """Test the caching of rendered diff fragments."""
+
+    def setUp(self):
+        """Per-test setup function."""
+        get_diff_cache().clear()
+        self.job_result = JobResult.objects.create(
+            name="plugins/nautobot_ssot.jobs.examples/ExampleDataSource",
+            obj_type=ContentType.objects.get_for_model(Job),
+            job_id=uuid.uuid4(),
+        )
+        self.sync = Sync.objects.create(
+            source="Example Data Source", target="Nautobot", dry_run=False, diff={}, job_result=self.job_result
+        )
+
+    def test_only_completed_syncs_are_cached(self):
+        """Fragments of the diff of a Sync are rendered every time until the Sync completes, and then only once."""
+        render = Mock(return_value="<ul></ul>")
+        get_or_render_diff(self.sync, "region", render)
+        get_or_render_diff(self.sync, "region", render)
+        self.assertEqual(render.call_count, 2)
+
+        self.job_result.completed = now()
+        self.assertEqual(get_or_render_diff(self.sync, "region", render), "<ul></ul>")
+        self.assertEqual(get_or_render_diff(self.sync, "region", render), "<ul></ul>")
+        self.assertEqual(render.call_count, 3)
+        get_or_render_diff(self.sync, "site", render)
+        self.assertEqual(render.call_count, 4)
+
+    def test_deleting_sync_invalidates_cache(self):
+        """Deleting a Sync discards the cached fragments of its diff."""
+        self.job_result.completed = now()
+        get_or_render_diff(self.sync, "region", Mock(return_value="<ul></ul>"))
+        sync_pk = self.sync.pk
+        self.sync.delete()
+        self.sync.pk = sync_pk
+        render = Mock(return_value="<ul></ul>")
+        get_or_render_diff(self.sync, "region", render)
+        render.assert_called_once()
@@ -0,0 +1,159 @@
+"""Test content hashing of DiffSync records."""
+from typing import List, Optional
+import unittest
+
+from diffsync import DiffSync, DiffSyncModel
+from diffsync.enum import DiffSyncModelFlags
+
+from nautobot_ssot.fingerprints import FingerprintTree, RecordHasher
+
+
+class Site(DiffSyncModel):
+    """Test model with children."""
+
+    _modelname = "site"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+    _children = {"device": "devices"}
+
+    name: str
+    description: Optional[str]
+    devices: List = []
+
+
+class Device(DiffSyncModel):
+    """Test child model."""
+
+    _modelname = "device"
+    _identifiers = ("name",)
+    _attributes = ("serial",)
+
+    name: str
+    serial: Optional[str]
+
+
+class Adapter(DiffSync):
+    """Test adapter."""
+
+    site = Site
+    device = Device
+    top_level = ["site"]
+
+    def load_data(self, data):
+        """Load sites and devices from a dict of {site_name: (description, {device_name: serial})}."""
+        for site_name, (description, devices) in data.items():
+            site = self.site(name=site_name, description=description)
+            self.add(site)
+            for device_name, serial in devices.items():
+                device = self.device(name=device_name, serial=serial)
+                self.add(device)
+                site.add_child(device)
+
+
+class RecordHasherTestCase(unittest.TestCase):
+    """Test the RecordHasher class."""
+
+    def hash_site(self, data, name="Site 1"):
+        """Load the given data into a new adapter and get the hash of the named site."""
+        adapter = Adapter()
+        adapter.load_data(data)
+        return RecordHasher(adapter).hash(adapter.get("site", name))
+
+    def test_hash_identical(self):
+        """Records with the same content have the same hash, regardless of the order children were added in."""
+        self.assertEqual(
+            self.hash_site({"Site 1": ("Desc", {"a": "1", "b": "2"})}),
+            self.hash_site({"Site 1": ("Desc", {"b": "2", "a": "1"})}),
+        )
+
+    def test_hash_attribute_changed(self):
+        """Records differing only in an attribute have different hashes."""
+        self.assertNotEqual(
+            self.hash_site({"Site 1": ("Desc", {})}),
+            self.hash_site({"Site 1": ("Other", {})}),
+        )
+        self.assertNotEqual(
+            self.hash_site({"Site 1": ("Desc", {})}),
+            self.hash_site({"Site 1": (None, {})}),
+        )
+
+    def test_hash_child_changed(self):
+        """Records differing only in their children have different hashes."""
+        self.assertNotEqual(
+            self.hash_site({"Site 1": ("Desc", {"a": "1"})}),
+            self.hash_site({"Site 1": ("Desc", {"a": "2"})}),
+        )
+        self.assertNotEqual(
+            self.hash_site({"Site 1": ("Desc", {"a": "1"})}),
+            self.hash_site({"Site 1": ("Desc", {"a": "1", "b": "2"})}),
+        )
+
+
+class FingerprintTreeTestCase(unittest.TestCase):
+    """Test the FingerprintTree class."""
+
+    @staticmethod
+    def load(data):
+        """Load the given data into a new adapter."""
+        adapter = Adapter()
+        adapter.load_data(data)
+        return adapter
+
+    def test_root_fingerprint(self):
+        """The root fingerprints of two adapters match only if all of their records are identical."""
+        data = {"Site 1": ("Desc", {"a": "1"}), "Site 2": ("Desc", {})}
+        self.assertEqual(FingerprintTree(self.load(data)).root, FingerprintTree(self.load(data)).root)
+        self.assertNotEqual(
+            FingerprintTree(self.load(data)).root,
+            FingerprintTree(self.load({**data, "Site 2": ("Desc", {"b": "2"})})).root,
+        )
+        self.assertEqual(FingerprintTree(self.load(data)).count_records(), {"site": 2, "device": 1})
+
+    def test_partitions(self):
+        """Records are grouped into partitions by the value of their partition key."""
+        tree = FingerprintTree(
+            self.load({"Site 1": ("Desc", {}), "Site 2": ("Desc", {}), "Site 3": ("Other", {})}),
+            partition_keys={"site": "description"},
+        )
+        self.assertEqual(set(tree.partitions["site"]), {"Desc", "Other"})
+        self.assertEqual(set(tree.records["site"]["Desc"]), {"Site 1", "Site 2"})
+
+    def test_ignore_identical(self):
+        """Only records identical on both sides are ignored, and the diff is unaffected."""
+        source = self.load(
+            {
+                "Site 1": ("Desc", {"a": "1", "b": "2"}),
+                "Site 2": ("Desc", {"c": "3", "d": "4"}),
+                "Site 3": ("Desc", {}),
+            }
+        )
+        target = self.load(
+            {
+                "Site 1": ("Desc", {"a": "1", "b": "2"}),
+                "Site 2": ("Desc", {"c": "5", "d": "4"}),
+                "Site 4": ("Desc", {}),
+            }
+        )
+        expected_diff = source.diff_to(target).dict()
+
+        identical = FingerprintTree(source).ignore_identical(FingerprintTree(target))
+
+        # Site 1 and its two devices are identical, as is device "d"; Site 2 and its device "c" differ
+        self.assertEqual(identical, {"site": 1, "device": 3})
+        for adapter in (source, target):
+            self.assertTrue(adapter.get("site", "Site 1").model_flags & DiffSyncModelFlags.IGNORE)
+            self.assertTrue(adapter.get("device", "d").model_flags & DiffSyncModelFlags.IGNORE)
+            self.assertFalse(adapter.get("site", "Site 2").model_flags & DiffSyncModelFlags.IGNORE)
+            self.assertFalse(adapter.get("device", "c").model_flags & DiffSyncModelFlags.IGNORE)
+        self.assertEqual(source.diff_to(target).dict(), expected_diff)
+
+    def test_ignore_identical_partition(self):
+        """All records in a partition with matching fingerprints are ignored."""
+        partition_keys = {"site": "description"}
+        source = self.load({"Site 1": ("Desc", {"a": "1"}), "Site 2": ("Other", {})})
+        target = self.load({"Site 1": ("Desc", {"a": "1"}), "Site 2": ("Other", {}), "Site 3": ("Other", {})})
+
+        identical = FingerprintTree(source, partition_keys).ignore_identical(FingerprintTree(target, partition_keys))
+
+        self.assertEqual(identical, {"site": 2, "device": 1})
+        self.assertFalse(target.get("site", "Site 3").model_flags & DiffSyncModelFlags.IGNORE)
@@ -1,20 +1,30 @@
 """Test the Job classes in nautobot_ssot."""
+from datetime import timedelta
 import os.path
+import threading
+import time
 from unittest.mock import Mock
 import uuid
 from django.contrib.contenttypes.models import ContentType
 
 from django.forms import HiddenInput
 from django.test import override_settings
+from django.utils import timezone
+
+from diffsync.diff import Diff, DiffElement
 
 # from django.test import TestCase
 
+from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.models import JobResult
+from nautobot.tenancy.models import Tenant
 from nautobot.utilities.testing import TransactionTestCase
 
 from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.filters import SyncLogEntryFilterSet
+from nautobot_ssot.log_writer import SyncLogEntryWriter
 from nautobot_ssot.tests.jobs import DataSyncBaseJob, DataSource, DataTarget
-from nautobot_ssot.models import SyncLogEntry
+from nautobot_ssot.models import Sync, SyncLogEntry
 
 
 @override_settings(JOBS_ROOT=os.path.join(os.path.dirname(__file__), "jobs"))
@@ -62,6 +72,188 @@ class BaseJobTestCase(TransactionTestCase):
         )
 
         self.assertEqual(2, SyncLogEntry.objects.count())
+        self.assertEqual(1, self.job.sync.num_created)
+        self.assertEqual(1, self.job.sync.num_errored)
+
+    def test_sync_log_buffered(self):
+        """Test that sync_log() buffers entries while a SyncLogEntryWriter is active."""
+        self.job.run(data={"dry_run": True, "memory_profiling": False}, commit=True)
+        self.job.sync_log_writer = SyncLogEntryWriter(self.job.sync, batch_size=2)
+
+        self.job.sync_log(
+            action=SyncLogEntryActionChoices.ACTION_CREATE,
+            status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+            message="Created AMS01",
+        )
+        self.assertEqual(0, SyncLogEntry.objects.count())
+        # Reaching the batch size writes out the whole batch
+        self.job.sync_log(
+            action=SyncLogEntryActionChoices.ACTION_UPDATE,
+            status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+        )
+        self.assertEqual(2, SyncLogEntry.objects.count())
+
+        self.job.sync_log(
+            action=SyncLogEntryActionChoices.ACTION_DELETE,
+            status=SyncLogEntryStatusChoices.STATUS_ERROR,
+        )
+        self.assertEqual(2, SyncLogEntry.objects.count())
+        logged = timezone.now()
+        time.sleep(0.01)
+        self.job.flush_sync_log()
+        self.assertEqual(3, SyncLogEntry.objects.count())
+        # Entries are stamped with the time they were logged, not the time they were written out
+        self.assertLess(SyncLogEntry.objects.get(action=SyncLogEntryActionChoices.ACTION_DELETE).timestamp, logged)
+        # Entries written in bulk can still be searched for
+        self.assertEqual(1, SyncLogEntryFilterSet({"q": "ams01"}, SyncLogEntry.objects.all()).qs.count())
+
+    def test_sync_log_failure(self):
+        """Test that sync_log_failure() marks the entry DiffSync logged for a change as failed, written or not."""
+        self.job.run(data={"dry_run": True, "memory_profiling": False}, commit=True)
+        self.job.sync_log_writer = SyncLogEntryWriter(self.job.sync)
+        for unique_id in ("a", "b"):
+            self.job.sync_log_writer.add(
+                action=SyncLogEntryActionChoices.ACTION_CREATE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                object_repr=f"region {unique_id}",
+                unresolved_object=("region", unique_id),
+            )
+        self.job.sync_log_failure(
+            action=SyncLogEntryActionChoices.ACTION_CREATE,
+            status=SyncLogEntryStatusChoices.STATUS_ERROR,
+            message="Failed to create a",
+            record=Mock(get_type=Mock(return_value="region"), get_unique_id=Mock(return_value="a")),
+        )
+        self.job.flush_sync_log()
+        self.job.sync_log_failure(
+            action=SyncLogEntryActionChoices.ACTION_CREATE,
+            status=SyncLogEntryStatusChoices.STATUS_ERROR,
+            message="Failed to create b",
+            record=Mock(get_type=Mock(return_value="region"), get_unique_id=Mock(return_value="b")),
+        )
+        self.job.flush_sync_log()
+
+        # No additional entries are logged for the failures
+        self.assertEqual(2, SyncLogEntry.objects.count())
+        for entry in SyncLogEntry.objects.all():
+            self.assertEqual(entry.status, SyncLogEntryStatusChoices.STATUS_ERROR)
+            self.assertEqual(entry.message, f"Failed to create {entry.object_repr[-1]}")
+        self.job.sync.refresh_from_db()
+        self.assertEqual(self.job.sync.num_succeeded, 0)
+        self.assertEqual(self.job.sync.num_errored, 2)
+
+        # Without a matching entry, a new one is logged
+        self.job.sync_log_failure(
+            action=SyncLogEntryActionChoices.ACTION_DELETE,
+            status=SyncLogEntryStatusChoices.STATUS_ERROR,
+            message="Failed to delete c",
+            object_repr="region c",
+        )
+        self.job.flush_sync_log()
+        self.assertEqual(3, SyncLogEntry.objects.count())
+
+    def test_unchanged_records_counted(self):
+        """Test that unchanged records are only counted, apart from a sample, if log_unchanged_records is False."""
+        self.job.run(data={"dry_run": True, "memory_profiling": False}, commit=True)
+        self.job.log_unchanged_records = False
+        self.job.unchanged_records_sample_size = 1
+        self.job.sync_log_writer = SyncLogEntryWriter(self.job.sync)
+
+        for unique_id in ("a", "b", "c"):
+            self.job._structlog_to_sync_log_entry(  # pylint: disable=protected-access
+                None,
+                "debug",
+                {
+                    "src": "source",
+                    "dst": "target",
+                    "action": None,
+                    "model": "device",
+                    "unique_id": unique_id,
+                    "diffs": {},
+                    "status": SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                    "event": "No changes to apply; no action needed",
+                },
+            )
+        self.job.flush_sync_log()
+
+        self.assertEqual(1, SyncLogEntry.objects.count())
+        self.assertEqual(3, self.job.sync.num_unchanged)
+        self.assertEqual(3, self.job.sync.num_succeeded)
+        self.assertEqual({"device": 3}, self.job.sync.unchanged_counts)
+
+    def test_lookup_objects(self):
+        """Test that lookup_objects() defaults to lookup_object() and that results are cached per Job."""
+        self.job.lookup_object = Mock(side_effect=lambda model_name, unique_id: f"{model_name}:{unique_id}")
+
+        self.assertEqual(self.job.lookup_objects("device", ["a", "b"]), {"a": "device:a", "b": "device:b"})
+        self.job.lookup_object.reset_mock()
+
+        self.assertEqual(
+            self.job._resolve_objects("device", ["a", "b"]),  # pylint: disable=protected-access
+            {"a": "device:a", "b": "device:b"},
+        )
+        self.assertEqual(self.job.lookup_object.call_count, 2)
+        # Previously resolved objects are not looked up again
+        self.job._resolve_objects("device", ["a", "b", "c"])  # pylint: disable=protected-access
+        self.assertEqual(self.job.lookup_object.call_count, 3)
+
+    def test_get_changed_since(self):
+        """Test that incremental loads start from the last successful sync's high-water mark, or are full syncs."""
+        now = timezone.now()
+        self.job.sync = Sync.objects.create(
+            source="source", target="target", dry_run=False, diff={}, job_result=self.job.job_result, start_time=now
+        )
+        # No previous full sync
+        self.assertIsNone(self.job._get_changed_since())  # pylint: disable=protected-access
+
+        def create_previous_sync(changed_since, high_water_mark, status=JobResultStatusChoices.STATUS_COMPLETED):
+            job_result = JobResult.objects.create(
+                name=self.job.job_result.name,
+                obj_type=ContentType.objects.get(app_label="extras", model="job"),
+                job_id=uuid.uuid4(),
+                status=status,
+            )
+            return Sync.objects.create(
+                source="source",
+                target="target",
+                dry_run=False,
+                diff={},
+                job_result=job_result,
+                start_time=high_water_mark,
+                changed_since=changed_since,
+                high_water_mark=high_water_mark,
+            )
+
+        create_previous_sync(None, now - timedelta(hours=3))
+        create_previous_sync(now - timedelta(hours=3), now - timedelta(hours=2))
+        create_previous_sync(now - timedelta(hours=2), now - timedelta(hours=1), JobResultStatusChoices.STATUS_FAILED)
+        self.assertEqual(self.job._get_changed_since(), now - timedelta(hours=2))  # pylint: disable=protected-access
+
+        # Last full sync is too long ago
+        self.job.full_sync_interval = timedelta(hours=3)
+        self.assertIsNone(self.job._get_changed_since())  # pylint: disable=protected-access
+
+    def test_finish_incremental_load(self):
+        """Test that a sync's high-water mark is only recorded if no record failed to sync."""
+        high_water_mark = timezone.now() - timedelta(minutes=5)
+        self.job.sync = Sync.objects.create(
+            source="source", target="target", dry_run=False, diff={}, job_result=self.job.job_result
+        )
+        self.job.high_water_mark = high_water_mark
+        self.job._finish_incremental_load()  # pylint: disable=protected-access
+        self.job.sync.refresh_from_db()
+        self.assertEqual(self.job.sync.high_water_mark, high_water_mark)
+
+        self.job.sync.high_water_mark = None
+        self.job.sync.save()
+        self.job.sync_log(
+            action=SyncLogEntryActionChoices.ACTION_CREATE,
+            status=SyncLogEntryStatusChoices.STATUS_FAILURE,
+            object_repr="failed",
+        )
+        self.job._finish_incremental_load()  # pylint: disable=protected-access
+        self.job.sync.refresh_from_db()
+        self.assertIsNone(self.job.sync.high_water_mark)
 
     def test_as_form(self):
         """Test the as_form() method."""
@@ -100,6 +292,132 @@ class BaseJobTestCase(TransactionTestCase):
         self.assertTrue(self.job.sync.dry_run)
         self.assertEqual(self.job.job_result, self.job.sync.job_result)
 
+    def test_run_memory_profiling(self):
+        """Test the run() method with memory profiling enabled."""
+        self.job.run(data={"dry_run": True, "memory_profiling": True}, commit=True)
+        sync = Sync.objects.get(pk=self.job.sync.pk)
+        self.assertIsNotNone(sync.source_load_memory_final)
+        self.assertIsNotNone(sync.target_load_memory_peak)
+        self.assertIsNotNone(sync.diff_memory_final)
+        self.assertIsNone(sync.sync_memory_final)
+
+    def test_metrics_update_fields(self):
+        """Test that recording a metric only writes the corresponding field(s) to the database."""
+        self.job.run(data={"dry_run": True, "memory_profiling": False}, commit=True)
+        self.job.sync.source = "Unsaved change"
+        self.job.metrics.record_time("sync", timedelta(seconds=5))
+        sync = Sync.objects.get(pk=self.job.sync.pk)
+        self.assertEqual(sync.sync_time, timedelta(seconds=5))
+        self.assertEqual(sync.source, self.job.data_source)
+
+    def test_run_concurrent_load(self):
+        """Test the run() method with concurrent loading of the adapters."""
+        self.job.concurrent_load = True
+        self.job.run(data={"dry_run": True, "memory_profiling": False}, commit=True)
+        self.assertIsNotNone(self.job.sync.source_load_time)
+        self.assertIsNotNone(self.job.sync.target_load_time)
+        self.assertIsNotNone(self.job.sync.diff_time)
+
+    def test_load_adapters_concurrently_failure(self):
+        """Test that an exception raised by either adapter loader is surfaced by _load_adapters_concurrently()."""
+
+        def load_target_adapter():
+            raise ValueError("Target unavailable")
+
+        self.job.load_target_adapter = load_target_adapter
+        with self.assertRaises(ValueError):
+            self.job._load_adapters_concurrently()  # pylint: disable=protected-access
+
+    def _sync_concurrently(self, dependencies, failing=()):
+        """Synchronize a diff of regions, sites and prefixes concurrently, returning the order of the model types."""
+        self.job.diff = Diff()
+        for model_type in ("region", "site", "prefix"):
+            self.job.diff.add(DiffElement(model_type, f"{model_type}1", {"name": f"{model_type}1"}))
+        self.job.sync_dependencies = dependencies
+        self.job.metrics = Mock()
+        self.job.source_adapter = Mock()
+        self.job.target_adapter = Mock()
+        synced = []
+        lock = threading.Lock()
+
+        def sync_to(target, flags, diff):  # pylint: disable=unused-argument
+            (model_type,) = diff.groups()
+            time.sleep(0.05)
+            if model_type in failing:
+                raise ValueError(f"Failed to sync {model_type}")
+            with lock:
+                synced.append(model_type)
+
+        self.job.source_adapter.sync_to.side_effect = sync_to
+        self.job._sync_model_types_concurrently()  # pylint: disable=protected-access
+        return synced
+
+    def test_sync_model_types_concurrently(self):
+        """Test that each model type is synchronized separately, after those it depends on, and timed."""
+        start = time.monotonic()
+        synced = self._sync_concurrently({"site": ["region"]})
+        self.assertLess(time.monotonic() - start, 0.15)  # region and prefix in parallel, then site
+        self.assertEqual(synced[-1], "site")
+        self.assertEqual(set(synced), {"region", "site", "prefix"})
+        durations = self.job.metrics.record_model_times.call_args[0][0]
+        self.assertEqual(set(durations), {"region", "site", "prefix"})
+
+    def test_sync_model_types_concurrently_shared_references(self):
+        """Test that model types synchronized concurrently share the Job's reference cache and unchanged counts."""
+        self.job.run(data={"dry_run": True, "memory_profiling": False}, commit=True)
+        self.job.log_unchanged_records = False
+        self.job.unchanged_records_sample_size = 1
+        self.job.sync_log_writer = SyncLogEntryWriter(self.job.sync)
+        self.job.diff = Diff()
+        for model_type in ("region", "prefix"):
+            self.job.diff.add(DiffElement(model_type, f"{model_type}1", {"name": f"{model_type}1"}))
+        self.job.metrics = Mock()
+        self.job.source_adapter = Mock()
+        self.job.target_adapter = Mock()
+        barrier = threading.Barrier(2, timeout=5)
+        tenant_pks = []
+
+        def sync_to(target, flags, diff):  # pylint: disable=unused-argument
+            (model_type,) = diff.groups()
+            barrier.wait()
+            tenant_pks.append(self.job.references.get_or_create(Tenant, "slug", "shared", defaults={"name": "Shared"}))
+            for i in range(50):
+                self.job._structlog_to_sync_log_entry(  # pylint: disable=protected-access
+                    None,
+                    "debug",
+                    {
+                        "src": "source",
+                        "dst": "target",
+                        "action": None,
+                        "model": "tenant",
+                        "unique_id": f"{model_type}{i}",
+                        "diffs": {},
+                        "status": SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                        "event": "No changes to apply; no action needed",
+                    },
+                )
+
+        self.job.source_adapter.sync_to.side_effect = sync_to
+        self.job._sync_model_types_concurrently()  # pylint: disable=protected-access
+        self.job.flush_sync_log()
+
+        self.assertEqual(Tenant.objects.filter(slug="shared").count(), 1)
+        self.assertEqual(tenant_pks, [Tenant.objects.get(slug="shared").pk] * 2)
+        self.assertEqual(1, SyncLogEntry.objects.count())
+        self.assertEqual({"tenant": 100}, self.job.sync.unchanged_counts)
+
+    def test_sync_model_types_concurrently_failure(self):
+        """Test that model types depending on one that failed to synchronize are skipped."""
+        with self.assertRaises(ValueError):
+            self._sync_concurrently({"site": ["region"]}, failing=["region"])
+        self.assertEqual(self.job.source_adapter.sync_to.call_count, 2)
+
+    def test_sync_model_types_concurrently_circular(self):
+        """Test that circular dependencies between model types are rejected before anything is synchronized."""
+        with self.assertRaises(ValueError):
+            self._sync_concurrently({"site": ["region"], "region": ["site"]})
+        self.job.source_adapter.sync_to.assert_not_called()
+
     def test_calculate_diff(self):
         """Test calculate_diff() method."""
         self.job.sync = Mock()
@@ -108,7 +426,8 @@ class BaseJobTestCase(TransactionTestCase):
         self.job.source_adapter.diff_to().dict.return_value = {}
         self.job.calculate_diff()
         self.job.source_adapter.diff_to.assert_called()
-        self.job.sync.save.assert_called_once()
+        self.job.sync.store_diff.assert_called_once()
+        self.job.sync.save.assert_not_called()
 
 
 class DataSourceTestCase(BaseJobTestCase):
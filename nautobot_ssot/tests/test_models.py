@@ -2,6 +2,7 @@
 
 from datetime import timedelta
 import time
+from types import SimpleNamespace
 import uuid
 
 from django.contrib.contenttypes.models import ContentType
@@ -11,7 +12,8 @@ from django.utils.timezone import now
 from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.models import Job, JobResult
 
-from nautobot_ssot.models import Sync
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.models import Sync, SyncLogEntry
 
 
 class SyncTestCase(TestCase):
@@ -82,3 +84,165 @@ class SyncTestCase(TestCase):
         # Source/target is Nautobot, so still None
         self.assertIsNone(self.target_sync.get_source_url())
         self.assertIsNone(self.source_sync.get_target_url())
+
+    def test_update_statistics(self):
+        """Test the update_statistics() method."""
+        entries = [
+            SyncLogEntry.objects.create(
+                sync=self.source_sync,
+                action=action,
+                status=status,
+            )
+            for action, status in (
+                (SyncLogEntryActionChoices.ACTION_CREATE, SyncLogEntryStatusChoices.STATUS_SUCCESS),
+                (SyncLogEntryActionChoices.ACTION_CREATE, SyncLogEntryStatusChoices.STATUS_ERROR),
+                (SyncLogEntryActionChoices.ACTION_NO_CHANGE, SyncLogEntryStatusChoices.STATUS_SUCCESS),
+            )
+        ]
+        self.source_sync.update_statistics(entries)
+        self.assertEqual(self.source_sync.num_created, 2)
+        self.assertEqual(self.source_sync.num_unchanged, 1)
+        self.assertEqual(self.source_sync.num_succeeded, 2)
+        self.assertEqual(self.source_sync.num_errored, 1)
+
+        # The database record is updated too
+        sync = Sync.annotated_queryset().get(pk=self.source_sync.pk)
+        self.assertEqual(sync.num_created, 2)
+        self.assertEqual(sync.num_updated, 0)
+        self.assertEqual(sync.num_unchanged, 1)
+        self.assertEqual(sync.num_succeeded, 2)
+        self.assertEqual(sync.num_errored, 1)
+
+    def test_store_and_get_diff(self):
+        """Test the store_diff(), get_diff() and get_diff_summary() methods."""
+        self.source_sync.store_diff(
+            [
+                ("region", "Americas", {"+": {"slug": "americas"}}),
+                ("region", "Europe", {"+": {"slug": "europe"}, "-": {"slug": "eu"}}),
+                ("site", "ams01", {"-": {"slug": "ams01"}}),
+            ],
+            batch_size=2,
+        )
+        self.assertEqual(self.source_sync.diff, {})
+        self.assertEqual(
+            self.source_sync.get_diff(),
+            {
+                "region": {
+                    "Americas": {"+": {"slug": "americas"}},
+                    "Europe": {"+": {"slug": "europe"}, "-": {"slug": "eu"}},
+                },
+                "site": {"ams01": {"-": {"slug": "ams01"}}},
+            },
+        )
+        self.assertEqual(self.source_sync.get_diff("site"), {"site": {"ams01": {"-": {"slug": "ams01"}}}})
+        self.assertEqual(self.source_sync.get_diff_summary(), {"region": 2, "site": 1})
+        self.assertEqual(
+            list(self.source_sync.diff_elements.values_list("action", flat=True)),
+            [
+                SyncLogEntryActionChoices.ACTION_CREATE,
+                SyncLogEntryActionChoices.ACTION_UPDATE,
+                SyncLogEntryActionChoices.ACTION_DELETE,
+            ],
+        )
+
+    def test_get_diff_legacy(self):
+        """Test that get_diff() and get_diff_summary() work for Syncs that stored their diff in a single field."""
+        self.target_sync.diff = {"site": {"ams01": {"-": {"slug": "ams01"}}}}
+        self.assertEqual(self.target_sync.get_diff(), self.target_sync.diff)
+        self.assertEqual(self.target_sync.get_diff("region"), {})
+        self.assertEqual(self.target_sync.get_diff_summary(), {"site": 1})
+
+    def test_get_diff_elements(self):
+        """Test the get_diff_elements() and get_diff_element() methods, for stored and legacy diffs alike."""
+        self.source_sync.store_diff(
+            [
+                ("region", "Americas", {"site": {"nyc01": {"+": {"slug": "nyc01"}}}}),
+                ("region", "Europe", {"+": {"slug": "europe"}, "-": {"slug": "eu"}}),
+            ]
+        )
+        self.target_sync.diff = self.source_sync.get_diff()
+        for sync in (self.source_sync, self.target_sync):
+            with self.subTest(legacy=bool(sync.diff)):
+                self.assertEqual([name for name, _ in sync.get_diff_elements("region")], ["Americas", "Europe"])
+                self.assertEqual(
+                    list(sync.get_diff_elements("region", changed_only=True)[:1]),
+                    [("Europe", {"+": {"slug": "europe"}, "-": {"slug": "eu"}})],
+                )
+                self.assertEqual(len(sync.get_diff_elements("site")), 0)
+                self.assertEqual(
+                    sync.get_diff_element("region", "Americas"), {"site": {"nyc01": {"+": {"slug": "nyc01"}}}}
+                )
+                self.assertIsNone(sync.get_diff_element("region", "Africa"))
+
+    def test_get_recent_history(self):
+        """Test that get_recent_history() gets the most recent Syncs of each Job in constant queries."""
+        jobs = [
+            SimpleNamespace(
+                class_path=f"plugins/nautobot_ssot.jobs.examples/{name}", data_source=source, data_target=target
+            )
+            for name, source, target in (
+                ("ExampleDataSource", "Some other system", "Nautobot"),
+                # Another Job with the same data source and target
+                ("OtherDataSource", "Some other system", "Nautobot"),
+                ("ExampleDataTarget", "Nautobot", "Another system"),
+                ("UnusedDataTarget", "Nautobot", "Unused system"),
+            )
+        ]
+        start_time = now()
+        syncs = [self.source_sync, self.target_sync]
+        for i in range(12):
+            syncs.append(
+                Sync.objects.create(
+                    source="Some other system",
+                    target="Nautobot",
+                    dry_run=False,
+                    start_time=start_time + timedelta(minutes=i),
+                    diff={},
+                )
+            )
+        for i, sync in enumerate(syncs):
+            sync.job_result = JobResult.objects.create(
+                name=jobs[1 if i == 13 else 2 if sync is self.target_sync else 0].class_path,
+                obj_type=ContentType.objects.get_for_model(Sync),
+                job_id=uuid.uuid4(),
+            )
+            sync.save()
+
+        with self.assertNumQueries(3):
+            history = Sync.get_recent_history(jobs)
+        recent, count = history[jobs[0].class_path]
+        self.assertEqual(count, 12)
+        # The Sync that hasn't started yet comes first
+        self.assertEqual(recent[0], self.source_sync)
+        self.assertEqual(
+            [sync.start_time for sync in recent[1:]], [start_time + timedelta(minutes=i) for i in range(10, 1, -1)]
+        )
+        self.assertEqual(history[jobs[1].class_path], ([syncs[13]], 1))
+        self.assertEqual(history[jobs[2].class_path], ([self.target_sync], 1))
+        self.assertEqual(history[jobs[3].class_path], ([], 0))
+        self.assertEqual(Sync.get_recent_history([]), {})
+
+
+class SyncLogEntryTestCase(TestCase):
+    """Tests for the SyncLogEntry model."""
+
+    def setUp(self):
+        """Per-test setup function."""
+        self.sync = Sync.objects.create(source="Some other system", target="Nautobot", dry_run=False, diff={})
+
+    def test_search_text(self):
+        """Test that the search text of a SyncLogEntry is maintained when it's saved."""
+        entry = SyncLogEntry.objects.create(
+            sync=self.sync,
+            action=SyncLogEntryActionChoices.ACTION_CREATE,
+            status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+            diff={"+": {"slug": "AMS01"}},
+            object_repr="Site AMS01",
+            message="Created",
+        )
+        self.assertEqual(entry.search_text, 'site ams01 created {"+": {"slug": "ams01"}}')
+        entry.message = "Updated"
+        entry.save()
+        self.assertEqual(
+            SyncLogEntry.objects.get(pk=entry.pk).search_text, 'site ams01 updated {"+": {"slug": "ams01"}}'
+        )
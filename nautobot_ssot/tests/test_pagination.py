@@ -0,0 +1,90 @@
+"""Test keyset pagination of sync log entries."""
+from datetime import datetime, timedelta
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from django.utils import timezone
+
+from nautobot.extras.models import Job, JobResult
+
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.models import Sync, SyncLogEntry
+from nautobot_ssot.pagination import KeysetPage, approximate_count, decode_cursor, encode_cursor
+
+
+class KeysetPageTestCase(TestCase):
+    """Test the KeysetPage class."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """One-time setup of test data for this class."""
+        job_result = JobResult.objects.create(
+            name="plugins/nautobot_ssot.jobs.examples/ExampleDataSource",
+            obj_type=ContentType.objects.get_for_model(Job),
+            data={},
+            job_id=uuid.uuid4(),
+        )
+        sync = Sync.objects.create(
+            source="Example Data Source",
+            target="Nautobot",
+            start_time=datetime.now(),
+            dry_run=False,
+            diff={},
+            job_result=job_result,
+        )
+        for i in range(0, 7):
+            SyncLogEntry.objects.create(
+                sync=sync,
+                action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                diff={},
+                synced_object=None,
+                object_repr=f"Placeholder {i}",
+                message="Log message",
+            )
+        # Give some entries the same timestamp, so that they are told apart by their primary key
+        now = timezone.now()
+        for i, entry in enumerate(SyncLogEntry.objects.all()):
+            SyncLogEntry.objects.filter(pk=entry.pk).update(timestamp=now - timedelta(seconds=i // 2))
+        cls.ordered_pks = list(SyncLogEntry.objects.order_by("-timestamp", "-pk").values_list("pk", flat=True))
+
+    def test_cursor_round_trip(self):
+        """A cursor decodes to the timestamp and primary key it was encoded from, and an invalid one to None."""
+        entry = SyncLogEntry.objects.first()
+        self.assertEqual(decode_cursor(encode_cursor(entry.timestamp, entry.pk)), (entry.timestamp, entry.pk))
+        self.assertIsNone(decode_cursor("not a cursor"))
+
+    def test_page_forward_and_back(self):
+        """Paging forward visits every entry once, newest first, and paging back returns to the same pages."""
+        queryset = SyncLogEntry.objects.all()
+        pages = [KeysetPage(queryset, 3)]
+        while pages[-1].has_next:
+            pages.append(KeysetPage(queryset, 3, after=pages[-1].next_cursor))
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual([pk for page in pages for pk in page.pks], self.ordered_pks)
+        self.assertFalse(pages[0].has_previous)
+        self.assertIsNone(pages[-1].next_cursor)
+
+        page = KeysetPage(queryset, 3, before=pages[2].previous_cursor)
+        self.assertEqual(page.pks, pages[1].pks)
+        self.assertTrue(page.has_previous)
+        self.assertTrue(page.has_next)
+        page = KeysetPage(queryset, 3, before=page.previous_cursor)
+        self.assertEqual(page.pks, pages[0].pks)
+        self.assertFalse(page.has_previous)
+
+    def test_short_page_back_to_start(self):
+        """Paging back past the newest entry shows the first page in full."""
+        queryset = SyncLogEntry.objects.all()
+        page = KeysetPage(queryset, 3, after=KeysetPage(queryset, 1).next_cursor)
+        self.assertEqual(page.pks, self.ordered_pks[1:4])
+        page = KeysetPage(queryset, 3, before=page.previous_cursor)
+        self.assertEqual(page.pks, self.ordered_pks[:3])
+        self.assertFalse(page.has_previous)
+
+    def test_approximate_count(self):
+        """Records are counted exactly up to the limit, and approximately beyond it."""
+        queryset = SyncLogEntry.objects.all()
+        self.assertEqual(approximate_count(queryset), (7, ""))
+        self.assertIn(approximate_count(queryset, limit=5)[1], ("about", "more than"))
@@ -0,0 +1,65 @@
+"""Test that the plugin's common queries are planned to use indexes rather than sequential scans."""
+import unittest
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+
+from nautobot.dcim.models import Site
+
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.models import Sync, SyncLogEntry
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "Query plans are only checked on PostgreSQL")
+class QueryPlanTestCase(TestCase):
+    """Test that the queries made by the plugin's views use indexes on a large number of records."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """One-time setup of test data for this class."""
+        cls.syncs = Sync.objects.bulk_create(
+            Sync(source=f"Source {i % 50}", target=f"Target {i % 40}", dry_run=False, diff={}) for i in range(2000)
+        )
+        actions = SyncLogEntryActionChoices.values()
+        statuses = SyncLogEntryStatusChoices.values()
+        cls.site_ct = ContentType.objects.get_for_model(Site)
+        SyncLogEntry.objects.bulk_create(
+            (
+                SyncLogEntry(
+                    sync=cls.syncs[i % 20],
+                    action=actions[i // 20 % len(actions)],
+                    status=statuses[i // 20 % len(statuses)],
+                    synced_object_type=cls.site_ct,
+                    synced_object_id=uuid.uuid4(),
+                    object_repr=f"Site {i}",
+                )
+                for i in range(50000)
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE nautobot_ssot_sync, nautobot_ssot_synclogentry")
+
+    def assertUsesIndex(self, queryset):  # pylint: disable=invalid-name
+        """Assert that the query plan of a queryset includes no sequential scans."""
+        plan = queryset.explain()
+        self.assertNotIn("Seq Scan", plan, f"{queryset.query}\n{plan}")
+
+    def test_sync_queries(self):
+        """Test the queries of Syncs of a given data source or target."""
+        self.assertUsesIndex(Sync.objects.filter(source="Source 1", target="Target 1").order_by("-start_time"))
+        self.assertUsesIndex(Sync.objects.filter(source="Source 1").order_by("-start_time")[:10])
+        self.assertUsesIndex(Sync.objects.filter(target="Target 1").order_by("-start_time")[:10])
+
+    def test_sync_log_entry_queries(self):
+        """Test the queries of SyncLogEntries of a given Sync, or for a given synced object."""
+        sync = self.syncs[0]
+        self.assertUsesIndex(SyncLogEntry.objects.filter(sync=sync, action=SyncLogEntryActionChoices.ACTION_CREATE))
+        self.assertUsesIndex(SyncLogEntry.objects.filter(sync=sync, status=SyncLogEntryStatusChoices.STATUS_ERROR))
+        self.assertUsesIndex(SyncLogEntry.objects.filter(sync=sync).order_by("-timestamp", "-pk")[:51])
+        self.assertUsesIndex(SyncLogEntry.objects.order_by("-timestamp", "-pk")[:51])
+        self.assertUsesIndex(
+            SyncLogEntry.objects.filter(synced_object_type=self.site_ct, synced_object_id=uuid.uuid4())
+        )
@@ -0,0 +1,52 @@
+"""Test the ReferenceCache class."""
+from django.test import TestCase
+
+from nautobot.tenancy.models import Tenant
+
+from nautobot_ssot.references import ReferenceCache
+
+
+class ReferenceCacheTestCase(TestCase):
+    """Test the ReferenceCache class."""
+
+    def setUp(self):
+        """Per-test setup."""
+        self.cache = ReferenceCache()
+        self.tenant = Tenant.objects.create(name="Tenant 1", slug="tenant-1")
+
+    def test_get_memoized(self):
+        """Each distinct value is only looked up once."""
+        with self.assertNumQueries(1):
+            self.assertEqual(self.cache.get(Tenant, "slug", "tenant-1"), self.tenant.pk)
+            self.assertEqual(self.cache.get(Tenant, "slug", "tenant-1"), self.tenant.pk)
+        with self.assertRaises(Tenant.DoesNotExist):
+            self.cache.get(Tenant, "slug", "tenant-2")
+
+    def test_preload(self):
+        """Preloaded values are looked up with no further queries."""
+        Tenant.objects.create(name="Tenant 2", slug="tenant-2")
+        self.cache.preload(Tenant, "name")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.cache.get(Tenant, "name", "Tenant 1"), self.tenant.pk)
+            self.assertIsNotNone(self.cache.get(Tenant, "name", "Tenant 2"))
+            with self.assertRaises(Tenant.DoesNotExist):
+                self.cache.get(Tenant, "name", "Tenant 3")
+
+    def test_add_and_remove(self):
+        """Objects added to the cache are found, even if not yet saved, until they are removed."""
+        self.cache.preload(Tenant, "slug")
+        tenant = Tenant(name="Tenant 2", slug="tenant-2")
+        self.cache.add(tenant)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.cache.get(Tenant, "slug", "tenant-2"), tenant.pk)
+            self.assertEqual(self.cache.get(Tenant, "name", "Tenant 2"), tenant.pk)
+        self.cache.remove(tenant)
+        with self.assertRaises(Tenant.DoesNotExist):
+            self.cache.get(Tenant, "slug", "tenant-2")
+
+    def test_get_or_create(self):
+        """Missing objects are created and cached."""
+        pk = self.cache.get_or_create(Tenant, "slug", "tenant-2", defaults={"name": "Tenant 2"})
+        self.assertEqual(Tenant.objects.get(slug="tenant-2").pk, pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.cache.get(Tenant, "slug", "tenant-2"), pk)
@@ -1,6 +1,6 @@
 """Test Render_diff templatetags."""
 import unittest
-from nautobot_ssot.templatetags.render_diff import render_diff
+from nautobot_ssot.templatetags.render_diff import render_diff, render_diff_element
 
 
 test_params = [
@@ -62,3 +62,21 @@ class TestRenderDiff(unittest.TestCase):
         for input_dict, rendered_diff in test_params:
             with self.subTest():
                 self.assertEqual(render_diff(input_dict), rendered_diff)
+
+    def test_render_diff_does_not_modify_diff(self):
+        """Testing that rendering leaves the diff unchanged, so that it can be rendered again."""
+        diff = {"region": {"Europe": {"+": {"slug": "europe"}, "site": {"ams01": {"-": {"slug": "ams01"}}}}}}
+        rendered_diff = render_diff(diff)
+        self.assertEqual(
+            diff, {"region": {"Europe": {"+": {"slug": "europe"}, "site": {"ams01": {"-": {"slug": "ams01"}}}}}}
+        )
+        self.assertEqual(render_diff(diff), rendered_diff)
+
+    def test_render_diff_element_with_children_url(self):
+        """Testing that the children of an element are replaced by a link to load them, if given."""
+        diff = {"+": {"slug": "europe"}, "site": {"ams01": {"-": {}}, "ber01": {"-": {}}}}
+        self.assertEqual(
+            render_diff_element("Europe", diff, "/children/?a=1&b=2"),
+            '<li class="diff-added">Europe<ul><li class="diff-added">slug: europe</li>'
+            '<li class="diff-fragment"><a class="diff-load" href="/children/?a=1&amp;b=2">2 site</a></li></ul></li>',
+        )
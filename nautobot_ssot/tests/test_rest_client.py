@@ -0,0 +1,247 @@
+"""Test the RestClient class against a local stand-in for a paginated REST API."""
+import json
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+import requests
+
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from nautobot_ssot.rest_client import RateLimiter, RestBulkWriter, RestConcurrentWriter
+from nautobot_ssot.tests.stand_in_api import StandInAPIMixin
+
+
+class RestClientTestCase(StandInAPIMixin, unittest.TestCase):
+    """Test the RestClient class."""
+
+    def test_get_all(self):
+        """All pages are fetched, and their records returned in order."""
+        self.assertEqual(self.client.get_all("api/dcim/sites/", {"q": "x"}), self.server.records)
+        self.assertEqual(len(self.server.requests), 10)
+        self.assertTrue(all("q=x" in path for path in self.server.requests))
+
+    def test_get_all_capped_page_size(self):
+        """If the API returns smaller pages than were requested, pages are fetched at the smaller size."""
+        self.server.max_page_size = 7
+        self.assertEqual(self.client.get_all("api/dcim/sites/"), self.server.records)
+        self.assertEqual(len(self.server.requests), 14)
+
+    def test_get_all_single_page(self):
+        """If all records fit on the first page, no further pages are fetched."""
+        self.server.records = self.server.records[:5]
+        self.assertEqual(self.client.get_all("api/dcim/sites/"), self.server.records)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_retry(self):
+        """Requests failing with a transient error are retried."""
+        self.server.failures = 2
+        self.assertEqual(self.client.get("api/dcim/sites/")["count"], 95)
+        self.assertEqual(len(self.server.requests), 3)
+
+
+def _response(status, body):
+    """Build a requests.Response with the given status code and JSON body."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()  # pylint: disable=protected-access
+    return response
+
+
+class StandInBulkAPI:  # pylint: disable=too-few-public-methods
+    """Stand-in for RestClient.request() against Nautobot's bulk endpoints, rejecting items named in `invalid`."""
+
+    def __init__(self, invalid=()):
+        """Create a stand-in API that rejects the items with the given names."""
+        self.invalid = set(invalid)
+        self.requests = []
+        self.next_id = 0
+
+    def request(self, method, path, json=None):  # pylint: disable=redefined-outer-name
+        """Record the request, and fail it with per-item errors if any of its items is invalid."""
+        self.requests.append((method, path, [item.get("name", item.get("id")) for item in json]))
+        errors = [{"name": ["Invalid."]} if item.get("name") in self.invalid else {} for item in json]
+        if any(errors):
+            response = _response(400, errors)
+            raise requests.HTTPError(response=response)
+        results = []
+        for item in json:
+            self.next_id += 1
+            results.append({**item, "id": self.next_id})
+        return _response(201 if method == "POST" else 200, results)
+
+
+class RestBulkWriterTestCase(unittest.TestCase):
+    """Test the RestBulkWriter class."""
+
+    def setUp(self):
+        """Create a writer with a stand-in client and Job."""
+        self.api = StandInBulkAPI()
+        self.job = Mock()
+        self.writer = RestBulkWriter(Mock(request=self.api.request), job=self.job, batch_size=3)
+
+    def test_batches(self):
+        """Changes are sent in batches, one request per endpoint and action, with deletes in reverse order."""
+        self.writer.create("api/dcim/regions/", {"name": "r1"})
+        self.writer.update("api/dcim/sites/", 7, {"description": "x"})
+        self.writer.delete("api/dcim/regions/", 8)
+        self.assertEqual(len(self.writer), 0)  # automatically flushed once 3 changes were queued
+        for name in ("r2", "r3", "r4", "r5"):
+            self.writer.create("api/dcim/regions/", {"name": name})
+        self.writer.flush()
+        self.assertEqual(
+            self.api.requests,
+            [
+                ("POST", "api/dcim/regions/", ["r1"]),
+                ("PATCH", "api/dcim/sites/", ["7"]),
+                ("DELETE", "api/dcim/regions/", ["8"]),
+                ("POST", "api/dcim/regions/", ["r2", "r3", "r4"]),
+                ("POST", "api/dcim/regions/", ["r5"]),
+            ],
+        )
+        self.assertEqual(self.writer.failures, [])
+        self.job.sync_log_failure.assert_not_called()
+
+    def test_created_pk(self):
+        """The pk of each created record is set to the id of the new object."""
+        record = Mock(pk=None)
+        self.writer.create("api/dcim/regions/", {"name": "r1"}, record)
+        self.writer.flush()
+        self.assertEqual(record.pk, 1)
+
+    def test_per_item_errors(self):
+        """Only the items of a batch rejected with per-item errors fail, and are reported to the Job."""
+        self.api.invalid = {"bad"}
+        self.writer.create("api/dcim/regions/", {"name": "r1"}, "Region r1")
+        self.writer.create("api/dcim/regions/", {"name": "bad"}, "Region bad")
+        self.writer.flush()
+        self.assertEqual(
+            self.api.requests,
+            [
+                ("POST", "api/dcim/regions/", ["r1", "bad"]),
+                ("POST", "api/dcim/regions/", ["r1"]),
+                ("POST", "api/dcim/regions/", ["bad"]),
+            ],
+        )
+        self.assertEqual(len(self.writer.failures), 1)
+        kwargs = self.job.sync_log_failure.call_args[1]
+        self.assertEqual(kwargs["action"], SyncLogEntryActionChoices.ACTION_CREATE)
+        self.assertEqual(kwargs["status"], SyncLogEntryStatusChoices.STATUS_ERROR)
+        self.assertEqual(kwargs["object_repr"], "'Region bad'")
+        self.assertEqual(kwargs["record"], "Region bad")
+
+    def test_retry_while_progressing(self):
+        """Items failing, for example, for lack of a parent created in the same batch, are retried."""
+        self.api.invalid = {"child"}
+        original_request = self.api.request
+
+        def request(method, path, json=None):  # pylint: disable=redefined-outer-name
+            try:
+                return original_request(method, path, json=json)
+            finally:
+                if ["parent"] == [item["name"] for item in json]:
+                    self.api.invalid.clear()
+
+        self.writer.client.request = request
+        self.writer.create("api/dcim/regions/", {"name": "child"})
+        self.writer.create("api/dcim/regions/", {"name": "parent"})
+        self.writer.flush()
+        self.assertEqual(self.writer.failures, [])
+        self.assertEqual(self.api.requests[-1], ("POST", "api/dcim/regions/", ["child"]))
+
+    def test_unattributable_error(self):
+        """If a batch fails without per-item errors, each of its items is sent individually."""
+        error = requests.HTTPError(response=_response(500, {"detail": "Server error"}))
+        self.writer.client.request = Mock(side_effect=error)
+        self.writer.delete("api/dcim/sites/", 1)
+        self.writer.delete("api/dcim/sites/", 2)
+        self.writer.flush()
+        self.assertEqual(self.writer.client.request.call_count, 3)
+        self.assertEqual(len(self.writer.failures), 2)
+        self.assertEqual(self.job.sync_log_failure.call_count, 2)
+
+    def test_connection_error(self):
+        """If a batch cannot be sent at all, all of its items fail."""
+        self.writer.client.request = Mock(side_effect=requests.ConnectionError("Unreachable"))
+        self.writer.delete("api/dcim/sites/", 1)
+        self.writer.delete("api/dcim/sites/", 2)
+        self.writer.flush()
+        self.assertEqual(self.writer.client.request.call_count, 1)
+        self.assertEqual(len(self.writer.failures), 2)
+
+
+class RestConcurrentWriterTestCase(unittest.TestCase):
+    """Test the RestConcurrentWriter class."""
+
+    def setUp(self):
+        """Create a writer with a stand-in client, which takes a little while to respond to each request."""
+        self.lock = threading.Lock()
+        self.requests = []
+        self.in_progress = 0
+        self.max_in_progress = 0
+        self.job = Mock()
+        self.writer = RestConcurrentWriter(
+            Mock(request=self.request, max_workers=4), job=self.job, batch_size=100, max_workers=4
+        )
+
+    def request(self, method, path, json=None):  # pylint: disable=redefined-outer-name
+        """Record the request and its concurrency, and fail it if its name is "bad"."""
+        with self.lock:
+            self.in_progress += 1
+            self.max_in_progress = max(self.max_in_progress, self.in_progress)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_progress -= 1
+            self.requests.append((method, path, (json or {}).get("name")))
+        if json and json.get("name") == "bad":
+            raise requests.HTTPError(response=_response(400, {"name": ["Invalid."]}))
+        return _response(201, {**(json or {}), "id": len(self.requests)})
+
+    def test_concurrency(self):
+        """Independent changes are sent concurrently, up to max_workers at once."""
+        for i in range(12):
+            self.writer.create("api/dcim/sites/", {"name": f"site{i}"})
+        self.writer.flush()
+        self.assertEqual(len(self.requests), 12)
+        self.assertEqual(self.max_in_progress, 4)
+        self.assertEqual(self.writer.failures, [])
+
+    def test_dependencies(self):
+        """Changes are only sent once the changes they depend on have completed."""
+        self.writer.delete("api/dcim/regions/", 1, key="region-old", depends_on=["site-old"])
+        self.writer.create("api/dcim/sites/", {"name": "site"}, key="site", depends_on=["region"])
+        self.writer.create("api/dcim/regions/", {"name": "region"}, key="region", depends_on=["parent"])
+        self.writer.create("api/dcim/regions/", {"name": "parent"}, key="parent", depends_on=["unknown"])
+        self.writer.delete("api/dcim/sites/", 2, key="site-old")
+        self.writer.flush()
+        order = [path if name is None else name for _, path, name in self.requests]
+        self.assertLess(order.index("parent"), order.index("region"))
+        self.assertLess(order.index("region"), order.index("site"))
+        self.assertLess(order.index("api/dcim/sites/2/"), order.index("api/dcim/regions/1/"))
+
+    def test_circular_dependencies(self):
+        """Changes with circular dependencies are still sent."""
+        self.writer.create("api/dcim/regions/", {"name": "a"}, key="a", depends_on=["b"])
+        self.writer.create("api/dcim/regions/", {"name": "b"}, key="b", depends_on=["a"])
+        self.writer.flush()
+        self.assertEqual(len(self.requests), 2)
+
+    def test_failures_and_pk(self):
+        """Failed changes are reported to the Job, and created records get the id of the new object."""
+        record = Mock(pk=None)
+        self.writer.create("api/dcim/sites/", {"name": "good"}, record)
+        self.writer.create("api/dcim/sites/", {"name": "bad"}, "Site bad")
+        self.writer.flush()
+        self.assertIsNotNone(record.pk)
+        self.assertEqual(len(self.writer.failures), 1)
+        self.assertEqual(self.job.sync_log_failure.call_args[1]["object_repr"], "'Site bad'")
+        self.assertEqual(self.job.sync_log_failure.call_args[1]["record"], "Site bad")
+
+    def test_rate_limit(self):
+        """Requests are spaced out to the given rate limit."""
+        self.writer.rate_limiter = RateLimiter(100)
+        start = time.monotonic()
+        for i in range(6):
+            self.writer.create("api/dcim/sites/", {"name": f"site{i}"})
+        self.writer.flush()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
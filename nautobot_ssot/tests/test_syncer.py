@@ -0,0 +1,111 @@
+"""Test the BatchedTransactionSyncer class."""
+from unittest.mock import Mock
+
+from django.test import TestCase
+
+from diffsync import DiffSync, DiffSyncModel
+from diffsync.enum import DiffSyncFlags
+from nautobot.dcim.models import Region
+
+from nautobot_ssot.syncer import BatchedTransactionSyncer
+
+
+class RegionModel(DiffSyncModel):
+    """Test model creating Regions, and failing to create the region named "broken"."""
+
+    _modelname = "region"
+    _identifiers = ("name",)
+    _attributes = ("slug",)
+
+    name: str
+    slug: str
+
+    @classmethod
+    def create(cls, diffsync, ids, attrs):
+        """Create the Region."""
+        if ids["name"] == "broken":
+            raise RuntimeError("Broken")
+        Region.objects.create(name=ids["name"], slug=attrs["slug"])
+        return super().create(diffsync, ids=ids, attrs=attrs)
+
+
+class RegionAdapter(DiffSync):
+    """Test adapter."""
+
+    region = RegionModel
+    top_level = ["region"]
+
+
+class BatchedTransactionSyncerTestCase(TestCase):
+    """Test the BatchedTransactionSyncer class."""
+
+    def sync(self, regions, flags=DiffSyncFlags.CONTINUE_ON_FAILURE, **kwargs):
+        """Sync the given regions (name, slug) into an empty target in transactions of 3 changes."""
+        source = RegionAdapter()
+        for name, slug in regions:
+            source.add(RegionModel(name=name, slug=slug))
+        target = RegionAdapter()
+        target.sync_complete = Mock()
+        self.on_commit = Mock()  # pylint: disable=attribute-defined-outside-init
+        self.syncer = BatchedTransactionSyncer(  # pylint: disable=attribute-defined-outside-init
+            diff=target.diff_from(source),
+            src_diffsync=source,
+            dst_diffsync=target,
+            flags=flags,
+            batch_size=3,
+            on_commit=self.on_commit,
+            **kwargs,
+        )
+        return self.syncer.perform_sync()
+
+    def test_batches(self):
+        """Changes are committed in batches, with sync_complete() and before_commit as part of each transaction."""
+        calls = []
+
+        def before_commit():
+            """Record whether sync_complete() has been called by the end of each transaction."""
+            calls.append((self.on_commit.call_count, self.syncer.dst_diffsync.sync_complete.called))
+
+        self.assertTrue(self.sync([(f"r{i}", f"r{i}") for i in range(4)], before_commit=before_commit))
+        self.assertEqual(Region.objects.filter(name__startswith="r").count(), 4)
+        self.assertEqual(calls, [(0, False), (1, True)])
+        self.syncer.dst_diffsync.sync_complete.assert_called_once()
+        self.assertEqual(self.on_commit.call_count, 2)
+
+    def test_savepoints(self):
+        """With savepoints, a database error only affects the change that caused it."""
+        Region.objects.create(name="Existing", slug="duplicate")
+        self.assertTrue(self.sync([(f"r{i}", f"r{i}") for i in range(4)] + [("d", "duplicate")], savepoints=True))
+        self.assertEqual(Region.objects.filter(name__startswith="r").count(), 4)
+        self.assertFalse(Region.objects.filter(name="d").exists())
+        self.assertEqual(self.on_commit.call_count, 2)
+
+    def test_database_error_raised(self):
+        """Without CONTINUE_ON_FAILURE, a database error is raised, rolling back its transaction."""
+        Region.objects.create(name="Existing", slug="duplicate")
+        with self.assertRaises(Exception):
+            self.sync([("a", "a"), ("d", "duplicate")], flags=DiffSyncFlags.NONE)
+        self.assertFalse(Region.objects.filter(name="a").exists())
+        self.assertEqual(self.syncer.rolled_back, 1)
+        self.on_commit.assert_not_called()
+
+    def test_before_commit_error(self):
+        """An exception raised by before_commit rolls back the transaction it was called for."""
+        before_commit = Mock(side_effect=[None, RuntimeError("Flush failed")])
+        with self.assertRaises(RuntimeError):
+            self.sync([("a", "a"), ("b", "b"), ("c", "c"), ("d", "d")], before_commit=before_commit)
+        self.assertEqual(Region.objects.filter(name__in=["a", "b", "c"]).count(), 3)
+        self.assertFalse(Region.objects.filter(name="d").exists())
+        self.assertEqual(self.syncer.rolled_back_changes, [("region", "d", "create")])
+        self.assertEqual(self.on_commit.call_count, 1)
+
+    def test_rollback(self):
+        """An exception rolls back the changes made in its transaction only."""
+        with self.assertRaises(RuntimeError):
+            self.sync([("a", "a"), ("b", "b"), ("c", "c"), ("d", "d"), ("broken", "broken")])
+        self.assertEqual(Region.objects.filter(name__in=["a", "b", "c"]).count(), 3)
+        self.assertFalse(Region.objects.filter(name="d").exists())
+        self.assertEqual(self.syncer.rolled_back, 1)
+        # The rolled-back change had been logged as successful, so is reported for its log entry to be corrected
+        self.assertEqual(self.syncer.rolled_back_changes, [("region", "d", "create")])
+        self.assertEqual(self.on_commit.call_count, 1)
@@ -1,6 +1,8 @@
 """View test cases for nautobot_ssot."""
 
 from datetime import datetime
+import html
+import re
 import uuid
 
 from django.contrib.contenttypes.models import ContentType
@@ -105,6 +107,43 @@ class SyncViewsTestCase(  # pylint: disable=too-many-ancestors
             200,
         )
 
+    def test_sync_diff_view(self):
+        """Test the SyncDiffView, which renders pages of a Sync's diff and the children of its elements."""
+        obj_perm = ObjectPermission(name="Test permission", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+        sync = Sync.objects.first()
+        sync.store_diff(
+            [
+                ("region", "Americas", {"region": {"North America": {"+": {"slug": "north-america"}}}}),
+                ("region", "Europe", {"+": {"slug": "europe"}, "-": {"slug": "eu"}}),
+                ("region", "Asia", {"+": {"slug": "asia"}}),
+            ]
+        )
+        url = reverse("plugins:nautobot_ssot:sync_diff", kwargs={"pk": sync.pk})
+
+        response = self.client.get(f"{url}?model_type=region&per_page=2")
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([name for name, _, _ in response.context["elements"]], ["Americas", "Europe"])
+        self.assertNotIn("north-america", response.content.decode())
+        # The fragment is loaded into the Sync's detail view, so the link to the next page must be absolute
+        next_url = html.unescape(
+            re.search(r'href="([^"]+)"><i class="mdi mdi-chevron-double-right">', response.content.decode()).group(1)
+        )
+        self.assertTrue(next_url.startswith(f"{url}?"))
+        response = self.client.get(next_url)
+        self.assertEqual([name for name, _, _ in response.context["elements"]], ["Asia"])
+        self.assertIsNone(response.context["next_url"])
+        response = self.client.get(f"{url}?model_type=region&changed_only=true")
+        self.assertEqual([name for name, _, _ in response.context["elements"]], ["Europe", "Asia"])
+
+        response = self.client.get(f"{url}?model_type=region&element=Americas")
+        self.assertHttpStatus(response, 200)
+        self.assertIn("north-america", response.content.decode())
+        with disable_warnings("django.request"):
+            self.assertHttpStatus(self.client.get(f"{url}?model_type=region&element=Africa"), 404)
+
     def test_has_advanced_tab(self):
         pass
 
@@ -145,3 +184,20 @@ class SyncLogEntryViewsTestCase(ViewTestCases.ListObjectsViewTestCase):  # pylin
 
     def test_has_advanced_tab(self):
         pass
+
+    def test_list_objects_keyset_pagination(self):
+        """Test paging through the SyncLogEntryListView by keyset."""
+        self.user.is_superuser = True
+        self.user.save()
+        url = reverse("plugins:nautobot_ssot:synclogentry_list")
+        response = self.client.get(f"{url}?per_page=2")
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(response.context["keyset_page"]), 2)
+        self.assertEqual(len(response.context["table"].paginated_rows), 2)
+        self.assertEqual(response.context["count"], 3)
+        self.assertContains(response, "Showing 2 of 3")
+        self.assertNotContains(response, "Showing 1-2")
+        response = self.client.get(f"{url}?per_page=2&after={response.context['keyset_page'].next_cursor}")
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(response.context["keyset_page"]), 1)
+        self.assertFalse(response.context["keyset_page"].has_next)
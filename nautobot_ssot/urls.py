@@ -11,6 +11,7 @@ urlpatterns = [
     path("history/", views.SyncListView.as_view(), name="sync_list"),
     path("history/delete/", views.SyncBulkDeleteView.as_view(), name="sync_bulk_delete"),
     path("history/<uuid:pk>/", views.SyncView.as_view(), name="sync"),
+    path("history/<uuid:pk>/diff/", views.SyncDiffView.as_view(), name="sync_diff"),
     path("history/<uuid:pk>/delete/", views.SyncDeleteView.as_view(), name="sync_delete"),
     path("history/<uuid:pk>/jobresult/", views.SyncJobResultView.as_view(), name="sync_jobresult"),
     path("history/<uuid:pk>/logs/", views.SyncLogEntriesView.as_view(), name="sync_logentries"),
@@ -1,30 +1,32 @@
 """Django views for Single Source of Truth (SSoT)."""
 
-import pprint
-
-from django.contrib.contenttypes.models import ContentType
-from django.http import Http404
+from django.conf import settings
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
+from django.utils.http import urlencode
 from django.views.generic import View
 
 from django_tables2 import RequestConfig
 
 from nautobot.extras.jobs import get_job
 from nautobot.core.views.generic import BulkDeleteView, ObjectDeleteView, ObjectListView, ObjectView
-from nautobot.utilities.paginator import EnhancedPaginator
+from nautobot.utilities.paginator import EnhancedPaginator, get_paginate_count
 from nautobot.utilities.views import ContentTypePermissionRequiredMixin
 
+from .diff_cache import get_or_render_diff
 from .filters import SyncFilterSet, SyncLogEntryFilterSet
 from .forms import SyncFilterForm, SyncLogEntryFilterForm
 from .jobs import get_data_jobs, DataSource, DataTarget
 from .models import Sync, SyncLogEntry
+from .pagination import KeysetPage, KeysetTablePage, approximate_count
 from .tables import DashboardTable, SyncTable, SyncTableSingleSourceOrTarget, SyncLogEntryTable
 
 
 class DashboardView(ObjectListView):
     """Dashboard / overview of SSoT."""
 
-    queryset = Sync.objects.all()
+    queryset = Sync.annotated_queryset()
     table = DashboardTable
     action_buttons = []
     template_name = "nautobot_ssot/dashboard.html"
@@ -41,27 +43,13 @@ class DashboardView(ObjectListView):
                 "per_page": 10,
             },
         ).configure(table)
-        context = {
+        return {
             "queryset": self.queryset,
             "data_sources": data_sources,
             "data_targets": data_targets,
-            "source": {},
-            "target": {},
+            "history": Sync.get_recent_history([*data_sources, *data_targets]),
             "table": table,
         }
-        sync_ct = ContentType.objects.get_for_model(Sync)
-        for source in context["data_sources"]:
-            context["source"][source.name] = self.queryset.filter(
-                job_result__obj_type=sync_ct,
-                job_result__name=source.class_path,
-            )
-        for target in context["data_targets"]:
-            context["target"][target.name] = self.queryset.filter(
-                job_result__obj_type=sync_ct,
-                job_result__name=target.class_path,
-            )
-
-        return context
 
 
 class DataSourceTargetView(ContentTypePermissionRequiredMixin, View):
@@ -134,7 +122,72 @@ class SyncView(ObjectView):
     def get_extra_context(self, request, instance):
         """Add additional context to the view."""
         return {
-            "diff": pprint.pformat(instance.diff, width=180, compact=True),
+            "diff_summary": instance.get_diff_summary(),
+        }
+
+
+class SyncDiffView(ObjectView):
+    """View rendering part of the diff of a single Sync record, as an HTML fragment to load into its detail view.
+
+    Given a `model_type`, a page of the top-level diff elements of that type is rendered (optionally only those with
+    changes of their own, if `changed_only` is set), with the children of each element left to be loaded separately;
+    given an `element` name too, the children of that element are rendered.
+    """
+
+    queryset = Sync.objects.select_related("job_result")
+    template_name = "nautobot_ssot/inc/sync_diff.html"
+
+    def get(self, request, *args, **kwargs):
+        """Render the requested part of the diff, unless it's been rendered and cached already."""
+        instance = get_object_or_404(self.queryset, **kwargs)
+        if "element" in request.GET:
+            subtree = {"model_type": request.GET.get("model_type"), "element": request.GET["element"]}
+        else:
+            subtree = {
+                "model_type": request.GET.get("model_type"),
+                "changed_only": bool(request.GET.get("changed_only")),
+                "page": request.GET.get("page", 1),
+                "per_page": get_paginate_count(request),
+            }
+        return HttpResponse(
+            get_or_render_diff(
+                instance, urlencode(subtree), lambda: super(SyncDiffView, self).get(request, *args, **kwargs).content
+            )
+        )
+
+    def get_extra_context(self, request, instance):
+        """Add the requested part of the diff to the context."""
+        model_type = request.GET.get("model_type")
+        if not model_type:
+            raise Http404
+        base_url = reverse("plugins:nautobot_ssot:sync_diff", kwargs={"pk": instance.pk})
+
+        name = request.GET.get("element")
+        if name is not None:
+            diff = instance.get_diff_element(model_type, name)
+            if diff is None:
+                raise Http404
+            return {"children": {key: value for key, value in diff.items() if key not in ("+", "-")}}
+
+        elements = instance.get_diff_elements(model_type, changed_only=bool(request.GET.get("changed_only")))
+        paginator = EnhancedPaginator(elements, get_paginate_count(request))
+        page = paginator.get_page(request.GET.get("page"))
+
+        def page_url(number):
+            # The fragment is loaded into the Sync's detail view, so links to other pages can't be relative to it
+            query = {"model_type": model_type, "page": number, "per_page": paginator.per_page}
+            if request.GET.get("changed_only"):
+                query["changed_only"] = "true"
+            return f"{base_url}?{urlencode(query)}"
+
+        return {
+            "page": page,
+            "previous_url": page_url(page.previous_page_number()) if page.has_previous() else None,
+            "next_url": page_url(page.next_page_number()) if page.has_next() else None,
+            "elements": [
+                (name, diff, f"{base_url}?{urlencode({'model_type': model_type, 'element': name})}")
+                for name, diff in page.object_list
+            ],
         }
 
 
@@ -151,7 +204,59 @@ class SyncJobResultView(ObjectView):
         }
 
 
-class SyncLogEntriesView(ObjectListView):
+class SyncLogEntryKeysetPaginationMixin:
+    """Mixin for ObjectListViews of SyncLogEntry records, to paginate them by keyset rather than by page number.
+
+    Pages are stepped through, newest first, with `after` and `before` cursors (see `nautobot_ssot.pagination`).
+    The table is only given the records of the current page, so that it doesn't count or offset into the rest, and the
+    total number of records is counted separately, approximately if the `approximate_log_counts` setting is enabled.
+    The links between pages are rendered below the table through the generic list template's `table_template`.
+    When the table is sorted by a column, numbered pages are used instead.
+    """
+
+    # ObjectListView only has non_filter_params from Nautobot 1.4, which filters out any other query parameters
+    non_filter_params = (*getattr(ObjectListView, "non_filter_params", ()), "after", "before")
+    keyset_page = None
+    count = None
+    count_qualifier = ""
+
+    def alter_queryset(self, request):
+        """Limit the queryset to the records of the requested keyset page."""
+        queryset = super().alter_queryset(request)
+        if request.GET.get("sort"):
+            return queryset
+        if settings.PLUGINS_CONFIG["nautobot_ssot"]["approximate_log_counts"]:
+            self.count, self.count_qualifier = approximate_count(queryset)
+        else:
+            self.count = queryset.count()
+        self.keyset_page = KeysetPage(
+            queryset,
+            get_paginate_count(request),
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+        )
+        return queryset.filter(pk__in=self.keyset_page.pks).order_by("-timestamp", "-pk")
+
+    def extra_context(self):
+        """Add the keyset page, if any, and a table of only its records, not paginated by number, to the context."""
+        context = super().extra_context()
+        if self.keyset_page is not None:
+            table = self.table(self.queryset, user=self.request.user)
+            RequestConfig(self.request, paginate=False).configure(table)
+            table.page = KeysetTablePage(table.rows, self.keyset_page.per_page)
+            context.update(
+                {
+                    "table": table,
+                    "table_template": "nautobot_ssot/inc/keyset_table.html",
+                    "keyset_page": self.keyset_page,
+                    "count": self.count,
+                    "count_qualifier": self.count_qualifier,
+                }
+            )
+        return context
+
+
+class SyncLogEntriesView(SyncLogEntryKeysetPaginationMixin, ObjectListView):
     """View for SyncLogEntries associated with a given Sync."""
 
     queryset = SyncLogEntry.objects.all()
@@ -170,10 +275,10 @@ class SyncLogEntriesView(ObjectListView):
 
     def extra_context(self):
         """Add additional context to the view."""
-        return {"active_tab": "logentries", "object": self.instance}
+        return {**super().extra_context(), "active_tab": "logentries", "object": self.instance}
 
 
-class SyncLogEntryListView(ObjectListView):
+class SyncLogEntryListView(SyncLogEntryKeysetPaginationMixin, ObjectListView):
     """View for listing SyncLogEntry records."""
 
     queryset = SyncLogEntry.objects.all()